@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: lexicon_core.frontmatter against the line-split/partition parser it replaced.
+
+Parses the frontmatter of every Markdown file in a synthetic vault (generated under .tmp/bench/
+like run_benchmarks.py) with both parsers, checks the results are identical, and reports
+best-of-N times for parsing in-memory text and for read + parse from disk (8 KB head read vs
+reading up to the closing fence).
+
+Usage:
+  python benchmarks/bench_frontmatter.py
+  python benchmarks/bench_frontmatter.py --size 10000 --repeat 7 --json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.abspath(os.path.join(BENCH_DIR, ".."))
+sys.path.insert(0, os.path.join(REPO_ROOT, "scripts"))
+sys.path.insert(0, BENCH_DIR)
+
+import generate_vault  # noqa: E402
+from lexicon_core.frontmatter import parse_frontmatter, read_frontmatter  # noqa: E402
+
+LEGACY_RE = re.compile(r"^---\s*\r?\n(.*?)\r?\n---", re.DOTALL)
+LEGACY_HEAD = 8192
+
+
+def legacy_parse(content: str) -> dict:
+    """The parser previously copied into triage_queue / vault_index, kept verbatim as a baseline."""
+    m = LEGACY_RE.match(content)
+    if not m:
+        return {}
+    result: dict = {}
+    current_key = None
+    list_items: list[str] = []
+
+    for line in m.group(1).split("\n"):
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        if stripped.startswith("- "):
+            if current_key:
+                list_items.append(stripped[2:].strip().strip('"').strip("'"))
+            continue
+        if list_items and current_key:
+            result[current_key] = list_items
+            list_items = []
+        if ":" in stripped:
+            key, _, val = stripped.partition(":")
+            key = key.strip()
+            val = val.strip().strip('"').strip("'")
+            current_key = key
+            if val and val not in ("|", ">", "'"):
+                if val.startswith("[") and val.endswith("]"):
+                    inner = val[1:-1].strip()
+                    result[key] = (
+                        [v.strip().strip('"').strip("'") for v in inner.split(",") if v.strip()]
+                        if inner
+                        else []
+                    )
+                else:
+                    result[key] = val
+            elif val in ("", "|"):
+                list_items = []
+
+    if list_items and current_key:
+        result[current_key] = list_items
+    return result
+
+
+def legacy_read(path: str) -> dict:
+    with open(path, encoding="utf-8", errors="replace") as f:
+        return legacy_parse(f.read(LEGACY_HEAD))
+
+
+def best_of(fn, repeat: int) -> float:
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - start)
+    return min(runs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Frontmatter parser micro-benchmark")
+    parser.add_argument("--size", type=int, default=10000, help="Synthetic vault size (files)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per case (best is reported)")
+    parser.add_argument("--json", action="store_true", help="JSON output")
+    args = parser.parse_args()
+
+    vault = os.path.join(REPO_ROOT, ".tmp", "bench", f"vault-{args.size}")
+    if not os.path.isdir(vault):
+        print(f"Generating {args.size}-file vault at {vault} …", file=sys.stderr)
+        generate_vault.generate(vault, recap_months=12, seed=7, **generate_vault.counts_for(args.size))
+    paths = []
+    for root in ("Ideas", "Clippings", "Meetings", "Transcripts"):
+        for dirpath, _dirs, files in os.walk(os.path.join(vault, root)):
+            paths.extend(os.path.join(dirpath, f) for f in files if f.endswith(".md"))
+    paths.sort()
+    texts = []
+    for path in paths:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            texts.append(f.read())
+
+    mismatches = [p for p, t in zip(paths, texts) if legacy_parse(t) != parse_frontmatter(t)]
+    if mismatches:
+        print(f"Parsers disagree on {len(mismatches)} files, e.g. {mismatches[0]}", file=sys.stderr)
+        sys.exit(1)
+
+    repeat = max(1, args.repeat)
+    cases = {
+        "parse[legacy]": best_of(lambda: [legacy_parse(t) for t in texts], repeat),
+        "parse[lexicon_core]": best_of(lambda: [parse_frontmatter(t) for t in texts], repeat),
+        "read+parse[legacy 8KB head]": best_of(lambda: [legacy_read(p) for p in paths], repeat),
+        "read+parse[lexicon_core fence]": best_of(lambda: [read_frontmatter(p) for p in paths], repeat),
+    }
+    if args.json:
+        print(json.dumps({"files": len(paths), "repeat": repeat, "seconds": cases}, indent=2))
+        return
+    print(f"{len(paths)} files, best of {repeat}")
+    for name, seconds in cases.items():
+        print(f"  {name:<32} {seconds * 1000:>9.1f} ms")
+    print(f"  parse speedup       {cases['parse[legacy]'] / cases['parse[lexicon_core]']:.2f}x")
+    print(
+        f"  read+parse speedup  "
+        f"{cases['read+parse[legacy 8KB head]'] / cases['read+parse[lexicon_core fence]']:.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Build a synthetic Lexicon vault for benchmarks.
+
+Writes Ideas, Clippings, Meetings, HiDock transcripts, Memory area files and recap logs with
+the frontmatter variants found in real vaults (block and inline lists, quoted values, CRLF,
+missing frontmatter, project from folder vs frontmatter, triaged / untriaged).
+
+Usage:
+  python benchmarks/generate_vault.py OUT_DIR --files 10000
+  python benchmarks/generate_vault.py OUT_DIR --ideas 500 --clippings 200 --meetings 300 --hidock 400
+
+--files N splits N across the kinds in a fixed ratio; explicit per-kind counts override it.
+Deterministic for a given --seed.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+from datetime import date, timedelta
+
+PROJECTS = ["personal", "acme", "career", "general"]
+WORDS = (
+    "pricing onboarding partner churn roadmap hiring launch feedback retention pipeline "
+    "budget contract pilot integration security latency design research support growth"
+).split()
+
+# Share of --files per kind; the rest of the vault is small fixed files (Memory, recaps).
+RATIO = {"ideas": 0.25, "clippings": 0.15, "meetings": 0.25, "hidock": 0.35}
+
+
+def _title(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 5))).title()
+
+
+def _day(rng: random.Random) -> date:
+    return date(2025, 1, 1) + timedelta(days=rng.randint(0, 600))
+
+
+def _write(root: str, rel: str, text: str, crlf: bool = False) -> None:
+    path = os.path.join(root, rel)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="\r\n" if crlf else "\n") as f:
+        f.write(text)
+
+
+def _body(rng: random.Random, paragraphs: int) -> str:
+    return "\n\n".join(
+        " ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 60))) for _ in range(paragraphs)
+    )
+
+
+def _capture(rng: random.Random, i: int, kind: str) -> tuple[str, str]:
+    """(relpath, text) for one Idea or Clipping with a random frontmatter variant."""
+    project = rng.choice(PROJECTS)
+    day = _day(rng)
+    title = _title(rng)
+    variant = rng.random()
+    triaged = rng.choice(["", "", (day + timedelta(days=7)).isoformat()])
+    lines = ["---"]
+    if variant < 0.05:
+        lines = []
+    else:
+        lines.append(f'title: "{title}"' if variant < 0.5 else f"title: {title}")
+        date_key = "created" if kind == "ideas" else rng.choice(["created", "published"])
+        lines.append(f"{date_key}: {day.isoformat() if variant < 0.7 else day.strftime('%Y/%m/%d')}")
+        if kind == "clippings" or rng.random() < 0.4:
+            lines.append(f"project: {project}" if rng.random() < 0.8 else f"project: [{project}, general]")
+        if rng.random() < 0.5:
+            lines += ["tags:", f"  - {rng.choice(WORDS)}", f"  - {rng.choice(WORDS)}"]
+        else:
+            lines.append(f"tags: [{rng.choice(WORDS)}, {rng.choice(WORDS)}]")
+        lines.append(f"triaged: {triaged}")
+        lines.append(f"status: {rng.choice(['seed', 'draft', 'promoted'])}")
+        lines.append("---")
+    text = "\n".join(lines) + "\n\n" + _body(rng, rng.randint(1, 4)) + "\n"
+    slug = title.replace(" ", "-").lower()
+    if kind == "ideas":
+        rel = f"Ideas/{project}/{day.isoformat()}-{slug}-{i}.md" if rng.random() < 0.9 else f"Ideas/{slug}-{i}.md"
+    else:
+        rel = f"Clippings/{slug}-{i}.md"
+    return rel, text
+
+
+def generate(out: str, ideas: int, clippings: int, meetings: int, hidock: int, recap_months: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    for i in range(ideas):
+        rel, text = _capture(rng, i, "ideas")
+        _write(out, rel, text, crlf=rng.random() < 0.05)
+    for i in range(clippings):
+        rel, text = _capture(rng, i, "clippings")
+        _write(out, rel, text, crlf=rng.random() < 0.05)
+
+    transcripts = []
+    for i in range(hidock):
+        day = _day(rng)
+        signature = f"{rng.getrandbits(64):016x}"
+        stem = f"{day.isoformat()}_{_title(rng).replace(' ', '_')}_{signature[:8]}"
+        transcripts.append((stem, signature, day))
+        lines = [
+            "---",
+            f"signature: '{signature}'" if rng.random() < 0.5 else f"signature: {signature}",
+            f"title: {stem.split('_', 1)[1].rsplit('_', 1)[0].replace('_', ' ')}",
+            f"date: {day.strftime('%Y/%m/%d')}",
+            "source: HiDock",
+            "---",
+            "",
+            "# Raw Transcript",
+            "",
+        ]
+        body = "\n".join(f"Speaker {rng.randint(1, 3)}: {' '.join(rng.choice(WORDS) for _ in range(15))}" for _ in range(rng.randint(20, 80)))
+        _write(out, f"Transcripts/HiDock/{stem}.md", "\n".join(lines) + body + "\n")
+
+    for i in range(meetings):
+        project = rng.choice(PROJECTS)
+        day = _day(rng)
+        title = _title(rng)
+        lines = ["---", f"title: {title}", f"date: {day.isoformat()}", f"project: {project}"]
+        lines += ["topics:", f"  - {rng.choice(WORDS)}", f"tags: [{rng.choice(WORDS)}]"]
+        link = ""
+        # About half of the HiDock transcripts get a meeting note (by signature or wikilink).
+        if transcripts and i % 2 == 0:
+            stem, signature, day = transcripts[(i // 2) % len(transcripts)]
+            if rng.random() < 0.5:
+                lines.append(f"hidock_signature: {signature}")
+            else:
+                link = f"- [[Transcripts/HiDock/{stem}]]\n"
+        lines.append("---")
+        text = "\n".join(lines) + "\n\n# Summary (factual)\n" + _body(rng, rng.randint(2, 6))
+        text += "\n\n# Transcript Link\n" + link
+        _write(out, f"Meetings/{project}/{day.isoformat()} {title} {i}.md", text)
+
+    for project in PROJECTS:
+        memory = f"Memory/{project}"
+        for area in ("Product", "Org", "Validation"):
+            header = "## Open hypotheses" if area == "Validation" else "## Open decisions"
+            pending = "\n".join(
+                f"- {_day(rng).isoformat()} — Pending: {_title(rng)}" for _ in range(rng.randint(3, 12))
+            )
+            evidence = "\n".join(
+                f"- {_day(rng).isoformat()} — {_title(rng)} — Source: [[meeting]]" for _ in range(max(50, meetings // 4))
+            )
+            _write(out, f"{memory}/{area}.md", f"# Current model\n{_body(rng, 2)}\n\n{header}\n{pending}\n\n# Evidence\n{evidence}\n")
+        for partner in range(3):
+            _write(out, f"{memory}/Partners/Partner{partner}.md", f"## Open decisions\n- {_day(rng).isoformat()} — Pending decision: {_title(rng)}\n\n# Evidence\n")
+        _write(out, f"{memory}/Decisions/decisions.md", "\n".join(f"- {_day(rng).isoformat()} — Pending decision: {_title(rng)}" for _ in range(20)) + "\n")
+        for m in range(recap_months):
+            month = date(2025, 1, 1) + timedelta(days=31 * m)
+            sections = "\n\n".join(
+                f"## {month.strftime('%Y-%m')}-{d:02d} triage\n{_body(rng, 2)}" for d in (5, 19)
+            )
+            _write(out, f"Metadata/recap/{project}/{month.strftime('%Y-%m')}.md", f"# Recap {month.strftime('%Y-%m')}\n\n{sections}\n")
+
+    return {"ideas": ideas, "clippings": clippings, "meetings": meetings, "hidock": hidock, "recap_months": recap_months}
+
+
+def counts_for(files: int) -> dict:
+    return {kind: int(files * share) for kind, share in RATIO.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic Lexicon vault")
+    parser.add_argument("out", help="Output directory (created if missing)")
+    parser.add_argument("--files", type=int, default=1000, help="Total capture/meeting/transcript files")
+    for kind in RATIO:
+        parser.add_argument(f"--{kind}", type=int, default=None, help=f"Override count of {kind}")
+    parser.add_argument("--recap-months", type=int, default=12)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    counts = counts_for(args.files)
+    for kind in RATIO:
+        if getattr(args, kind) is not None:
+            counts[kind] = getattr(args, kind)
+    made = generate(args.out, recap_months=args.recap_months, seed=args.seed, **counts)
+    print(f"Generated vault at {args.out}: " + ", ".join(f"{k}={v}" for k, v in made.items()))
+
+
+if __name__ == "__main__":
+    main()
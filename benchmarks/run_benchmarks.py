@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Time the vault scripts on synthetic vaults and emit JSON results.
+
+Each size gets a vault from generate_vault.py (cached under .tmp/bench/ unless --fresh), then
+build_queue, build_all_queues, iter_recent_meetings, pending_decisions_snippet, list_pending and
+dedup_transcripts are timed. "cold" runs start without .tmp/vault_index.sqlite3, "warm" runs
+reuse it; "workers" runs parse with one process per CPU. Best-of-N seconds are reported.
+
+--scripts times another checkout's scripts/ (e.g. a `git worktree` of an older revision) with
+this harness. Benches are matched to the API the checkout has: before the vault index, the
+functions are called without one (cold and warm are then the same), and benches for functions
+that do not exist yet are skipped.
+
+Usage:
+  python benchmarks/run_benchmarks.py
+  python benchmarks/run_benchmarks.py --sizes 1000 10000 100000 --repeat 5 --out .tmp/bench/v2.json
+  python benchmarks/run_benchmarks.py --scripts .tmp/bench/baseline/scripts --out .tmp/bench/v1.json
+  python benchmarks/run_benchmarks.py --compare .tmp/bench/v1.json .tmp/bench/v2.json
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import inspect
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.abspath(os.path.join(BENCH_DIR, ".."))
+sys.path.insert(0, BENCH_DIR)
+
+import generate_vault  # noqa: E402
+
+DEFAULT_SIZES = (1000, 10000)
+PROJECT = "acme"
+
+# Script modules under test; set by load_scripts().
+hidock_pending = triage_queue = vault_index = None
+
+
+def load_scripts(scripts_dir: str) -> None:
+    """Import the script modules from scripts_dir (this checkout's scripts/ or an older one)."""
+    global hidock_pending, triage_queue, vault_index
+    sys.path.insert(0, scripts_dir)
+    hidock_pending = importlib.import_module("hidock_pending")
+    triage_queue = importlib.import_module("triage_queue")
+    try:
+        vault_index = importlib.import_module("vault_index")
+    except ImportError:
+        vault_index = None
+
+
+def takes(fn, name: str) -> bool:
+    return name in inspect.signature(fn).parameters
+
+
+def point_scripts_at(vault: str) -> None:
+    """Re-root the script modules at a synthetic vault."""
+    triage_queue.REPO_ROOT = Path(vault)
+    hidock_pending.REPO_ROOT = vault
+    hidock_pending.HIDOCK_DIR = os.path.join(vault, "Transcripts", "HiDock")
+    hidock_pending.MEETINGS_DIR = os.path.join(vault, "Meetings")
+
+
+def drop_index(vault: str) -> None:
+    if vault_index is None:
+        return
+    path = os.path.join(vault, vault_index.INDEX_FILENAME)
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def synthetic_listing(n: int, seed: int = 7) -> list[dict]:
+    """transcripts() entries with duplicate recordings, as dedup_transcripts sees them."""
+    rng = random.Random(seed)
+    base = int(datetime(2026, 1, 1).timestamp() * 1000)
+    items = []
+    for i in range(n):
+        meeting = i // 2 if rng.random() < 0.3 else i
+        items.append(
+            {
+                "id": f"id{i}",
+                "title": f"Meeting {meeting % max(1, n // 3)}",
+                "date": base + meeting * 17 * 60 * 1000,
+                "organizer_email": rng.choice(["me@example.com", "other@example.com"]),
+                "duration": rng.choice([3, 25, 45, 60]),
+            }
+        )
+    return items
+
+
+def time_call(fn, repeat: int, setup=None) -> list[float]:
+    runs = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - start)
+    return runs
+
+
+def bench_size(size: int, repeat: int, fresh: bool) -> list[dict]:
+    vault = os.path.join(REPO_ROOT, ".tmp", "bench", f"vault-{size}")
+    if fresh and os.path.isdir(vault):
+        shutil.rmtree(vault)
+    if not os.path.isdir(vault):
+        print(f"Generating {size}-file vault at {vault} …", file=sys.stderr)
+        generate_vault.generate(vault, recap_months=12, seed=7, **generate_vault.counts_for(size))
+    point_scripts_at(vault)
+
+    # Scripts before the vault index take no index argument; their cold and warm runs match.
+    indexed = vault_index is not None and takes(triage_queue.build_queue, "index")
+
+    def with_index(fn, workers=None):
+        """Run fn(**kw) with kw = {"index": a VaultIndex of the vault}, or {} without one."""
+        if not indexed:
+            return fn
+        kwargs = {} if workers is None else {"workers": workers}
+
+        def run():
+            with vault_index.VaultIndex(vault, **kwargs) as index:
+                fn(index=index)
+        return run
+
+    cold = lambda: drop_index(vault)  # noqa: E731
+    listing = synthetic_listing(size)
+    cases = [
+        ("build_queue[cold]", with_index(lambda **kw: triage_queue.build_queue(PROJECT, None, None, **kw)), cold),
+        ("build_queue[warm]", with_index(lambda **kw: triage_queue.build_queue(PROJECT, None, None, **kw)), None),
+        ("iter_recent_meetings[warm]", with_index(lambda **kw: triage_queue.iter_recent_meetings(PROJECT, None, None, **kw)), None),
+        ("pending_decisions_snippet", lambda: triage_queue.pending_decisions_snippet(PROJECT), None),
+        ("list_pending[cold]", with_index(lambda **kw: hidock_pending.list_pending(**kw)), cold),
+        ("list_pending[warm]", with_index(lambda **kw: hidock_pending.list_pending(**kw)), None),
+    ]
+    if hasattr(triage_queue, "build_all_queues"):
+        cases.insert(
+            2, ("build_all_queues[warm]", with_index(lambda **kw: triage_queue.build_all_queues(None, None, **kw)), None)
+        )
+    if indexed and takes(vault_index.VaultIndex, "workers"):
+        cases.insert(
+            -1, ("list_pending[cold,workers]", with_index(lambda **kw: hidock_pending.list_pending(**kw), workers=0), cold)
+        )
+    try:
+        import fireflies_collection
+    except ImportError as e:
+        print(f"  skipping dedup_transcripts ({e})", file=sys.stderr)
+    else:
+        cases.append(
+            ("dedup_transcripts", lambda: fireflies_collection.dedup_transcripts(listing, "me@example.com"), None)
+        )
+
+    results = []
+    for name, fn, setup in cases:
+        runs = time_call(fn, repeat, setup)
+        results.append({"size": size, "bench": name, "seconds": min(runs), "runs": runs})
+        print(f"  {size:>7}  {name:<28} {min(runs) * 1000:>10.1f} ms", file=sys.stderr)
+    return results
+
+
+def git_revision(path: str = REPO_ROOT) -> str:
+    try:
+        out = subprocess.run(
+            ["git", "describe", "--always", "--dirty"], cwd=path, capture_output=True, text=True, check=True
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def compare(old_path: str, new_path: str) -> None:
+    with open(old_path, encoding="utf-8") as f:
+        old = {(r["size"], r["bench"]): r["seconds"] for r in json.load(f)["results"]}
+    with open(new_path, encoding="utf-8") as f:
+        new = {(r["size"], r["bench"]): r["seconds"] for r in json.load(f)["results"]}
+    print(f"{'size':>7}  {'bench':<28} {'old ms':>10} {'new ms':>10} {'speedup':>8}")
+    for key in sorted(set(old) | set(new)):
+        o, n = old.get(key), new.get(key)
+        o_ms = f"{o * 1000:.1f}" if o is not None else "-"
+        n_ms = f"{n * 1000:.1f}" if n is not None else "-"
+        ratio = f"{o / n:.2f}x" if o and n else ""
+        print(f"{key[0]:>7}  {key[1]:<28} {o_ms:>10} {n_ms:>10} {ratio:>8}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Lexicon scripts on synthetic vaults")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Vault sizes (files)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark (best is reported)")
+    parser.add_argument("--fresh", action="store_true", help="Regenerate vaults under .tmp/bench/")
+    parser.add_argument("--out", help="Write JSON results here (default: stdout)")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="Compare two result files")
+    parser.add_argument(
+        "--scripts",
+        default=os.path.join(REPO_ROOT, "scripts"),
+        metavar="DIR",
+        help="scripts/ directory to time, e.g. of an older checkout (default: this one)",
+    )
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+    scripts_dir = os.path.abspath(args.scripts)
+    if not os.path.isfile(os.path.join(scripts_dir, "triage_queue.py")):
+        print(f"No triage_queue.py in {scripts_dir}", file=sys.stderr)
+        sys.exit(1)
+    load_scripts(scripts_dir)
+
+    results = []
+    for size in args.sizes:
+        results.extend(bench_size(size, max(1, args.repeat), args.fresh))
+    payload = {
+        "meta": {
+            "revision": git_revision(scripts_dir),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    text = json.dumps(payload, indent=2)
+    if args.out:
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        print(f"Wrote {args.out}", file=sys.stderr)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Date-ordered index of everything dated in the vault, across projects.
+
+Stored in .tmp/date_index.sqlite3. One row per dated item: meeting notes, Ideas, Clippings and
+transcripts (frontmatter date / created / published, else a YYYY-MM-DD filename prefix) and the
+dated sections of Metadata/recap/<project>/ logs (`## YYYY-MM-DD triage`, with byte ranges).
+Rows sit in a B-tree on date, so a period query is one range scan over the rows inside the
+window — no per-project globbing, no frontmatter reads for files outside it. Files are re-read
+only when their mtime/size changes; undated files are tracked but never returned.
+
+Periods are inclusive and may be partial: 2026 is the year, 2026-05 the month.
+
+Usage:
+  python scripts/date_index.py range 2026-05 [--project acme] [--kind meeting recap] [--text] [--json]
+  python scripts/date_index.py range 2026-04-01 2026-05-24
+  python scripts/date_index.py refresh | stats | rebuild
+
+Safe to delete .tmp/date_index.sqlite3 at any time; it is rebuilt on the next run.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+from pathlib import Path
+
+from lexicon_core.frontmatter import parse_frontmatter, read_frontmatter_block
+from section_index import bound_date, read_range
+from vault_index import REPO_ROOT, file_capture_date, frontmatter_project, walk_markdown
+
+INDEX_FILENAME = os.path.join(".tmp", "date_index.sqlite3")
+SCHEMA_VERSION = 1
+# (root, kind) in display order for items on the same day.
+ROOTS = (
+    ("Meetings", "meeting"),
+    ("Transcripts", "transcript"),
+    ("Ideas", "idea"),
+    ("Clippings", "clipping"),
+    ("Metadata/recap", "recap"),
+)
+KINDS = tuple(kind for _root, kind in ROOTS)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    root TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    dated INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_root ON files(root);
+CREATE TABLE IF NOT EXISTS items (
+    date TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    project TEXT NOT NULL,
+    path TEXT NOT NULL,
+    title TEXT NOT NULL,
+    start INTEGER NOT NULL,
+    end INTEGER NOT NULL,
+    PRIMARY KEY (path, start)
+);
+CREATE INDEX IF NOT EXISTS items_date ON items(date, kind);
+"""
+
+# Dated level-2 headings of a recap log; a section runs to the next level-1/2 heading.
+RECAP_HEADING_RE = re.compile(rb"^## (\d{4}-\d{2}-\d{2})\b[^\r\n]*", re.MULTILINE)
+SECTION_BREAK_RE = re.compile(rb"^#{1,2} ", re.MULTILINE)
+
+
+def recap_sections(data: bytes) -> list[tuple[str, str, int, int]]:
+    """(date, heading, start, end) for each dated section of a recap log."""
+    out = []
+    for m in RECAP_HEADING_RE.finditer(data):
+        nxt = SECTION_BREAK_RE.search(data, m.end())
+        end = nxt.start() if nxt else len(data)
+        heading = m.group(0).decode("utf-8", errors="replace").lstrip("#").strip()
+        out.append((m.group(1).decode("ascii"), heading, m.start(), end))
+    return out
+
+
+def _project(root: str, rel: str, fm: dict) -> str:
+    """Frontmatter project, else the <root>/<project>/ folder (not for Transcripts/<source>/)."""
+    project = frontmatter_project(fm)
+    if project or root == "Transcripts":
+        return project
+    tail = rel[len(root) + 1 :].split("/")
+    return tail[0].lower() if len(tail) > 1 else ""
+
+
+def extract(root: str, kind: str, rel: str, data: bytes) -> list[tuple]:
+    """Item rows (date, kind, project, path, title, start, end) for one file."""
+    if kind == "recap":
+        project = _project(root, rel, {})
+        return [(date, kind, project, rel, heading, start, end) for date, heading, start, end in recap_sections(data)]
+    fm = parse_frontmatter(data.decode("utf-8", errors="replace"))
+    date = file_capture_date(rel, fm)
+    if not date:
+        return []
+    title = fm.get("title") if isinstance(fm.get("title"), str) and fm.get("title") else Path(rel).stem
+    return [(date, kind, _project(root, rel, fm), rel, title, 0, 0)]
+
+
+def _read(kind: str, path: str) -> bytes:
+    """Recap logs whole (section offsets); everything else only up to the closing frontmatter fence."""
+    if kind == "recap":
+        with open(path, "rb") as f:
+            return f.read()
+    return read_frontmatter_block(path).encode("utf-8")
+
+
+class DateIndex:
+    """Date → items index over meetings, captures, transcripts and recap sections."""
+
+    def __init__(self, root=None, db_path: str | None = None):
+        self.root = os.path.abspath(str(root or REPO_ROOT))
+        self.db_path = db_path or os.path.join(self.root, INDEX_FILENAME)
+        self.conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        try:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+        except (OSError, sqlite3.Error) as e:
+            print(f"date index unavailable ({e}); using in-memory index", file=sys.stderr)
+            conn = sqlite3.connect(":memory:")
+            version = 0
+        if version != SCHEMA_VERSION:
+            conn.executescript("DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS items;")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.executescript(SCHEMA)
+        return conn
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "DateIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def refresh(self, roots=ROOTS) -> dict:
+        """Re-read new/changed files and drop deleted ones. Returns counts."""
+        stats = {"scanned": 0, "updated": 0, "removed": 0}
+        for root_rel, kind in roots:
+            known = {
+                path: (mtime_ns, size)
+                for path, mtime_ns, size in self.conn.execute(
+                    "SELECT path, mtime_ns, size FROM files WHERE root = ?", (root_rel,)
+                )
+            }
+            seen = set()
+            with self.conn:
+                for rel, path, mtime_ns, size in walk_markdown(self.root, root_rel):
+                    if rel.rsplit("/", 1)[-1].lower() == "readme.md":
+                        continue
+                    seen.add(rel)
+                    if known.get(rel) == (mtime_ns, size):
+                        continue
+                    try:
+                        data = _read(kind, path)
+                    except OSError:
+                        continue
+                    self._store(root_rel, kind, rel, mtime_ns, size, data)
+                    stats["updated"] += 1
+                for rel in known:
+                    if rel not in seen:
+                        self._forget(rel)
+                        stats["removed"] += 1
+            stats["scanned"] += len(seen)
+        return stats
+
+    def _forget(self, rel: str) -> None:
+        for table in ("files", "items"):
+            self.conn.execute(f"DELETE FROM {table} WHERE path = ?", (rel,))
+
+    def _store(self, root_rel: str, kind: str, rel: str, mtime_ns: int, size: int, data: bytes) -> None:
+        self._forget(rel)
+        items = extract(root_rel, kind, rel, data)
+        self.conn.execute(
+            "INSERT INTO files (path, root, mtime_ns, size, dated) VALUES (?, ?, ?, ?, ?)",
+            (rel, root_rel, mtime_ns, size, int(bool(items))),
+        )
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO items (date, kind, project, path, title, start, end) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            items,
+        )
+
+    def period(
+        self, start: str, end: str | None = None, project=None, kinds=None, with_text: bool = False
+    ) -> list[dict]:
+        """Items dated start..end (inclusive, YYYY[-MM[-DD]]; end defaults to start), oldest first."""
+        lo, hi = bound_date(start, upper=False), bound_date(end or start, upper=True)
+        sql = "SELECT date, kind, project, path, title, start, end FROM items WHERE date >= ? AND date <= ?"
+        params: list = [lo, hi]
+        if project:
+            sql += " AND project = ?"
+            params.append(project.lower())
+        if kinds:
+            sql += f" AND kind IN ({', '.join('?' for _ in kinds)})"
+            params.extend(kinds)
+        order = " ".join(f"WHEN '{kind}' THEN {i}" for i, kind in enumerate(KINDS))
+        sql += f" ORDER BY date, CASE kind {order} END, path, start"
+        out = []
+        for date, kind, proj, rel, title, s, e in self.conn.execute(sql, params):
+            item = {"date": date, "kind": kind, "project": proj, "path": rel, "title": title}
+            if kind == "recap":
+                item["start"], item["end"] = s, e
+                if with_text:
+                    item["text"] = read_range(os.path.join(self.root, rel), s, e).strip()
+            out.append(item)
+        return out
+
+    def counts(self) -> dict[str, int]:
+        counts = dict(self.conn.execute("SELECT kind, COUNT(*) FROM items GROUP BY kind"))
+        out = {kind: counts.get(kind, 0) for kind in KINDS}
+        out["undated files"] = self.conn.execute("SELECT COUNT(*) FROM files WHERE dated = 0").fetchone()[0]
+        return out
+
+    def span(self) -> tuple[str, str] | None:
+        first, last = self.conn.execute("SELECT MIN(date), MAX(date) FROM items").fetchone()
+        return (first, last) if first else None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Date-ordered index of meetings, captures, transcripts and recaps")
+    sub = parser.add_subparsers(dest="command", required=True)
+    range_p = sub.add_parser("range", help="Everything dated in a period, oldest first")
+    range_p.add_argument("start", help="YYYY[-MM[-DD]], inclusive")
+    range_p.add_argument("end", nargs="?", help="YYYY[-MM[-DD]], inclusive (default: same period as start)")
+    range_p.add_argument("--project", help="Only this project (frontmatter or <root>/<project>/ folder)")
+    range_p.add_argument("--kind", nargs="+", choices=KINDS, help="Only these kinds")
+    range_p.add_argument("--text", action="store_true", help="Include the text of recap sections")
+    range_p.add_argument("--no-refresh", action="store_true", help="Query the index as is")
+    range_p.add_argument("--json", action="store_true", help="JSON output")
+    sub.add_parser("refresh", help="Re-read new/changed files")
+    sub.add_parser("stats", help="Print indexed counts per kind")
+    sub.add_parser("rebuild", help="Drop the index and re-read everything")
+    args = parser.parse_args()
+
+    if args.command == "rebuild":
+        db_path = os.path.join(REPO_ROOT, INDEX_FILENAME)
+        if os.path.exists(db_path):
+            os.remove(db_path)
+
+    if args.command != "range":
+        with DateIndex() as index:
+            stats = index.refresh()
+            if args.command != "stats":
+                print(f"Scanned {stats['scanned']} files: {stats['updated']} re-read, {stats['removed']} removed.")
+            for kind, count in index.counts().items():
+                print(f"  {kind}: {count}")
+            span = index.span()
+            if span:
+                print(f"  span: {span[0]} → {span[1]}")
+        return
+
+    with DateIndex() as index:
+        if not args.no_refresh:
+            index.refresh()
+        try:
+            results = index.period(args.start, args.end, project=args.project, kinds=args.kind, with_text=args.text)
+        except ValueError as e:
+            print(str(e), file=sys.stderr)
+            sys.exit(1)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    if not results:
+        print(f"Nothing dated {args.start}{' → ' + args.end if args.end else ''}.")
+        return
+    day = None
+    for item in results:
+        if item["date"] != day:
+            if day:
+                print()
+            day = item["date"]
+            print(f"## {day}")
+        project = f" [{item['project']}]" if item["project"] else ""
+        print(f"- {item['kind']}{project}: {item['title']} — {item['path']}")
+        if item.get("text"):
+            print("\n".join("    " + line for line in item["text"].splitlines()))
+
+
+if __name__ == "__main__":
+    main()
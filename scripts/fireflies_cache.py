@@ -0,0 +1,126 @@
+"""
+Local cache of Fireflies API responses, used by fireflies_collection.py.
+
+Lives under .tmp/fireflies/<account>/cache/:
+  listing/<key>.json      transcripts() pages, reused for LISTING_TTL seconds
+  transcripts/<id>.json   transcript bodies with the listing fingerprint they were fetched for
+
+A cached body is fresh while its fingerprint (title, date, duration from the listing) still
+matches, so re-running a day downloads nothing unless Fireflies changed the transcript.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+LISTING_TTL = 300
+
+
+def fingerprint(listing_entry: dict | None) -> list | None:
+    """Freshness key for a transcript from its transcripts() listing entry."""
+    if not listing_entry:
+        return None
+    return [listing_entry.get("title"), listing_entry.get("date"), listing_entry.get("duration")]
+
+
+def _write_json(path: str, payload: dict) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _read_json(path: str) -> dict | None:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+class FirefliesCache:
+    """File-per-entry JSON cache; safe for concurrent download threads."""
+
+    def __init__(self, cache_dir: str, listing_ttl: float = LISTING_TTL):
+        self.cache_dir = cache_dir
+        self.listing_ttl = listing_ttl
+
+    def _listing_path(self, variables: dict) -> str:
+        key = hashlib.sha1(json.dumps(variables, sort_keys=True).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, "listing", f"{key}.json")
+
+    def _body_path(self, meeting_id: str) -> str:
+        safe_id = "".join(c for c in meeting_id if c.isalnum() or c in "-_")
+        return os.path.join(self.cache_dir, "transcripts", f"{safe_id}.json")
+
+    def get_listing(self, variables: dict) -> list | None:
+        entry = _read_json(self._listing_path(variables))
+        if not entry or time.time() - entry.get("fetched_at", 0) > self.listing_ttl:
+            return None
+        return entry.get("transcripts")
+
+    def put_listing(self, variables: dict, transcripts: list) -> None:
+        _write_json(
+            self._listing_path(variables),
+            {"fetched_at": time.time(), "variables": variables, "transcripts": transcripts},
+        )
+
+    def get_transcript(self, meeting_id: str, fp: list | None = None) -> dict | None:
+        """Cached body, or None when missing or its fingerprint no longer matches fp."""
+        entry = _read_json(self._body_path(meeting_id))
+        if not entry:
+            return None
+        if fp is not None and entry.get("fingerprint") != fp:
+            return None
+        return entry.get("transcript")
+
+    def put_transcript(self, meeting_id: str, transcript: dict, fp: list | None = None) -> None:
+        _write_json(
+            self._body_path(meeting_id),
+            {"fetched_at": time.time(), "fingerprint": fp, "transcript": transcript},
+        )
+
+    def _entries(self):
+        for kind in ("listing", "transcripts"):
+            folder = os.path.join(self.cache_dir, kind)
+            if not os.path.isdir(folder):
+                continue
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if entry.name.endswith(".json") and entry.is_file():
+                        yield kind, entry
+
+    def stats(self) -> dict:
+        result = {
+            kind: {"files": 0, "bytes": 0, "oldest": None, "newest": None}
+            for kind in ("listing", "transcripts")
+        }
+        for kind, entry in self._entries():
+            st = entry.stat()
+            row = result[kind]
+            row["files"] += 1
+            row["bytes"] += st.st_size
+            row["oldest"] = min(row["oldest"] or st.st_mtime, st.st_mtime)
+            row["newest"] = max(row["newest"] or st.st_mtime, st.st_mtime)
+        return result
+
+    def prune(self, older_than_days: float) -> tuple[int, int]:
+        """Delete entries not written for older_than_days. Returns (files, bytes) removed."""
+        cutoff = time.time() - older_than_days * 86400
+        files = size = 0
+        for _kind, entry in list(self._entries()):
+            st = entry.stat()
+            if st.st_mtime < cutoff:
+                os.remove(entry.path)
+                files += 1
+                size += st.st_size
+        return files, size
@@ -3,24 +3,67 @@
 Fetch Fireflies transcripts for a date and account. Saves to Transcripts/Fireflies/<account>/.
 
 Usage:
-  python scripts/fireflies_collection.py process-date YYYY-MM-DD <account> [--force]
+  python scripts/fireflies_collection.py process-date YYYY-MM-DD <account> [--force] [--jobs N]
+  python scripts/fireflies_collection.py process-range START END <account> [--force] [--jobs N]
+  python scripts/fireflies_collection.py process-range --since-last-run <account> [--force] [--jobs N]
+  python scripts/fireflies_collection.py sync-all [START [END]] [--since-last-run] [--force] [--jobs N]
   python scripts/fireflies_collection.py fetch <transcript_id> <account> [--force]
+  python scripts/fireflies_collection.py cache stats [<account>]
+  python scripts/fireflies_collection.py cache prune [<account>] --older-than DAYS
 
-  --force  Re-download and overwrite local files even when the path and transcript id already match.
+  --force   Re-write local files even when the path and transcript id already match (bodies still
+            come from the cache while the listing is unchanged).
+  --refresh Re-download transcript bodies even when a cached copy matches the listing.
+  --jobs N  Download up to N transcripts concurrently over one pooled HTTP session (default 1).
+  --no-cache  Ignore the local response cache (see below) and always call the API.
+  --batch-size N  Download up to N transcripts per request with one aliased GraphQL query
+              (default 10; shrunk to keep responses near 2 MB; 1 = one request per transcript).
+              Transcripts a batch does not return are fetched one by one.
+
+process-range lists the whole window in one paginated query, dedups across it and checkpoints
+progress under .tmp/fireflies/<account>/, so an interrupted backfill resumes where it stopped.
+--since-last-run starts from the last date synced for the account and runs through today.
+
+sync-all discovers every FIREFLIES_API_KEY_<account> in the environment and syncs the accounts
+concurrently (default window: today), then prints one per-account results table.
+
+Cache: listing pages and transcript bodies are cached under .tmp/fireflies/<account>/cache/.
+A cached body is reused while title/date/duration in the listing still match, so re-running a
+day (with or without --force) downloads nothing that did not change. --refresh and `fetch <id>`
+(no listing to compare against) always re-download and refresh the cached body. Listing pages
+are reused for 5 min.
 
 Required .env per account: FIREFLIES_API_KEY_<account>, EMAIL_<account>. See .env.example.
+Optional: FIREFLIES_RATE_<account> = max API requests per minute for that account, shared by
+concurrent downloads (default: no limit for serial runs, 60 with --jobs > 1). A 429 halves the rate and pauses the account for its
+Retry-After; the rate recovers as requests succeed. 429/5xx responses, timeouts and dropped
+connections are retried with jittered exponential backoff instead of aborting the run. A
+transcript that still fails is reported under RESULTS and left for the next run; the others
+are saved.
 
 Dedup: One transcript per logical meeting (same title + 15-min time bucket). When multiple
 recordings exist, we keep the one where organizer_email == EMAIL_<account>; otherwise the
 first. If we already have a file for that meeting but with a different transcript ID, we
 replace it (upgrade to our recording). Meetings under 5 minutes are skipped.
 """
+import argparse
 import os
+import random
 import sys
 import re
-import glob
+import tempfile
+import threading
+import time
 import requests
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+
+from fireflies_cache import FirefliesCache, fingerprint
+from lexicon_core import profiling
+from lexicon_core.archive import discard_archives
+from lexicon_core.files import set_final_mode
+from lexicon_core.frontmatter import format_frontmatter, read_frontmatter
 
 # --- CONFIGURATION ---
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -40,19 +83,55 @@ if os.path.isfile(env_path):
                     os.environ.setdefault(k.strip(), v.strip().strip('"').strip("'"))
 
 
+# Requests per minute when FIREFLIES_RATE_<account> is unset and downloads run concurrently.
+DEFAULT_RATE_PER_MIN = 60.0
+DEFAULT_BURST = 3
+MIN_RATE_PER_MIN = 6.0
+RATE_RECOVERY_STEPS = 20
+# Retries for 429, 5xx, timeouts and dropped connections; waits are exponential with full jitter.
+MAX_RETRIES = 5
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 60.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+REQUEST_TIMEOUT = 120
+# Transcript downloads are batched into aliased queries of up to --batch-size ids, sized so a
+# response stays near TARGET_BATCH_BYTES.
+DEFAULT_BATCH_SIZE = 10
+BATCH_START = 4
+TARGET_BATCH_BYTES = 2_000_000
+
+
+def account_env(prefix, key):
+    """os.getenv(f"{prefix}_{key}"), falling back to a case-insensitive match (EMAIL_Acme for 'acme')."""
+    name = f"{prefix}_{key}"
+    val = os.getenv(name)
+    if val is None:
+        name = name.lower()
+        val = next((v for k, v in os.environ.items() if k.lower() == name), None)
+    return val
+
+
 def get_config(account):
-    """Env: FIREFLIES_API_KEY_<account>, EMAIL_<account>; optional OUTPUT_DIR_<account>."""
+    """Env: FIREFLIES_API_KEY_<account>, EMAIL_<account>; optional OUTPUT_DIR_<account>.
+
+    The account name is case-insensitive: `acme` reads FIREFLIES_API_KEY_Acme too.
+    """
     key = account.lower()
-    output_dir = os.getenv(f"OUTPUT_DIR_{key}")
+    output_dir = account_env("OUTPUT_DIR", key)
     if not output_dir:
         output_dir = os.path.join(REPO_ROOT, "Transcripts", "Fireflies", key)
-    project = (os.getenv(f"PROJECT_{key}") or "").strip()
+    project = (account_env("PROJECT", key) or "").strip()
+    try:
+        rate_per_min = float(account_env("FIREFLIES_RATE", key) or "")
+    except ValueError:
+        rate_per_min = None
     return {
-        "api_key": (os.getenv(f"FIREFLIES_API_KEY_{key}") or "").strip(),
-        "email": (os.getenv(f"EMAIL_{key}") or "").strip(),
+        "api_key": (account_env("FIREFLIES_API_KEY", key) or "").strip(),
+        "email": (account_env("EMAIL", key) or "").strip(),
         "output_dir": output_dir,
         "name": key,
         "project": project,
+        "rate_per_min": rate_per_min,
     }
 
 
@@ -84,24 +163,194 @@ def validate_config(config, account):
 URL = "https://api.fireflies.ai/graphql"
 
 
-def run_query(query, config, variables=None):
+class RateLimiter:
+    """Token bucket shared by all threads of one account that backs off when the API throttles.
+
+    Allows short bursts (up to `burst` requests) at rate_per_min on average. A 429 halves the rate
+    (down to MIN_RATE_PER_MIN) and pauses every thread until Retry-After has passed; each later
+    success wins back 1/RATE_RECOVERY_STEPS of the configured rate. rate_per_min <= 0 = no limit.
+    """
+
+    def __init__(self, rate_per_min, burst=DEFAULT_BURST):
+        self.max_rate = rate_per_min / 60.0 if rate_per_min > 0 else 0.0
+        self.rate = self.max_rate
+        self.burst = max(1, burst)
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    def wait(self):
+        """Block until a request may go out. Returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if not self.max_rate:
+                    delay = self._paused_until - now
+                    if delay <= 0:
+                        return waited
+                else:
+                    self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if now >= self._paused_until and self._tokens >= 1:
+                        self._tokens -= 1
+                        return waited
+                    delay = max(self._paused_until - now, (1 - self._tokens) / self.rate)
+            time.sleep(delay)
+            waited += delay
+
+    def throttled(self, pause):
+        """The API answered 429: slow down and hold every thread for `pause` seconds."""
+        with self._lock:
+            if self.max_rate:
+                self.rate = max(min(MIN_RATE_PER_MIN / 60.0, self.max_rate), self.rate / 2)
+                self._tokens = 0.0
+            self._paused_until = max(self._paused_until, time.monotonic() + pause)
+
+    def succeeded(self):
+        if self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / RATE_RECOVERY_STEPS)
+
+
+def attach_http(config, pool_size=1):
+    """Give the account a pooled requests.Session and its own rate limiter.
+
+    The limiter uses FIREFLIES_RATE_<account> when set; otherwise it only throttles concurrent
+    downloads (DEFAULT_RATE_PER_MIN when pool_size > 1). 429 pauses and backoff apply either way.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    config["session"] = session
+    rate_per_min = config.get("rate_per_min")
+    if rate_per_min is None:
+        rate_per_min = DEFAULT_RATE_PER_MIN if pool_size > 1 else 0.0
+    config["limiter"] = RateLimiter(rate_per_min)
+    return config
+
+
+def attach_cache(config, enabled=True):
+    """Use the per-account response cache under .tmp/fireflies/<account>/cache/."""
+    config["cache"] = FirefliesCache(os.path.join(state_dir(config), "cache")) if enabled else None
+    return config
+
+
+def _count(config, name, n=1):
+    """Thread-safe per-run counters kept on the account config (and in the --profile report)."""
+    profiling.count(name, n)
+    lock = config.setdefault("_counter_lock", threading.Lock())
+    with lock:
+        counters = config.setdefault("counters", {})
+        counters[name] = counters.get(name, 0) + n
+
+
+def retry_after(response):
+    """Seconds asked for by a Retry-After header (delta-seconds or HTTP date), or None."""
+    value = (response.headers.get("Retry-After") or "").strip()
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def backoff_delay(attempt):
+    """Full-jitter exponential backoff for retry number `attempt` (0-based)."""
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt))
+
+
+class APIError(Exception):
+    """A request that failed for good (non-retryable status, or out of retries). str() = the message lines."""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+def post_query(query, config, variables=None):
+    """POST one GraphQL query, retrying throttled and transient failures.
+
+    429 and 5xx responses, timeouts and dropped connections are retried up to MAX_RETRIES times,
+    waiting Retry-After when given and jittered exponential backoff otherwise. Returns
+    (data, GraphQL errors, response bytes); raises APIError for anything else or when out of retries.
+    """
     if not config["api_key"]:
         validate_config(config, config["name"])
     headers = {"Authorization": f"Bearer {config['api_key']}", "Content-Type": "application/json"}
-    try:
-        response = requests.post(URL, json={"query": query, "variables": variables}, headers=headers)
-        body = response.json() if response.headers.get("content-type", "").startswith("application/json") else {}
+    limiter = config.get("limiter")
+    http = config.get("session") or requests
+    for attempt in range(MAX_RETRIES + 1):
+        if limiter:
+            waited = limiter.wait()
+            if waited:
+                _count(config, "throttled_seconds", waited)
+        _count(config, "requests")
+        try:
+            with profiling.phase("http"):
+                response = http.post(
+                    URL, json={"query": query, "variables": variables}, headers=headers, timeout=REQUEST_TIMEOUT
+                )
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            if attempt == MAX_RETRIES:
+                raise APIError(f"FATAL: API request failed after {attempt + 1} attempts. {e}") from e
+            _count(config, "retries")
+            delay = backoff_delay(attempt)
+            time.sleep(delay)
+            _count(config, "throttled_seconds", delay)
+            continue
+        except requests.exceptions.RequestException as e:
+            raise APIError(f"FATAL: API request failed. {e}") from e
+        size = len(response.content)
+        profiling.count("http bytes", size)
+        if response.status_code in RETRY_STATUSES and attempt < MAX_RETRIES:
+            _count(config, "retries")
+            delay = retry_after(response)
+            if delay is None:
+                delay = backoff_delay(attempt)
+            if response.status_code == 429 and limiter:
+                limiter.throttled(delay)
+            else:
+                time.sleep(delay)
+                _count(config, "throttled_seconds", delay)
+            continue
+        try:
+            body = response.json() if response.headers.get("content-type", "").startswith("application/json") else {}
+        except ValueError as e:
+            # HTML error pages or truncated bodies sent as JSON: report them like any other failure.
+            if response.ok:
+                raise APIError(
+                    f"API request failed ({response.status_code} {response.reason}): unreadable JSON response. {e}",
+                    status=response.status_code,
+                ) from e
+            body = {}
         if not response.ok:
             err = body.get("errors", body) or response.text
-            print("API request failed ({} {}).".format(response.status_code, response.reason), file=sys.stderr)
-            print(err, file=sys.stderr)
+            lines = ["API request failed ({} {}).".format(response.status_code, response.reason), str(err)]
             if response.status_code in (401, 403):
-                print("Check that FIREFLIES_API_KEY_{} in .env is correct and not expired.".format(config["name"]), file=sys.stderr)
-            sys.exit(1)
-        return body.get("data", {})
-    except requests.exceptions.RequestException as e:
-        print(f"FATAL: API request failed. {e}", file=sys.stderr)
+                lines.append("Check that FIREFLIES_API_KEY_{} in .env is correct and not expired.".format(config["name"]))
+            raise APIError("\n".join(lines), status=response.status_code)
+        if limiter:
+            limiter.succeeded()
+        return body.get("data") or {}, body.get("errors") or [], size
+
+
+def run_query(query, config, variables=None):
+    """post_query's data; exits with the API's error when the request fails for good."""
+    try:
+        data, _errors, _size = post_query(query, config, variables)
+    except APIError as e:
+        print(e, file=sys.stderr)
         sys.exit(1)
+    return data
 
 
 def clean_filename(text):
@@ -116,55 +365,235 @@ def get_target_filename(m_date_ms, title, m_id, output_dir):
     return os.path.join(output_dir, f"{date_dash}_{safe_title}_{m_id}.md")
 
 
-def get_date_title_pattern(m_date_ms, title, output_dir):
+def get_date_title_key(m_date_ms, title):
     dt_obj = datetime.fromtimestamp(m_date_ms / 1000)
-    date_dash = dt_obj.strftime("%Y-%m-%d")
-    safe_title = clean_filename(title)
-    return os.path.join(output_dir, f"{date_dash}_{safe_title}_*.md")
+    return dt_obj.strftime("%Y-%m-%d"), clean_filename(title)
 
 
-def fetch_and_save(meeting_id, config, force=False):
-    query = """
-    query GetTranscript($id: String!) {
-      transcript(id: $id) {
+OUTPUT_NAME_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})_(.*)_([^_]+)\.md$")
+
+
+class OutputDirIndex:
+    """One scandir pass over an account's output dir: (date, safe title) → files.
+
+    Replaces a glob per transcript. Ids come from the filename; the frontmatter fireflies_id is
+    read (once, lazily) only for files that match a transcript being synced.
+    """
+
+    def __init__(self, output_dir):
+        self.by_key = {}
+        self._fm_ids = {}
+        if not os.path.isdir(output_dir):
+            return
+        with os.scandir(output_dir) as it:
+            for entry in it:
+                match = OUTPUT_NAME_RE.match(entry.name)
+                if match and entry.is_file():
+                    self.add(entry.path)
+
+    def add(self, path):
+        match = OUTPUT_NAME_RE.match(os.path.basename(path))
+        if not match:
+            return
+        date_dash, safe_title, _name_id = match.groups()
+        paths = self.by_key.setdefault((date_dash, safe_title), [])
+        if path not in paths:
+            paths.append(path)
+
+    def remove(self, path):
+        match = OUTPUT_NAME_RE.match(os.path.basename(path))
+        if not match:
+            return
+        date_dash, safe_title, _name_id = match.groups()
+        paths = self.by_key.get((date_dash, safe_title), [])
+        if path in paths:
+            paths.remove(path)
+        self._fm_ids.pop(path, None)
+
+    def file_id(self, path):
+        """fireflies_id from frontmatter, else the id suffix of the filename."""
+        if path not in self._fm_ids:
+            try:
+                fm_id = read_frontmatter(path).get("fireflies_id")
+            except OSError:
+                fm_id = None
+            if not isinstance(fm_id, str):
+                fm_id = None
+            self._fm_ids[path] = fm_id or OUTPUT_NAME_RE.match(os.path.basename(path)).group(3)
+        return self._fm_ids[path]
+
+    def existing(self, m_date_ms, title):
+        """Files already saved for this date + title, as [(path, fireflies_id)]."""
+        return [(path, self.file_id(path)) for path in self.by_key.get(get_date_title_key(m_date_ms, title), [])]
+
+
+TRANSCRIPT_FIELDS = """
         id, title, date, participants, transcript_url
         sentences { speaker_name, text }
-      }
+"""
+TRANSCRIPT_QUERY = """
+    query GetTranscript($id: String!) {
+      transcript(id: $id) {%s      }
     }
-    """
-    data = run_query(query, config, {"id": meeting_id})
-    m = data.get("transcript")
-    if not m:
+""" % TRANSCRIPT_FIELDS
+
+
+def cached_body(meeting_id, config, listing):
+    """The cached body for a listing entry whose fingerprint still matches; None without one or with --refresh."""
+    cache = config.get("cache")
+    fp = fingerprint(listing)
+    if not cache or fp is None or config.get("refresh"):
         return None
+    return cache.get_transcript(meeting_id, fp)
+
+
+def fetch_and_save(meeting_id, config, force=False, listing=None):
+    """Download (or take from cache) one transcript and write it. listing = its transcripts() entry.
+
+    The cache is only read when there is a listing fingerprint to check it against and --refresh
+    is off; otherwise (e.g. `fetch <id>`) the body is downloaded and the entry refreshed.
+    Raises APIError when the download fails for good (safe to call from worker threads).
+    """
+    cache = config.get("cache")
+    fp = fingerprint(listing)
+    m = cached_body(meeting_id, config, listing)
+    if m is not None:
+        _count(config, "cache_hits")
+    else:
+        data, _errors, _size = post_query(TRANSCRIPT_QUERY, config, {"id": meeting_id})
+        m = data.get("transcript")
+        if not m:
+            return None
+        _count(config, "downloads")
+        if cache:
+            cache.put_transcript(meeting_id, m, fp)
+    return save_transcript(m, config, force=force)
+
+
+def save_transcript(m, config, force=False):
+    """Write a transcript unless its file exists. Returns ("SAVED" | "EXISTING", filename)."""
     filename = get_target_filename(m["date"], m["title"], m["id"], config["output_dir"])
     if os.path.exists(filename) and not force:
         return ("EXISTING", filename)
 
-    participants_str = "\n".join([f"  - {p}" for p in (m.get("participants") or [])])
-    sentences = m.get("sentences") or []
-    transcript_str = "\n".join([f"{s.get('speaker_name', '')}: {s.get('text', '')}" for s in sentences])
-    meta_date = datetime.fromtimestamp(m["date"] / 1000).strftime("%Y/%m/%d")
+    with profiling.phase("write"):
+        write_transcript(filename, m, config)
+    discard_archives(filename)
+    if profiling.enabled():
+        profiling.count("bytes written", os.path.getsize(filename))
+    return ("SAVED", filename)
 
-    project_line = f"project: {config['project']}\n" if config.get("project") else ""
-    content = f"""---
-title: {m['title']}
-date: {meta_date}
-{project_line}participants:
-{participants_str}
-meeting_link: {m['transcript_url']}
-fireflies_id: {m['id']}
-source: Fireflies
-tags: [transcript, fireflies, meeting]
----
-
-# Raw Transcript
-
-{transcript_str}
+
+def batch_transcript_query(count):
+    """One query with `count` aliased transcript fields: t0: transcript(id: $id0) … ."""
+    params = ", ".join(f"$id{i}: String!" for i in range(count))
+    fields = "".join(f"      t{i}: transcript(id: $id{i}) {{{TRANSCRIPT_FIELDS}      }}\n" for i in range(count))
+    return f"""
+    query GetTranscriptBodies({params}) {{
+{fields}    }}
 """
-    os.makedirs(os.path.dirname(filename), exist_ok=True)
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(content)
-    return ("SAVED", filename)
+
+
+class TranscriptBatcher:
+    """Hands out transcript ids in batches sized to keep each response near TARGET_BATCH_BYTES.
+
+    Starts with BATCH_START ids per request (capped at max_size) and resizes after every
+    response from its average bytes per transcript. A failed batch halves the size and caps it there.
+    """
+
+    def __init__(self, ids, max_size):
+        self._ids = list(ids)
+        self._lock = threading.Lock()
+        self.max_size = max(1, max_size)
+        self.size = min(BATCH_START, self.max_size)
+
+    def next_batch(self):
+        with self._lock:
+            batch, self._ids = self._ids[: self.size], self._ids[self.size :]
+            return batch
+
+    def record(self, count, nbytes):
+        if not count or not nbytes:
+            return
+        per_transcript = max(1, nbytes // count)
+        with self._lock:
+            self.size = max(1, min(self.max_size, TARGET_BATCH_BYTES // per_transcript))
+
+    def failed(self):
+        with self._lock:
+            self.size = max(1, self.size // 2)
+            self.max_size = self.size
+
+
+def fetch_batch(ids, config, batcher=None):
+    """Fetch several transcripts in one aliased query. Returns {id: transcript} for the ones that came back.
+
+    Ids missing from the answer (null alias, GraphQL error) are left out for the caller to fetch
+    singly; a failed request returns {} the same way and shrinks the batcher.
+    """
+    try:
+        data, errors, size = post_query(
+            batch_transcript_query(len(ids)), config, {f"id{i}": tid for i, tid in enumerate(ids)}
+        )
+    except APIError:
+        _count(config, "batch_failures")
+        if batcher:
+            batcher.failed()
+        return {}
+    _count(config, "batches")
+    found = {}
+    for i, tid in enumerate(ids):
+        m = data.get(f"t{i}")
+        if m:
+            found[tid] = m
+    if batcher:
+        batcher.record(len(found), size)
+    if errors and len(found) < len(ids):
+        _count(config, "batch_partial")
+    return found
+
+
+def write_transcript(filename, m, config):
+    """Stream frontmatter then sentences to a temp file and rename it into place.
+
+    Memory stays flat for all-day transcripts (no joined copies of the body), and an interrupted
+    write leaves only a hidden .tmp file, never a truncated transcript later skipped as EXISTING.
+    """
+    meta_date = datetime.fromtimestamp(m["date"] / 1000).strftime("%Y/%m/%d")
+    out_dir = os.path.dirname(filename)
+    os.makedirs(out_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=out_dir, prefix="." + os.path.basename(filename) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            frontmatter = format_frontmatter(
+                {
+                    "title": m["title"],
+                    "date": meta_date,
+                    "project": config.get("project") or None,
+                    "participants": m.get("participants") or [],
+                    "meeting_link": m["transcript_url"],
+                    "fireflies_id": m["id"],
+                    "source": "Fireflies",
+                    "tags": ["transcript", "fireflies", "meeting"],
+                },
+                inline=("tags",),
+            )
+            if not m.get("participants"):
+                # Transcripts without participants have always had a blank line under the key.
+                frontmatter = frontmatter.replace("\nparticipants:\n", "\nparticipants:\n\n", 1)
+            f.write(frontmatter)
+            f.write("\n# Raw Transcript\n\n")
+            for i, sentence in enumerate(m.get("sentences") or []):
+                if i:
+                    f.write("\n")
+                f.write(f"{sentence.get('speaker_name', '')}: {sentence.get('text', '')}")
+            f.write("\n")
+        set_final_mode(tmp_path, filename)
+        os.replace(tmp_path, filename)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
 
 def parse_date(date_str):
@@ -201,66 +630,221 @@ def dedup_transcripts(transcripts, priority_email, min_duration_min=5, time_buck
     return chosen, ignored
 
 
-def process_date(date_str, config, force=False):
-    """Fetch all transcripts for the given date; one file per logical meeting (dedup by title + 15min bucket)."""
-    dt = parse_date(date_str)
-    date_str = dt.strftime("%Y-%m-%d")
-    print(f"--- Processing {date_str} for account '{config['name']}' ---")
-    from_date = dt.replace(hour=0, minute=0, second=0, microsecond=0).strftime("%Y-%m-%dT%H:%M:%S.000Z")
-    to_date = dt.replace(hour=23, minute=59, second=59, microsecond=999000).strftime("%Y-%m-%dT%H:%M:%S.000Z")
-
-    query = """
-    query GetTranscripts($fromDate: DateTime, $toDate: DateTime, $limit: Int!, $skip: Int!) {
-      transcripts(fromDate: $fromDate, toDate: $toDate, limit: $limit, skip: $skip) {
-        id, title, date, organizer_email, duration, transcript_url
-      }
-    }
-    """
+TRANSCRIPTS_QUERY = """
+query GetTranscripts($fromDate: DateTime, $toDate: DateTime, $limit: Int!, $skip: Int!) {
+  transcripts(fromDate: $fromDate, toDate: $toDate, limit: $limit, skip: $skip) {
+    id, title, date, organizer_email, duration, transcript_url
+  }
+}
+"""
+
+
+def list_transcripts(config, from_dt, to_dt):
+    """List every transcript between two datetimes (inclusive) with one paginated query stream."""
+    from_date = from_dt.replace(hour=0, minute=0, second=0, microsecond=0).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    to_date = to_dt.replace(hour=23, minute=59, second=59, microsecond=999000).strftime("%Y-%m-%dT%H:%M:%S.000Z")
     # Fireflies caps transcripts() at 50 per request; paginate so busy days are complete.
     page_size = 50
+    cache = config.get("cache")
     transcripts = []
     skip = 0
     while True:
-        data = run_query(
-            query,
-            config,
-            {
-                "fromDate": from_date,
-                "toDate": to_date,
-                "limit": page_size,
-                "skip": skip,
-            },
-        )
-        batch = data.get("transcripts") or []
+        variables = {
+            "fromDate": from_date,
+            "toDate": to_date,
+            "limit": page_size,
+            "skip": skip,
+        }
+        batch = cache.get_listing(variables) if cache else None
+        if batch is None:
+            with profiling.phase("listing"):
+                data = run_query(TRANSCRIPTS_QUERY, config, variables)
+            batch = data.get("transcripts") or []
+            if cache:
+                cache.put_listing(variables, batch)
         transcripts.extend(batch)
         if len(batch) < page_size:
             break
         skip += page_size
+    return transcripts
 
-    chosen, ignored_short = dedup_transcripts(transcripts, config["email"])
-    summary = {"saved": [], "skipped": [], "ignored_short": ignored_short, "replaced": []}
 
+def state_dir(config):
+    """Per-account scratch state (checkpoints, last run) under .tmp/fireflies/<account>/."""
+    return os.path.join(REPO_ROOT, ".tmp", "fireflies", config["name"])
+
+
+def read_last_run(config):
+    """Last date (YYYY-MM-DD) fully synced for this account, or None."""
+    path = os.path.join(state_dir(config), "last_run")
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def record_last_run(config, start_str, end_str):
+    """Remember end_str as synced after a window start_str..end_str.
+
+    Never moves the marker backwards, and only moves it forward when the window adjoins or
+    overlaps the synced period (starts no later than the day after the marker), so a one-off
+    later day cannot make --since-last-run skip the gap before it.
+    """
+    last = read_last_run(config)
+    if last:
+        next_day = (datetime.strptime(last, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
+        if last >= end_str or start_str > next_day:
+            return
+    os.makedirs(state_dir(config), exist_ok=True)
+    path = os.path.join(state_dir(config), "last_run")
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        f.write(end_str + "\n")
+    os.replace(path + ".tmp", path)
+
+
+class BackfillCheckpoint:
+    """Transcript ids already handled for one process-range window; one id per line, append-only."""
+
+    def __init__(self, config, start_str, end_str):
+        self.path = os.path.join(state_dir(config), f"backfill_{start_str}_{end_str}.ids")
+        self._lock = threading.Lock()
+        self.done = set()
+        if os.path.isfile(self.path):
+            with open(self.path, encoding="utf-8") as f:
+                self.done = {line.strip() for line in f if line.strip()}
+
+    def mark(self, meeting_id):
+        with self._lock:
+            if meeting_id in self.done:
+                return
+            self.done.add(meeting_id)
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(meeting_id + "\n")
+
+    def clear(self):
+        if os.path.isfile(self.path):
+            os.remove(self.path)
+
+
+def sync_transcripts(chosen, config, force=False, jobs=1, checkpoint=None):
+    """Skip/replace/download the chosen transcripts. Returns the RESULTS summary dict (without ignored_short)."""
+    summary = {"saved": [], "skipped": [], "replaced": [], "resumed": [], "failed": []}
+    output_index = OutputDirIndex(config["output_dir"])
+    chosen_ids = {t["id"] for t in chosen}
+
+    to_fetch = []
     for target in chosen:
-        pattern = get_date_title_pattern(target["date"], target["title"], config["output_dir"])
-        existing_files = glob.glob(pattern)
-        if existing_files:
-            existing_path = existing_files[0]
-            existing_id = os.path.basename(existing_path).replace(".md", "").split("_")[-1]
-            if existing_id == target["id"] and not force:
-                summary["skipped"].append(existing_path)
+        if checkpoint is not None and target["id"] in checkpoint.done and not force:
+            summary["resumed"].append(target["id"])
+            continue
+        existing = output_index.existing(target["date"], target["title"])
+        same = [path for path, file_id in existing if file_id == target["id"]]
+        # Files of the same date + title that belong to another meeting chosen in this run stay put.
+        others = [path for path, file_id in existing if file_id != target["id"] and file_id not in chosen_ids]
+        if same and not force:
+            summary["skipped"].append(same[0])
+            if checkpoint is not None:
+                checkpoint.mark(target["id"])
+            continue
+        if not same and others:
+            os.remove(others[0])
+            discard_archives(others[0])
+            output_index.remove(others[0])
+            summary["replaced"].append(others[0])
+        to_fetch.append(target)
+
+    def done(target, result):
+        if checkpoint is not None:
+            checkpoint.mark(target["id"])
+        return result
+
+    def fetch(target):
+        """Download and save one transcript; a request that fails for good becomes a FAILED result."""
+        try:
+            return done(target, fetch_and_save(target["id"], config, force=force, listing=target))
+        except APIError as e:
+            print(f"Transcript {target['id']} failed: {e}", file=sys.stderr)
+            return ("FAILED", f"{target['id']} ({target['title']}): {str(e).splitlines()[0]}")
+
+    def fetch_batches(batcher):
+        """Worker loop for batched fetching: pull a batch, save what came back, fetch the rest singly."""
+        results = []
+        while True:
+            ids = batcher.next_batch()
+            if not ids:
+                return results
+            found = fetch_batch(ids, config, batcher) if len(ids) > 1 else {}
+            for tid in ids:
+                target = by_id[tid]
+                m = found.get(tid)
+                if m is None:
+                    if len(ids) > 1:
+                        _count(config, "batch_fallbacks")
+                    results.append(fetch(target))
+                    continue
+                _count(config, "downloads")
+                if cache:
+                    cache.put_transcript(tid, m, fingerprint(target))
+                results.append(done(target, save_transcript(m, config, force=force)))
+
+    before = dict(config.get("counters") or {})
+    cache = config.get("cache")
+    batch_size = config.get("batch_size", DEFAULT_BATCH_SIZE)
+    if batch_size > 1 and len(to_fetch) > 1:
+        # Cached bodies need no request; only the rest go through the batcher.
+        results = []
+        pending = []
+        for target in to_fetch:
+            m = cached_body(target["id"], config, target)
+            if m is None:
+                pending.append(target)
                 continue
-            if existing_id != target["id"]:
-                os.remove(existing_path)
-                summary["replaced"].append(existing_path)
-        result = fetch_and_save(target["id"], config, force=force)
+            _count(config, "cache_hits")
+            results.append(done(target, save_transcript(m, config, force=force)))
+        by_id = {t["id"]: t for t in pending}
+        batcher = TranscriptBatcher(by_id, batch_size)
+        workers = max(1, min(jobs, len(pending)))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for part in pool.map(fetch_batches, [batcher] * workers):
+                    results.extend(part)
+        else:
+            results.extend(fetch_batches(batcher))
+    elif jobs > 1 and len(to_fetch) > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(fetch, to_fetch))
+    else:
+        results = [fetch(target) for target in to_fetch]
+
+    for result in results:
         if result:
             kind, path = result
             if kind == "EXISTING":
                 summary["skipped"].append(path)
+            elif kind == "FAILED":
+                summary["failed"].append(path)
             else:
                 summary["saved"].append(path)
+    if config.get("cache"):
+        after = config.get("counters") or {}
+        for name in ("downloads", "cache_hits"):
+            summary[name] = after.get(name, 0) - before.get(name, 0)
+    return summary
 
-    print(f"\nRESULTS for {date_str}:")
+
+API_COUNTERS = ("requests", "retries", "throttled_seconds")
+
+
+def api_counters_since(config, before):
+    """requests / retries / throttled_seconds added to the account counters since `before`."""
+    after = config.get("counters") or {}
+    return {name: after.get(name, 0) - before.get(name, 0) for name in API_COUNTERS}
+
+
+def print_results(label, summary):
+    print(f"\nRESULTS for {label}:")
     print(f"  - New files saved: {len(summary['saved'])}")
     for s in summary["saved"]:
         print(f"    {s}")
@@ -269,37 +853,315 @@ def process_date(date_str, config, force=False):
         for r in summary["replaced"]:
             print(f"    {r}")
     print(f"  - Already exists: {len(summary['skipped'])}")
+    if summary.get("resumed"):
+        print(f"  - Done in earlier interrupted run (checkpoint): {len(summary['resumed'])}")
     print(f"  - Ignored (short): {len(summary['ignored_short'])}")
+    if summary.get("failed"):
+        print(f"  - Failed (retry with the same command): {len(summary['failed'])}")
+        for f in summary["failed"]:
+            print(f"    {f}")
+    if "downloads" in summary:
+        print(f"  - Transcript bodies: {summary['downloads']} downloaded, {summary['cache_hits']} from cache")
+    api = summary.get("api")
+    if api and api["requests"]:
+        print(
+            f"  - API requests: {api['requests']} ({api['retries']} retried, "
+            f"{api['throttled_seconds']:.1f}s waiting on rate limits/backoff)"
+        )
+
+
+def process_date(date_str, config, force=False, jobs=1, quiet=False):
+    """Fetch all transcripts for the given date; one file per logical meeting (dedup by title + 15min bucket).
+
+    With jobs > 1, downloads run on a bounded thread pool sharing one session and rate limiter.
+    quiet=True skips the progress and RESULTS output (sync-all prints one combined table).
+    """
+    dt = parse_date(date_str)
+    date_str = dt.strftime("%Y-%m-%d")
+    if not quiet:
+        print(f"--- Processing {date_str} for account '{config['name']}' ---")
+    before = dict(config.get("counters") or {})
+    transcripts = list_transcripts(config, dt, dt)
+
+    chosen, ignored_short = dedup_transcripts(transcripts, config["email"])
+    summary = sync_transcripts(chosen, config, force=force, jobs=jobs)
+    summary["ignored_short"] = ignored_short
+    summary["api"] = api_counters_since(config, before)
+    if not summary["failed"]:
+        record_last_run(config, date_str, date_str)
+    if not quiet:
+        print_results(date_str, summary)
+    return summary
+
+
+def process_range(start_str, end_str, config, force=False, jobs=1, quiet=False):
+    """Backfill every transcript from start_str to end_str (inclusive) with one listing and one dedup pass.
+
+    Progress is checkpointed under .tmp/fireflies/<account>/; re-running the same window after an
+    interruption skips transcripts already handled.
+    """
+    start_dt = parse_date(start_str)
+    end_dt = parse_date(end_str)
+    if end_dt < start_dt:
+        print(f"Invalid range: {start_str} is after {end_str}.", file=sys.stderr)
+        sys.exit(1)
+    start_str, end_str = start_dt.strftime("%Y-%m-%d"), end_dt.strftime("%Y-%m-%d")
+    if not quiet:
+        print(f"--- Processing {start_str} → {end_str} for account '{config['name']}' ---")
+    before = dict(config.get("counters") or {})
+    transcripts = list_transcripts(config, start_dt, end_dt)
+    if not quiet:
+        print(f"Listed {len(transcripts)} transcripts.")
+
+    chosen, ignored_short = dedup_transcripts(transcripts, config["email"])
+    checkpoint = BackfillCheckpoint(config, start_str, end_str)
+    if checkpoint.done and not quiet:
+        print(f"Resuming: {len(checkpoint.done)} transcripts already handled ({checkpoint.path}).")
+    summary = sync_transcripts(chosen, config, force=force, jobs=jobs, checkpoint=checkpoint)
+    summary["ignored_short"] = ignored_short
+    summary["api"] = api_counters_since(config, before)
+    if not summary["failed"]:
+        checkpoint.clear()
+        record_last_run(config, start_str, end_str)
+    if not quiet:
+        print_results(f"{start_str} → {end_str}", summary)
+    return summary
+
+
+def discover_accounts():
+    """Accounts with a non-empty FIREFLIES_API_KEY_<account> in the environment, sorted."""
+    prefix = "FIREFLIES_API_KEY_"
+    return sorted(
+        {key[len(prefix):].lower() for key, value in os.environ.items() if key.startswith(prefix) and value.strip()}
+    )
+
+
+def _sync_account(
+    account, start, end, since_last_run, force, jobs, use_cache, batch_size=DEFAULT_BATCH_SIZE, refresh=False
+):
+    """Sync one account for sync-all. Returns a result row; never exits the process."""
+    config = get_config(account)
+    row = {"account": account, "window": "", "summary": None, "error": "", "seconds": 0.0}
+    if not config["email"]:
+        row["error"] = f"missing EMAIL_{account}"
+        return row
+    if since_last_run:
+        start = read_last_run(config)
+        end = datetime.now().strftime("%Y-%m-%d")
+        if not start:
+            row["error"] = "no previous sync (run process-range once)"
+            return row
+    attach_http(config, pool_size=jobs)
+    attach_cache(config, enabled=use_cache)
+    config["batch_size"] = batch_size
+    config["refresh"] = refresh
+    row["window"] = start if start == end else f"{start} → {end}"
+    began = time.monotonic()
+    try:
+        if start == end:
+            row["summary"] = process_date(start, config, force=force, jobs=jobs, quiet=True)
+        else:
+            row["summary"] = process_range(start, end, config, force=force, jobs=jobs, quiet=True)
+    except SystemExit:
+        row["error"] = "failed (see errors above)"
+    except Exception as e:
+        row["error"] = f"failed: {type(e).__name__}: {e}"
+    row["seconds"] = time.monotonic() - began
+    return row
+
+
+def sync_all(
+    start=None,
+    end=None,
+    since_last_run=False,
+    force=False,
+    jobs=1,
+    use_cache=True,
+    batch_size=DEFAULT_BATCH_SIZE,
+    refresh=False,
+):
+    """Sync every configured account concurrently; each account keeps its own session and rate limit."""
+    accounts = discover_accounts()
+    if not accounts:
+        print("No Fireflies accounts configured (FIREFLIES_API_KEY_<account> in .env).", file=sys.stderr)
+        sys.exit(1)
+    today = datetime.now().strftime("%Y-%m-%d")
+    start = start or today
+    end = end or start
+    print(f"--- Syncing {len(accounts)} accounts: {', '.join(accounts)} ---")
+    began = time.monotonic()
+    with ThreadPoolExecutor(max_workers=len(accounts)) as pool:
+        rows = list(
+            pool.map(
+                lambda a: _sync_account(a, start, end, since_last_run, force, jobs, use_cache, batch_size, refresh),
+                accounts,
+            )
+        )
+    total = time.monotonic() - began
+
+    print("\nRESULTS (all accounts):")
+    print(f"  {'Account':<16} {'Window':<25} {'Saved':>5} {'Replaced':>8} {'Existing':>8} {'Short':>5} {'Time':>7}")
+    for row in rows:
+        summary = row["summary"]
+        if summary is None:
+            print(f"  {row['account']:<16} {row['window']:<25} {row['error']}")
+            continue
+        print(
+            f"  {row['account']:<16} {row['window']:<25} {len(summary['saved']):>5} "
+            f"{len(summary['replaced']):>8} {len(summary['skipped']) + len(summary['resumed']):>8} "
+            f"{len(summary['ignored_short']):>5} {row['seconds']:>6.1f}s"
+            + (f"  {len(summary['failed'])} failed" if summary["failed"] else "")
+        )
+    print(f"  Total wall-clock: {total:.1f}s")
+    for row in rows:
+        if row["summary"] and row["summary"]["saved"]:
+            print(f"\n  New files ({row['account']}):")
+            for path in row["summary"]["saved"]:
+                print(f"    {path}")
+        if row["summary"] and row["summary"]["failed"]:
+            print(f"\n  Failed ({row['account']}):")
+            for line in row["summary"]["failed"]:
+                print(f"    {line}")
+    return rows
+
+
+def _print_cache_stats(account, cache):
+    print(f"Fireflies cache for '{account}': {cache.cache_dir}")
+    for kind, row in cache.stats().items():
+        if not row["files"]:
+            print(f"  {kind:<12} empty")
+            continue
+        oldest = datetime.fromtimestamp(row["oldest"]).strftime("%Y-%m-%d")
+        newest = datetime.fromtimestamp(row["newest"]).strftime("%Y-%m-%d")
+        print(f"  {kind:<12} {row['files']} files, {row['bytes'] / 1e6:.1f} MB ({oldest} … {newest})")
 
 
 def main():
-    mode = sys.argv[1] if len(sys.argv) > 1 else None
-    val = sys.argv[2] if len(sys.argv) > 2 else None
-    rest = [a for a in sys.argv[3:] if a != "--force"]
-    account = (rest[0] if rest else "personal").lower()
-    force = "--force" in sys.argv
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--force", action="store_true", help="Re-write files even when the path and transcript id match")
+    common.add_argument(
+        "--refresh", action="store_true", help="Re-download transcript bodies even when the cached copy is current"
+    )
+    common.add_argument("--jobs", type=int, default=1, help="Concurrent downloads (default 1)")
+    common.add_argument("--no-cache", action="store_true", help="Bypass the .tmp/ response cache")
+    common.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        metavar="N",
+        help=f"Up to N transcripts per API request (default {DEFAULT_BATCH_SIZE}; 1 = one request each)",
+    )
+    profiling.add_profile_argument(common)
+
+    parser = argparse.ArgumentParser(description="Fetch Fireflies transcripts into Transcripts/Fireflies/<account>/")
+    sub = parser.add_subparsers(dest="mode")
+    date_p = sub.add_parser("process-date", parents=[common], help="Fetch every transcript for one day")
+    date_p.add_argument("date", nargs="?", help="YYYY-MM-DD")
+    date_p.add_argument("account", nargs="?", default="personal")
+    range_p = sub.add_parser("process-range", parents=[common], help="Backfill every transcript in a date window")
+    range_p.add_argument("args", nargs="*", metavar="START END ACCOUNT", help="START END [account], or [account] with --since-last-run")
+    range_p.add_argument("--since-last-run", action="store_true", help="From the last synced date through today")
+    all_p = sub.add_parser("sync-all", parents=[common], help="Sync every FIREFLIES_API_KEY_<account> concurrently")
+    all_p.add_argument("start", nargs="?", help="YYYY-MM-DD (default: today)")
+    all_p.add_argument("end", nargs="?", help="YYYY-MM-DD (default: START)")
+    all_p.add_argument("--since-last-run", action="store_true", help="Each account from its last synced date through today")
+    fetch_p = sub.add_parser("fetch", parents=[common], help="Fetch a single transcript by id")
+    fetch_p.add_argument("transcript_id", nargs="?")
+    fetch_p.add_argument("account", nargs="?", default="personal")
+    cache_p = sub.add_parser("cache", help="Inspect or prune the local response cache")
+    cache_p.add_argument("action", choices=["stats", "prune"])
+    cache_p.add_argument("account", nargs="?", help="Account (default: every configured account)")
+    cache_p.add_argument("--older-than", type=float, default=None, metavar="DAYS", help="prune: drop entries older than DAYS")
+    profiling.add_profile_argument(cache_p)
+    args = parser.parse_args()
+    profiling.start("fireflies_collection", getattr(args, "profile", None))
+
+    if not args.mode:
+        print(
+            "Usage: process-date YYYY-MM-DD <account> [--force] [--jobs N]  |  "
+            "process-range START END <account> [--since-last-run] [--force] [--jobs N]  |  "
+            "sync-all [START [END]] [--since-last-run] [--jobs N]  |  "
+            "fetch <transcript_id> <account> [--force]  |  cache stats|prune [<account>] [--older-than DAYS]",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    if args.mode == "cache":
+        if args.action == "prune" and args.older_than is None:
+            print("Usage: python scripts/fireflies_collection.py cache prune [<account>] --older-than DAYS", file=sys.stderr)
+            sys.exit(1)
+        for account in [args.account.lower()] if args.account else discover_accounts():
+            config = attach_cache(get_config(account))
+            if args.action == "stats":
+                _print_cache_stats(account, config["cache"])
+            else:
+                files, size = config["cache"].prune(args.older_than)
+                print(f"Pruned {files} cache files ({size / 1e6:.1f} MB) for '{account}'.")
+        return
+    jobs = max(1, args.jobs)
+    if args.mode == "sync-all":
+        sync_all(
+            args.start,
+            args.end,
+            args.since_last_run,
+            force=args.force,
+            jobs=jobs,
+            use_cache=not args.no_cache,
+            refresh=args.refresh,
+            batch_size=args.batch_size,
+        )
+        return
+    if args.mode == "process-range":
+        range_args = args.args
+        if args.since_last_run and len(range_args) <= 1:
+            args.account = range_args[0] if range_args else "personal"
+        elif not args.since_last_run and len(range_args) in (2, 3):
+            args.account = range_args[2] if len(range_args) == 3 else "personal"
+        else:
+            print("Usage: python scripts/fireflies_collection.py process-range START END <account> [--force] [--jobs N]", file=sys.stderr)
+            print("       python scripts/fireflies_collection.py process-range --since-last-run <account>", file=sys.stderr)
+            sys.exit(1)
+    account = args.account.lower()
     config = get_config(account)
     validate_config(config, account)
-    if mode == "process-date":
-        if not val:
-            print("Usage: python scripts/fireflies_collection.py process-date YYYY-MM-DD <account> [--force]", file=sys.stderr)
+    attach_http(config, pool_size=jobs)
+    attach_cache(config, enabled=not args.no_cache)
+    config["batch_size"] = args.batch_size
+    config["refresh"] = args.refresh
+    if args.mode == "process-date":
+        if not args.date:
+            print("Usage: python scripts/fireflies_collection.py process-date YYYY-MM-DD <account> [--force] [--jobs N]", file=sys.stderr)
             print("Example: python scripts/fireflies_collection.py process-date 2026-02-17 personal", file=sys.stderr)
             sys.exit(1)
-        process_date(val, config, force=force)
-    elif mode == "fetch":
-        if not val:
+        summary = process_date(args.date, config, force=args.force, jobs=jobs)
+        if summary["failed"]:
+            sys.exit(1)
+    elif args.mode == "process-range":
+        if args.since_last_run:
+            start = read_last_run(config)
+            if not start:
+                print(
+                    f"No previous sync recorded for account '{account}'. Run process-range START END once first.",
+                    file=sys.stderr,
+                )
+                sys.exit(1)
+            end = datetime.now().strftime("%Y-%m-%d")
+        else:
+            start, end = args.args[0], args.args[1]
+        summary = process_range(start, end, config, force=args.force, jobs=jobs)
+        if summary["failed"]:
+            sys.exit(1)
+    elif args.mode == "fetch":
+        if not args.transcript_id:
             print("Usage: python scripts/fireflies_collection.py fetch <transcript_id> <account> [--force]", file=sys.stderr)
             sys.exit(1)
-        result = fetch_and_save(val, config, force=force)
+        try:
+            result = fetch_and_save(args.transcript_id, config, force=args.force)
+        except APIError as e:
+            print(e, file=sys.stderr)
+            sys.exit(1)
         if result:
             kind, path = result
             print(f"{kind}: {path}")
-    else:
-        print(
-            "Usage: process-date YYYY-MM-DD <account> [--force]  |  fetch <transcript_id> <account> [--force]",
-            file=sys.stderr,
-        )
-        sys.exit(1)
 
 
 if __name__ == "__main__":
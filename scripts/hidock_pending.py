@@ -3,97 +3,67 @@
 List HiDock transcripts in Transcripts/HiDock/ that have no meeting note yet.
 
 Pending = no Meetings/**/*.md references the transcript (by signature, basename, or wikilink).
+Transcript frontmatter and meeting-note references come from the shared vault index
+(.tmp/vault_index.sqlite3), so only files changed since the last run are re-read. When
+lexicon_watch.py is running, answers come from it (--no-daemon to scan anyway).
 
 Usage:
   python scripts/hidock_pending.py list
   python scripts/hidock_pending.py list --json
+  python scripts/hidock_pending.py list --workers 0                (parallel cold scan)
+  python scripts/hidock_pending.py who-references <transcript>   (vault-relative path, basename, signature or short id)
 """
 from __future__ import annotations
 
 import argparse
 import json
 import os
-import re
 import sys
 
+import lexicon_watch
+from lexicon_core import profiling
+from lexicon_core.frontmatter import read_frontmatter
+from vault_index import VaultIndex, add_workers_argument
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 REPO_ROOT = os.path.join(SCRIPT_DIR, "..")
 HIDOCK_DIR = os.path.join(REPO_ROOT, "Transcripts", "HiDock")
 MEETINGS_DIR = os.path.join(REPO_ROOT, "Meetings")
 
-FRONTMATTER_RE = re.compile(r"^---\r?\n(.*?)\r?\n---", re.DOTALL)
-SIGNATURE_RE = re.compile(r"^signature:\s*['\"]?(\S+?)['\"]?\s*$", re.MULTILINE)
-TITLE_RE = re.compile(r"^title:\s*(.+)$", re.MULTILINE)
-DATE_RE = re.compile(r"^date:\s*['\"]?(\S+?)['\"]?\s*$", re.MULTILINE)
-HIDOCK_SIG_FM_RE = re.compile(r"^hidock_signature:\s*['\"]?(\S+?)['\"]?\s*$", re.MULTILINE)
-HIDOCK_PATH_RE = re.compile(r"Transcripts/HiDock/([^\]\s\)\|\"']+)", re.IGNORECASE)
-
-
-def _read_frontmatter(path: str) -> str:
-    with open(path, encoding="utf-8") as f:
-        head = f.read(8192)
-    match = FRONTMATTER_RE.match(head)
-    return match.group(1) if match else ""
+HIDOCK_DIR_REL = "Transcripts/HiDock"
 
 
-def _parse_transcript(path: str) -> dict | None:
-    fm = _read_frontmatter(path)
-    sig_match = SIGNATURE_RE.search(fm)
-    if not sig_match:
+def _transcript_meta(rel: str, fm: dict) -> dict | None:
+    signature = str(fm.get("signature") or "").strip()
+    if not signature:
         return None
-    signature = sig_match.group(1).strip()
-    basename = os.path.basename(path)
+    basename = rel.rsplit("/", 1)[-1]
     stem = basename[:-3] if basename.endswith(".md") else basename
     short_id = stem.rsplit("_", 1)[-1] if "_" in stem else ""
-    title_match = TITLE_RE.search(fm)
-    date_match = DATE_RE.search(fm)
-    title = (title_match.group(1).strip().strip('"').strip("'") if title_match else stem)
-    date_raw = date_match.group(1).strip() if date_match else ""
-    rel = os.path.relpath(path, REPO_ROOT).replace(os.sep, "/")
+    title = fm.get("title") or stem
+    date_raw = str(fm.get("date") or "").strip()
     return {
         "path": rel,
         "basename": basename,
         "stem": stem,
         "signature": signature,
         "short_id": short_id,
-        "title": title,
+        "title": title if isinstance(title, str) else stem,
         "date": date_raw.replace("/", "-") if date_raw else "",
     }
 
 
-def _collect_summarized_keys() -> set[str]:
-    keys: set[str] = set()
-    if not os.path.isdir(MEETINGS_DIR):
-        return keys
-
-    for root, _dirs, files in os.walk(MEETINGS_DIR):
-        for name in files:
-            if not name.endswith(".md"):
-                continue
-            path = os.path.join(root, name)
-            try:
-                with open(path, encoding="utf-8") as f:
-                    text = f.read()
-            except OSError:
-                continue
-
-            fm = _read_frontmatter(path)
-            for match in HIDOCK_SIG_FM_RE.finditer(fm):
-                keys.add(match.group(1).strip().lower())
+def _parse_transcript(path: str) -> dict | None:
+    rel = os.path.relpath(path, REPO_ROOT).replace(os.sep, "/")
+    return _transcript_meta(rel, read_frontmatter(path))
 
-            for match in HIDOCK_PATH_RE.finditer(text):
-                ref = match.group(1).strip().rstrip("/")
-                keys.add(ref.lower())
-                if ref.endswith(".md"):
-                    ref = ref[:-3]
-                keys.add(ref.lower())
-                if "_" in ref:
-                    keys.add(ref.rsplit("_", 1)[-1].lower())
 
-    return keys
+def _collect_summarized_keys(index: VaultIndex) -> set[str]:
+    index.refresh(("Meetings",))
+    return index.hidock_ref_keys()
 
 
-def _is_summarized(meta: dict, summarized_keys: set[str]) -> bool:
+def _candidate_keys(meta: dict) -> set[str]:
     candidates = {
         meta["signature"].lower(),
         meta["basename"].lower(),
@@ -103,21 +73,24 @@ def _is_summarized(meta: dict, summarized_keys: set[str]) -> bool:
     }
     if len(meta["signature"]) >= 8:
         candidates.add(meta["signature"][:8].lower())
-    return bool(candidates & summarized_keys)
+    return candidates
+
 
+def _is_summarized(meta: dict, summarized_keys: set[str]) -> bool:
+    return bool(_candidate_keys(meta) & summarized_keys)
 
-def list_pending() -> list[dict]:
+
+def list_pending(index: VaultIndex | None = None) -> list[dict]:
     if not os.path.isdir(HIDOCK_DIR):
         return []
 
-    summarized_keys = _collect_summarized_keys()
+    index = index if index is not None else VaultIndex(REPO_ROOT)
+    summarized_keys = _collect_summarized_keys(index)
+    index.refresh((HIDOCK_DIR_REL,))
     pending: list[dict] = []
 
-    for name in sorted(os.listdir(HIDOCK_DIR)):
-        if not name.endswith(".md"):
-            continue
-        path = os.path.join(HIDOCK_DIR, name)
-        meta = _parse_transcript(path)
+    for row in index.files("dir = ?", (HIDOCK_DIR_REL,)):
+        meta = _transcript_meta(row["path"], row["frontmatter"])
         if meta is None:
             continue
         if not _is_summarized(meta, summarized_keys):
@@ -127,14 +100,87 @@ def list_pending() -> list[dict]:
     return pending
 
 
+def _vault_path(ref: str) -> str:
+    """A path argument as given if absolute, else relative to the vault root."""
+    return ref if os.path.isabs(ref) else os.path.join(REPO_ROOT, ref)
+
+
+def _is_note_file(path: str) -> bool:
+    """path or path.md is a file (links often leave off the extension)."""
+    return os.path.isfile(path) or os.path.isfile(path + ".md")
+
+
+def _resolve_transcript(ref: str, index: VaultIndex) -> dict | None:
+    """Find a HiDock transcript by path (absolute or vault-relative), basename, stem, signature or short id."""
+    given = _vault_path(ref)
+    for path in (given, given + ".md", os.path.join(HIDOCK_DIR, ref), os.path.join(HIDOCK_DIR, ref + ".md")):
+        if os.path.isfile(path):
+            return _parse_transcript(path)
+    index.refresh((HIDOCK_DIR_REL,))
+    needle = ref.strip().lower()
+    for row in index.files("dir = ?", (HIDOCK_DIR_REL,)):
+        meta = _transcript_meta(row["path"], row["frontmatter"])
+        if meta and needle in (meta["signature"].lower(), meta["stem"].lower(), meta["short_id"].lower()):
+            return meta
+    return None
+
+
+def who_references(ref: str, index: VaultIndex | None = None) -> list[str]:
+    """Meeting notes (repo-relative paths) that reference the given transcript."""
+    index = index if index is not None else VaultIndex(REPO_ROOT)
+    index.refresh(("Meetings",))
+    meta = _resolve_transcript(ref, index)
+    if meta:
+        keys = _candidate_keys(meta)
+    else:
+        # A transcript that is gone: match the reference itself, without a Transcripts/HiDock/ prefix.
+        needle = os.path.relpath(_vault_path(ref.strip()), REPO_ROOT).replace(os.sep, "/").lower()
+        prefix = HIDOCK_DIR_REL.lower() + "/"
+        needle = needle[len(prefix) :] if needle.startswith(prefix) else needle
+        keys = {ref.strip().lower(), needle, needle[:-3] if needle.endswith(".md") else needle}
+    return index.hidock_referrers(keys)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="List HiDock transcripts pending summarize")
     sub = parser.add_subparsers(dest="command", required=True)
     list_p = sub.add_parser("list", help="List transcripts without a meeting note")
     list_p.add_argument("--json", action="store_true", help="Print JSON array")
+    add_workers_argument(list_p)
+    list_p.add_argument("--no-daemon", action="store_true", help="Scan even if lexicon_watch.py is running")
+    profiling.add_profile_argument(list_p)
+    who_p = sub.add_parser("who-references", help="List meeting notes that reference a transcript")
+    who_p.add_argument("transcript", help="Transcript path, basename, signature or short id")
+    who_p.add_argument("--json", action="store_true", help="Print JSON array")
+    who_p.add_argument("--no-daemon", action="store_true", help="Scan even if lexicon_watch.py is running")
+    profiling.add_profile_argument(who_p)
     args = parser.parse_args()
+    profiling.start("hidock_pending", args.profile)
+
+    if args.command == "who-references":
+        ref = args.transcript
+        if not _is_note_file(_vault_path(ref)) and _is_note_file(ref):
+            # A path relative to the current directory rather than the vault root.
+            args.transcript = os.path.abspath(ref)
+        with profiling.phase("daemon query"):
+            notes = None if args.no_daemon else lexicon_watch.query("who_references", transcript=args.transcript)
+        if notes is None:
+            with profiling.phase("who-references"), VaultIndex(REPO_ROOT) as index:
+                notes = who_references(args.transcript, index)
+        if args.json:
+            print(json.dumps(notes, indent=2))
+        elif not notes:
+            print(f"No meeting note references {args.transcript}.")
+        else:
+            for note in notes:
+                print(note)
+        return
 
-    pending = list_pending()
+    with profiling.phase("daemon query"):
+        pending = None if args.no_daemon else lexicon_watch.query("hidock_pending")
+    if pending is None:
+        with profiling.phase("pending scan"), VaultIndex(REPO_ROOT, workers=args.workers) as index:
+            pending = list_pending(index)
     if args.json:
         print(json.dumps(pending, indent=2))
         return
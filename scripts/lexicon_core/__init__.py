@@ -0,0 +1,9 @@
+"""Shared building blocks for the Lexicon scripts (imported with scripts/ on sys.path)."""
+from lexicon_core.frontmatter import (
+    format_frontmatter,
+    parse_frontmatter,
+    read_frontmatter,
+    read_frontmatter_block,
+)
+
+__all__ = ["format_frontmatter", "parse_frontmatter", "read_frontmatter", "read_frontmatter_block"]
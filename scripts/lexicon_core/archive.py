@@ -0,0 +1,135 @@
+"""
+Compressed cold storage for raw transcripts.
+
+An archived transcript keeps its path: <name>.md becomes a small stub (the original frontmatter plus
+`archived: <name>.md.gz`) and the full original file sits next to it as <name>.md.gz or .md.xz.
+Frontmatter readers (vault index, hidock_pending, the Fireflies existing-file check) see the stub
+unchanged; body readers call read_text(), which returns the original file for a stub.
+"""
+from __future__ import annotations
+
+import gzip
+import lzma
+import os
+import stat
+import tempfile
+
+from lexicon_core.files import set_final_mode
+from lexicon_core.frontmatter import FRONTMATTER_RE, MAX_FRONTMATTER_CHARS, parse_frontmatter
+
+ARCHIVE_KEY = "archived"
+FORMATS = {"gz": (".gz", gzip.open), "xz": (".xz", lzma.open)}
+STUB_BODY = (
+    "\n# Raw Transcript\n\n"
+    "_Archived: the full transcript is compressed in `{name}`. Search reads it as usual; "
+    "`python scripts/transcript_archive.py cat <this file>` prints it._\n"
+)
+
+
+def _opener(name: str):
+    for suffix, opener in FORMATS.values():
+        if name.endswith(suffix):
+            return opener
+    return None
+
+
+def archive_name(text: str) -> str | None:
+    """Compressed sibling named by a stub's frontmatter, or None for a live file."""
+    if f"\n{ARCHIVE_KEY}:" not in text[:MAX_FRONTMATTER_CHARS]:
+        return None
+    name = parse_frontmatter(text).get(ARCHIVE_KEY)
+    if not isinstance(name, str) or os.path.basename(name) != name or _opener(name) is None:
+        return None
+    return name
+
+
+def read_archive_bytes(path: str, name: str) -> bytes:
+    with _opener(name)(os.path.join(os.path.dirname(path), name), "rb") as f:
+        return f.read()
+
+
+def read_text(path: str) -> str:
+    """Text of a Markdown file, decompressing the original when the file is an archive stub."""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        text = f.read()
+    name = archive_name(text)
+    if name is None:
+        return text
+    try:
+        return read_archive_bytes(path, name).decode("utf-8", errors="replace")
+    except (OSError, EOFError, lzma.LZMAError):
+        return text
+
+
+def make_stub(text: str, name: str) -> str:
+    """The original frontmatter with `archived: name` added, and a short pointer as the body."""
+    m = FRONTMATTER_RE.match(text)
+    if m:
+        head = text[: m.end(1)] + f"\n{ARCHIVE_KEY}: {name}" + text[m.end(1) : m.end()] + "\n"
+    else:
+        head = f"---\n{ARCHIVE_KEY}: {name}\n---\n"
+    return head + STUB_BODY.format(name=name)
+
+
+def _write_atomic(path: str, data: bytes, opener=open, mode: int | None = None) -> None:
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix="." + os.path.basename(path) + ".", suffix=".tmp")
+    os.close(fd)
+    try:
+        with opener(tmp_path, "wb") as f:
+            f.write(data)
+        set_final_mode(tmp_path, path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def archive_file(path: str, fmt: str = "gz") -> tuple[int, int] | None:
+    """Compress path next to itself and replace it with a stub. Returns (original, on-disk bytes).
+
+    Returns None when path is already a stub. The compressed copy is read back and compared
+    before the stub replaces the original; mtime is kept so date fallbacks do not move, and both
+    files get the original's permissions so a private transcript stays private in cold storage.
+    """
+    suffix, opener = FORMATS[fmt]
+    with open(path, "rb") as f:
+        data = f.read()
+    text = data.decode("utf-8", errors="replace")
+    if archive_name(text) is not None:
+        return None
+    st = os.stat(path)
+    name = os.path.basename(path) + suffix
+    archive_path = os.path.join(os.path.dirname(path), name)
+    mode = stat.S_IMODE(st.st_mode)
+    _write_atomic(archive_path, data, opener, mode)
+    if read_archive_bytes(path, name) != data:
+        os.remove(archive_path)
+        raise OSError(f"compressed copy of {path} does not match the original")
+    stub = make_stub(text, name).encode("utf-8")
+    _write_atomic(path, stub, mode=mode)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    return len(data), len(stub) + os.path.getsize(archive_path)
+
+
+def restore_file(path: str) -> bool:
+    """Put the original back in place of a stub and delete the compressed copy. False if not a stub."""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        name = archive_name(f.read())
+    if name is None:
+        return False
+    st = os.stat(path)
+    _write_atomic(path, read_archive_bytes(path, name))
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.remove(os.path.join(os.path.dirname(path), name))
+    return True
+
+
+def discard_archives(path: str) -> None:
+    """Delete compressed copies of path (after it was overwritten or removed)."""
+    for suffix, _opener in FORMATS.values():
+        try:
+            os.remove(path + suffix)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,31 @@
+"""
+Permissions for files written through a temp file and os.replace.
+
+tempfile.mkstemp creates its file 0600, and the rename keeps that mode, so a vault file written
+that way would become owner-only. set_final_mode gives the temp file the mode a plain open()
+would have produced: the replaced file's mode, else 0666 minus the process umask. Callers that
+derive a new file from an existing one (an archive of a transcript) pass that file's mode instead.
+"""
+from __future__ import annotations
+
+import os
+import stat
+
+
+def _umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+NEW_FILE_MODE = 0o666 & ~_umask()
+
+
+def set_final_mode(tmp_path: str, target: str, mode: int | None = None) -> None:
+    """chmod tmp_path to mode if given, else target's current mode, else NEW_FILE_MODE."""
+    if mode is None:
+        try:
+            mode = stat.S_IMODE(os.stat(target).st_mode)
+        except FileNotFoundError:
+            mode = NEW_FILE_MODE
+    os.chmod(tmp_path, mode)
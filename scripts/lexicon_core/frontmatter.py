@@ -0,0 +1,150 @@
+"""
+YAML-ish frontmatter used across the vault: one parser, one reader, one writer.
+
+parse_frontmatter understands the subset the vault uses: `key: value`, quoted values,
+block lists (`key:` then `  - item`), inline lists (`[a, b]`), comments and CRLF files.
+It is a single pass over the fenced block: the common `---\\n` / `---\\r\\n` opening is located
+with str.find, and only unusual openings fall back to FRONTMATTER_RE.
+
+read_frontmatter_block reads a file only up to the closing fence.
+format_frontmatter renders the blocks written by fireflies_collection and manual_ingest.
+"""
+from __future__ import annotations
+
+import re
+
+FRONTMATTER_RE = re.compile(r"^---\s*\r?\n(.*?)\r?\n---", re.DOTALL)
+# Give up on a frontmatter block that has not closed after this many characters.
+MAX_FRONTMATTER_CHARS = 65536
+READ_CHUNK = 4096
+
+
+def _block(content: str) -> str | None:
+    """Text between the fences, exactly as FRONTMATTER_RE's group 1, or None."""
+    if content.startswith("---\n"):
+        start = 4
+    elif content.startswith("---\r\n"):
+        start = 5
+    else:
+        start = 0
+    if start and not content[start : start + 1].isspace():
+        end = content.find("\n---", start)
+        if end < 0:
+            return None
+        if end > start and content[end - 1] == "\r":
+            end -= 1
+        return content[start:end]
+    # Blank lines or trailing spaces after the opening fence: let the regex decide.
+    m = FRONTMATTER_RE.match(content)
+    return m.group(1) if m else None
+
+
+def _unquote(val: str) -> str:
+    return val.strip('"').strip("'")
+
+
+def parse_frontmatter(content: str) -> dict:
+    """Frontmatter of a Markdown document as {key: str | list[str]}; {} when there is none."""
+    block = _block(content)
+    if block is None:
+        return {}
+    result: dict = {}
+    current_key = None
+    list_items: list[str] = []
+
+    for line in block.split("\n"):
+        stripped = line.strip()
+        if not stripped:
+            continue
+        first = stripped[0]
+        if first == "#":
+            continue
+        if first == "-" and stripped[1:2] == " ":
+            if current_key:
+                list_items.append(_unquote(stripped[2:].strip()))
+            continue
+        if list_items and current_key:
+            result[current_key] = list_items
+            list_items = []
+        key, sep, val = stripped.partition(":")
+        if not sep:
+            continue
+        key = key.strip()
+        val = _unquote(val.strip())
+        current_key = key
+        if val and val not in ("|", ">", "'"):
+            if val[0] == "[" and val[-1] == "]":
+                inner = val[1:-1].strip()
+                result[key] = [_unquote(v.strip()) for v in inner.split(",") if v.strip()] if inner else []
+            else:
+                result[key] = val
+        elif val in ("", "|"):
+            list_items = []
+
+    if list_items and current_key:
+        result[current_key] = list_items
+    return result
+
+
+def read_frontmatter_block(path: str) -> str:
+    """The leading ----fenced block (fences included), read only up to the closing fence.
+
+    Returns '' when the file has no frontmatter. Reads in READ_CHUNK pieces, so a typical note
+    costs one small read however long its body is.
+    """
+    with open(path, encoding="utf-8", errors="replace") as f:
+        text = f.read(READ_CHUNK)
+        first_end = text.find("\n")
+        while first_end < 0 and "---".startswith(text[:3]) and len(text) <= MAX_FRONTMATTER_CHARS:
+            more = f.read(READ_CHUNK)
+            if not more:
+                break
+            text += more
+            first_end = text.find("\n")
+        if first_end < 0 or text[:first_end].rstrip() != "---":
+            return ""
+        while True:
+            close = text.find("\n---", first_end)
+            if close >= 0:
+                line_end = text.find("\n", close + 1)
+                if line_end >= 0:
+                    return text[: line_end + 1]
+            if len(text) > MAX_FRONTMATTER_CHARS:
+                return ""
+            more = f.read(READ_CHUNK)
+            if not more:
+                return text if close >= 0 else ""
+            text += more
+
+
+def read_frontmatter(path: str) -> dict:
+    """parse_frontmatter for a file, reading no further than its closing fence."""
+    return parse_frontmatter(read_frontmatter_block(path))
+
+
+def _quote(val) -> str:
+    return '"' + str(val).replace('"', '\\"') + '"'
+
+
+def format_frontmatter(fields: dict, quoted=(), inline=()) -> str:
+    """Render fields (in order) as a `---` block ending in a newline.
+
+    List values become block lists (`key:` + `  - item`) unless the key is in `inline`
+    (`key: [a, b]`). Keys in `quoted` get double-quoted scalar values. None values are skipped.
+    """
+    lines = ["---"]
+    for key, val in fields.items():
+        if val is None:
+            continue
+        if isinstance(val, (list, tuple)):
+            if key in inline:
+                lines.append(f"{key}: [{', '.join(str(v) for v in val)}]")
+            else:
+                lines.append(f"{key}:")
+                lines.extend(f"  - {v}" for v in val)
+        elif key in quoted:
+            lines.append(f"{key}: {_quote(val)}")
+        else:
+            lines.append(f"{key}: {val}")
+    lines.append("---")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,139 @@
+"""
+Opt-in per-phase timings and counters for the Lexicon scripts.
+
+A script calls start() once (after parsing --profile / --profile-json, see add_profile_argument);
+LEXICON_PROFILE=1 (or =json) turns it on without the flag. Code marks phases with
+`with phase("walk"):` and bumps counters with count("files scanned", n); both return at once
+when profiling is off. At exit the run is printed as a table on stderr, or appended as one JSON
+line to .tmp/profile.jsonl.
+
+Phase times are wall-clock summed over calls (and over threads, so phases run concurrently can add
+up to more than the run). Work in worker processes is timed by the phase around the pool, but
+counters bumped inside the workers are not collected.
+"""
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+ENV_VAR = "LEXICON_PROFILE"
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+LOG_PATH = os.path.join(REPO_ROOT, ".tmp", "profile.jsonl")
+
+_lock = threading.Lock()
+_run = {"script": None, "format": None, "started": 0.0, "started_at": ""}
+_phases: dict[str, list] = {}  # name -> [calls, seconds], in first-seen order
+_counters: dict[str, float] = {}
+
+
+def enabled() -> bool:
+    return _run["format"] is not None
+
+
+@contextmanager
+def phase(name: str):
+    """Time the enclosed block under `name`."""
+    if _run["format"] is None:
+        yield
+        return
+    start_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start_at
+        with _lock:
+            entry = _phases.setdefault(name, [0, 0.0])
+            entry[0] += 1
+            entry[1] += elapsed
+
+
+def count(name: str, n: float = 1) -> None:
+    if _run["format"] is None:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def add_profile_argument(parser) -> None:
+    parser.add_argument(
+        "--profile",
+        action="store_const",
+        const="table",
+        default=None,
+        help=f"Print per-phase timings and counters to stderr at exit (or set {ENV_VAR}=1)",
+    )
+    parser.add_argument(
+        "--profile-json",
+        dest="profile",
+        action="store_const",
+        const="json",
+        help=f"Append per-phase timings and counters to .tmp/profile.jsonl (or set {ENV_VAR}=json)",
+    )
+
+
+def _env_format() -> str | None:
+    val = os.environ.get(ENV_VAR, "").strip().lower()
+    if val in ("", "0", "false", "no", "off"):
+        return None
+    return "json" if val == "json" else "table"
+
+
+def start(script: str, fmt: str | None = None) -> None:
+    """Enable profiling for this run when fmt ("table"/"json", from the flags) or LEXICON_PROFILE asks."""
+    fmt = fmt or _env_format()
+    if fmt is None or _run["format"] is not None:
+        return
+    _run.update(
+        script=script,
+        format=fmt,
+        started=time.perf_counter(),
+        started_at=datetime.now().isoformat(timespec="seconds"),
+    )
+    atexit.register(report)
+
+
+def snapshot() -> dict:
+    with _lock:
+        return {
+            "script": _run["script"],
+            "argv": sys.argv[1:],
+            "started_at": _run["started_at"],
+            "wall_seconds": round(time.perf_counter() - _run["started"], 6),
+            "phases": {name: {"calls": calls, "seconds": round(secs, 6)} for name, (calls, secs) in _phases.items()},
+            "counters": dict(_counters),
+        }
+
+
+def format_table(data: dict) -> str:
+    lines = [f"profile: {data['script']} — {data['wall_seconds'] * 1000:.1f} ms wall"]
+    if data["phases"]:
+        lines.append(f"  {'phase':<28} {'calls':>7} {'ms':>10}")
+        for name, row in data["phases"].items():
+            lines.append(f"  {name:<28} {row['calls']:>7} {row['seconds'] * 1000:>10.1f}")
+    if data["counters"]:
+        lines.append(f"  {'counter':<28} {'value':>18}")
+        for name, val in data["counters"].items():
+            lines.append(f"  {name:<28} {val:>18,}" if isinstance(val, int) else f"  {name:<28} {val:>18,.3f}")
+    return "\n".join(lines)
+
+
+def report() -> None:
+    """Emit the run (registered with atexit by start(), so it also runs after sys.exit)."""
+    if _run["format"] is None:
+        return
+    data = snapshot()
+    if _run["format"] == "json":
+        try:
+            os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
+            with open(LOG_PATH, "a", encoding="utf-8") as f:
+                f.write(json.dumps(data) + "\n")
+        except OSError as e:
+            print(f"profile: could not write {LOG_PATH}: {e}", file=sys.stderr)
+        return
+    print(format_table(data), file=sys.stderr)
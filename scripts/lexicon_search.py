@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Ranked full-text search over Memory/, People/, Meetings/ and Transcripts/.
+
+Replaces repeated `rg` sweeps with a persistent SQLite FTS5 index in .tmp/lexicon_search.sqlite3.
+Each search first re-reads only files whose mtime/size changed (skip with --no-refresh), then
+ranks matches with BM25 (title weighted over body). Results follow the search priority in
+.cursor/rules/search.mdc — Memory → People → Meetings → Transcripts, BM25 within a layer —
+unless --mixed ranks everything together.
+
+Query syntax: words are ANDed, "quoted phrases" match exactly, word* is a prefix match.
+--raw passes the query to FTS5 unchanged (OR, NOT, NEAR(...)).
+
+Usage:
+  python scripts/lexicon_search.py search "pricing pilot"
+  python scripts/lexicon_search.py search '"open decisions" churn' --project acme --layer Memory People
+  python scripts/lexicon_search.py search onboarding --since 2026-01-01 --topic retention --json
+  python scripts/lexicon_search.py search partner --field status=active --limit 5
+  python scripts/lexicon_search.py refresh | stats | rebuild
+
+Safe to delete .tmp/lexicon_search.sqlite3 at any time; it is rebuilt on the next search.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+from pathlib import Path
+
+from lexicon_core.archive import read_text
+from lexicon_core.frontmatter import parse_frontmatter
+from vault_index import REPO_ROOT, file_capture_date, frontmatter_project, normalize_date, walk_markdown
+
+INDEX_FILENAME = os.path.join(".tmp", "lexicon_search.sqlite3")
+SCHEMA_VERSION = 2
+# Search priority, most distilled first.
+LAYERS = ("Memory", "People", "Meetings", "Transcripts")
+DEFAULT_LIMIT = 20
+TITLE_WEIGHT = 5.0
+SNIPPET_TOKENS = 16
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    layer TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    project TEXT NOT NULL,
+    date TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    frontmatter TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS docs_layer ON docs(layer);
+CREATE VIRTUAL TABLE IF NOT EXISTS docs_fts USING fts5(
+    title, body, tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+QUERY_TOKEN_RE = re.compile(r'"([^"]*)"|(\S+)')
+WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def doc_project(rel: str, fm: dict) -> str:
+    """Frontmatter project, else the <Layer>/<Project>/ folder, lower-cased (not for Transcripts/<source>/)."""
+    project = frontmatter_project(fm)
+    parts = rel.split("/")
+    if project or parts[0] == "Transcripts":
+        return project
+    return parts[1].lower() if len(parts) > 2 else ""
+
+
+def doc_title(rel: str, fm: dict) -> str:
+    title = fm.get("title")
+    return title if isinstance(title, str) and title else Path(rel).stem
+
+
+def build_match(query: str) -> str:
+    """User query → FTS5 MATCH expression: ANDed terms, "phrases", word* prefixes."""
+    parts = []
+    for phrase, word in QUERY_TOKEN_RE.findall(query):
+        if phrase:
+            tokens = WORD_RE.findall(phrase)
+            if tokens:
+                parts.append('"' + " ".join(tokens) + '"')
+            continue
+        prefix = word.endswith("*")
+        for token in WORD_RE.findall(word):
+            parts.append(f'"{token}"')
+        if prefix and parts and WORD_RE.findall(word):
+            parts[-1] += "*"
+    return " ".join(parts)
+
+
+class SearchIndex:
+    """FTS5 index of the searchable layers, refreshed incrementally by mtime + size."""
+
+    def __init__(self, root=None, db_path: str | None = None):
+        self.root = os.path.abspath(str(root or REPO_ROOT))
+        self.db_path = db_path or os.path.join(self.root, INDEX_FILENAME)
+        self.conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        try:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+        except (OSError, sqlite3.Error) as e:
+            print(f"search index unavailable ({e}); using in-memory index", file=sys.stderr)
+            conn = sqlite3.connect(":memory:")
+            version = 0
+        if version != SCHEMA_VERSION:
+            conn.executescript("DROP TABLE IF EXISTS docs; DROP TABLE IF EXISTS docs_fts;")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        try:
+            conn.executescript(SCHEMA)
+        except sqlite3.OperationalError as e:
+            print(f"SQLite FTS5 is required for lexicon_search ({e}).", file=sys.stderr)
+            sys.exit(1)
+        return conn
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "SearchIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def refresh(self, layers=LAYERS) -> dict:
+        """Re-index new/changed files in the given layers and drop deleted ones. Returns counts."""
+        stats = {"scanned": 0, "updated": 0, "removed": 0}
+        for layer in layers:
+            known = {
+                path: (doc_id, mtime_ns, size)
+                for doc_id, path, mtime_ns, size in self.conn.execute(
+                    "SELECT id, path, mtime_ns, size FROM docs WHERE layer = ?", (layer,)
+                )
+            }
+            seen = set()
+            with self.conn:
+                for rel, path, mtime_ns, size in walk_markdown(self.root, layer):
+                    seen.add(rel)
+                    old = known.get(rel)
+                    if old and old[1:] == (mtime_ns, size):
+                        continue
+                    try:
+                        text = read_text(path)
+                    except OSError:
+                        continue
+                    if old:
+                        self._delete(old[0])
+                    self._insert(layer, rel, mtime_ns, size, text)
+                    stats["updated"] += 1
+                for rel, (doc_id, _m, _s) in known.items():
+                    if rel not in seen:
+                        self._delete(doc_id)
+                        stats["removed"] += 1
+            stats["scanned"] += len(seen)
+        return stats
+
+    def _insert(self, layer: str, rel: str, mtime_ns: int, size: int, text: str) -> None:
+        fm = parse_frontmatter(text)
+        cur = self.conn.execute(
+            "INSERT INTO docs (path, layer, priority, project, date, mtime_ns, size, frontmatter) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                rel,
+                layer,
+                LAYERS.index(layer),
+                doc_project(rel, fm),
+                file_capture_date(rel, fm),
+                mtime_ns,
+                size,
+                json.dumps(fm),
+            ),
+        )
+        self.conn.execute(
+            "INSERT INTO docs_fts (rowid, title, body) VALUES (?, ?, ?)",
+            (cur.lastrowid, doc_title(rel, fm), text),
+        )
+
+    def _delete(self, doc_id: int) -> None:
+        self.conn.execute("DELETE FROM docs_fts WHERE rowid = ?", (doc_id,))
+        self.conn.execute("DELETE FROM docs WHERE id = ?", (doc_id,))
+
+    def search(
+        self,
+        query: str,
+        project: str | None = None,
+        layers=None,
+        since: str | None = None,
+        until: str | None = None,
+        fields: list[tuple[str, str]] | None = None,
+        limit: int = DEFAULT_LIMIT,
+        mixed: bool = False,
+        raw: bool = False,
+    ) -> list[dict]:
+        """Ranked matches as dicts (path, layer, project, date, title, score, snippet)."""
+        match = query if raw else build_match(query)
+        if not match:
+            return []
+        where = ["docs_fts MATCH ?"]
+        params: list = [match]
+        if project:
+            where.append("docs.project = ?")
+            params.append(project.lower())
+        if layers:
+            where.append(f"docs.layer IN ({', '.join('?' for _ in layers)})")
+            params.extend(layers)
+        # Undated docs drop out once a lower bound is given (same rule as triage_queue).
+        if since:
+            where.append("docs.date != '' AND docs.date >= ?")
+            params.append(since)
+        if until:
+            where.append("(docs.date = '' OR docs.date <= ?)")
+            params.append(until)
+        for key, value in fields or []:
+            where.append(
+                "EXISTS (SELECT 1 FROM json_each(docs.frontmatter, ?) WHERE lower(CAST(value AS TEXT)) = ?)"
+            )
+            params.extend(['$."' + key.replace('"', "") + '"', value.lower()])
+        order = "score" if mixed else "docs.priority, score"
+        sql = (
+            "SELECT docs.path, docs.layer, docs.project, docs.date, docs_fts.title, "
+            f"bm25(docs_fts, {TITLE_WEIGHT}, 1.0) AS score, "
+            f"snippet(docs_fts, 1, '**', '**', ' … ', {SNIPPET_TOKENS}) "
+            "FROM docs_fts JOIN docs ON docs.id = docs_fts.rowid "
+            f"WHERE {' AND '.join(where)} ORDER BY {order}, docs.path LIMIT ?"
+        )
+        params.append(limit)
+        try:
+            rows = self.conn.execute(sql, params).fetchall()
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"bad search query {match!r}: {e}") from e
+        return [
+            {
+                "path": path,
+                "layer": layer,
+                "project": proj,
+                "date": date,
+                "title": title,
+                "score": round(-score, 3),
+                "snippet": " ".join(snippet.split()),
+            }
+            for path, layer, proj, date, title, score, snippet in rows
+        ]
+
+    def counts(self) -> dict[str, int]:
+        return dict(self.conn.execute("SELECT layer, COUNT(*) FROM docs GROUP BY layer ORDER BY priority"))
+
+
+def _parse_field(val: str) -> tuple[str, str]:
+    key, sep, value = val.partition("=")
+    if not sep or not key.strip():
+        raise argparse.ArgumentTypeError(f"expected KEY=VALUE, got {val!r}")
+    return key.strip(), value.strip()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Ranked full-text search over the Lexicon vault")
+    sub = parser.add_subparsers(dest="command", required=True)
+    search_p = sub.add_parser("search", help="Search (refreshes changed files first)")
+    search_p.add_argument("query", help='Words, "phrases", prefix*')
+    search_p.add_argument("--project", help="Only this project (frontmatter or <Layer>/<project>/ folder)")
+    search_p.add_argument("--layer", nargs="+", choices=LAYERS, help="Only these layers")
+    search_p.add_argument("--since", help="Dated on/after YYYY-MM-DD")
+    search_p.add_argument("--until", help="Dated on/before YYYY-MM-DD")
+    search_p.add_argument("--topic", action="append", default=[], help="Frontmatter topics contains TOPIC")
+    search_p.add_argument(
+        "--field", action="append", default=[], type=_parse_field, help="Frontmatter KEY=VALUE (lists match any item)"
+    )
+    search_p.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help=f"Max results (default {DEFAULT_LIMIT})")
+    search_p.add_argument("--mixed", action="store_true", help="Rank all layers together by BM25")
+    search_p.add_argument("--raw", action="store_true", help="Pass the query to FTS5 unchanged")
+    search_p.add_argument("--no-refresh", action="store_true", help="Search the index as is")
+    search_p.add_argument("--json", action="store_true", help="JSON output")
+    sub.add_parser("refresh", help="Re-index new/changed files")
+    sub.add_parser("stats", help="Print indexed file counts per layer")
+    sub.add_parser("rebuild", help="Drop the index and re-index everything")
+    args = parser.parse_args()
+
+    if args.command == "rebuild":
+        db_path = os.path.join(REPO_ROOT, INDEX_FILENAME)
+        if os.path.exists(db_path):
+            os.remove(db_path)
+
+    if args.command != "search":
+        with SearchIndex() as index:
+            if args.command in ("refresh", "rebuild"):
+                stats = index.refresh()
+                print(
+                    f"Scanned {stats['scanned']} files: {stats['updated']} re-indexed, "
+                    f"{stats['removed']} removed."
+                )
+            for layer, count in index.counts().items():
+                print(f"  {layer}: {count}")
+        return
+
+    dates = {}
+    for label in ("since", "until"):
+        val = getattr(args, label)
+        if val and not normalize_date(val):
+            print(f"Invalid --{label} date: {val}", file=sys.stderr)
+            sys.exit(1)
+        dates[label] = normalize_date(val) if val else None
+
+    fields = [("topics", t) for t in args.topic] + args.field
+    with SearchIndex() as index:
+        if not args.no_refresh:
+            index.refresh()
+        try:
+            results = index.search(
+                args.query,
+                project=args.project,
+                layers=args.layer,
+                fields=fields,
+                limit=args.limit,
+                mixed=args.mixed,
+                raw=args.raw,
+                **dates,
+            )
+        except ValueError as e:
+            print(str(e), file=sys.stderr)
+            sys.exit(1)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    if not results:
+        print(f"No matches for {args.query!r}.")
+        return
+    for item in results:
+        meta = ", ".join(x for x in (item["layer"], item["project"], item["date"]) if x)
+        print(f"{item['path']}  ({meta})")
+        print(f"    {item['snippet']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Long-running watcher that keeps triage / pending answers hot and serves them over a socket.
+
+Watches Ideas/, Clippings/, Meetings/, Memory/ and Transcripts/HiDock/ with inotify (Linux,
+via ctypes) or, where inotify is unavailable or --poll is given, a periodic stat walk. Changed
+roots are re-indexed into the shared vault index (.tmp/vault_index.sqlite3) and cached answers
+are dropped; everything else is answered from memory.
+
+Clients talk to .tmp/lexicon_watch.sock: one JSON request line in, one JSON reply out.
+triage_queue.py and hidock_pending.py try the daemon first and fall back to scanning
+themselves when it is not running (or when given --no-daemon / LEXICON_NO_DAEMON=1).
+
+Usage:
+  python scripts/lexicon_watch.py serve [--poll] [--interval 2] [--rescan 300] [--workers N]
+  python scripts/lexicon_watch.py status
+  python scripts/lexicon_watch.py stop
+"""
+from __future__ import annotations
+
+import argparse
+import ctypes
+import ctypes.util
+import json
+import os
+import selectors
+import signal
+import socket
+import struct
+import sys
+import time
+
+from vault_index import DEFAULT_ROOTS, REPO_ROOT, VaultIndex, add_workers_argument
+
+SOCKET_FILENAME = ".tmp/lexicon_watch.sock"
+WATCH_ROOTS = ("Ideas", "Clippings", "Meetings", "Memory", "Transcripts/HiDock")
+CLIENT_TIMEOUT = 10.0
+DEFAULT_INTERVAL = 2.0
+DEFAULT_RESCAN = 300.0
+
+# <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = getattr(os, "O_NONBLOCK", 0o4000)
+IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0o2000000)
+WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+)
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def socket_path(root=None) -> str:
+    return os.path.join(os.path.abspath(str(root or REPO_ROOT)), SOCKET_FILENAME)
+
+
+def query(op: str, root=None, timeout: float = CLIENT_TIMEOUT, **args):
+    """Ask a running daemon. Returns its result, or None when no daemon answered."""
+    if os.environ.get("LEXICON_NO_DAEMON") or not hasattr(socket, "AF_UNIX"):
+        return None
+    path = socket_path(root)
+    if not os.path.exists(path):
+        return None
+    chunks = []
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            sock.sendall((json.dumps({"op": op, **args}) + "\n").encode("utf-8"))
+            sock.shutdown(socket.SHUT_WR)
+            while True:
+                data = sock.recv(65536)
+                if not data:
+                    break
+                chunks.append(data)
+        reply = json.loads(b"".join(chunks))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(reply, dict) or not reply.get("ok"):
+        return None
+    return reply.get("result")
+
+
+class InotifyWatcher:
+    """Recursive inotify watches on the vault roots; changes() reports which roots were touched."""
+
+    mode = "inotify"
+
+    def __init__(self, root: str, roots=WATCH_ROOTS):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self.root = root
+        self.roots = tuple(roots)
+        self.wds: dict[int, tuple[str, str]] = {}
+        for root_rel in self.roots:
+            self._add_tree(root_rel, os.path.join(root, *root_rel.split("/")))
+
+    def _add_tree(self, root_rel: str, top: str) -> None:
+        stack = [top]
+        while stack:
+            path = stack.pop()
+            wd = self._add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+            if wd < 0:
+                continue
+            self.wds[wd] = (root_rel, path)
+            try:
+                with os.scandir(path) as it:
+                    stack.extend(e.path for e in it if e.is_dir(follow_symlinks=False))
+            except OSError:
+                continue
+
+    def fileno(self) -> int:
+        return self.fd
+
+    def changes(self) -> set[str]:
+        """Drain pending events; return the roots that changed."""
+        changed: set[str] = set()
+        while True:
+            try:
+                buf = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(buf):
+                wd, mask, _cookie, length = EVENT_HEADER.unpack_from(buf, offset)
+                offset += EVENT_HEADER.size
+                name = buf[offset : offset + length].rstrip(b"\0").decode("utf-8", "replace")
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    changed.update(self.roots)
+                    continue
+                watched = self.wds.get(wd)
+                if mask & IN_IGNORED:
+                    self.wds.pop(wd, None)
+                if watched is None:
+                    continue
+                root_rel, path = watched
+                if mask & IN_ISDIR:
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        self._add_tree(root_rel, os.path.join(path, name))
+                    changed.add(root_rel)
+                elif name.endswith(".md") or mask & IN_DELETE_SELF:
+                    changed.add(root_rel)
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Fallback: snapshot (path, mtime, size) per root and diff it on each changes() call."""
+
+    mode = "poll"
+
+    def __init__(self, root: str, roots=WATCH_ROOTS):
+        self.root = root
+        self.roots = tuple(roots)
+        self.snapshots = {root_rel: self._snapshot(root_rel) for root_rel in self.roots}
+
+    def _snapshot(self, root_rel: str) -> dict[str, tuple[int, int]]:
+        found = {}
+        stack = [os.path.join(self.root, *root_rel.split("/"))]
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith(".md"):
+                            st = entry.stat()
+                            found[entry.path] = (st.st_mtime_ns, st.st_size)
+                    except OSError:
+                        continue
+        return found
+
+    def fileno(self) -> None:
+        return None
+
+    def changes(self) -> set[str]:
+        changed = set()
+        for root_rel in self.roots:
+            snapshot = self._snapshot(root_rel)
+            if snapshot != self.snapshots[root_rel]:
+                self.snapshots[root_rel] = snapshot
+                changed.add(root_rel)
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+class WatchDaemon:
+    """Single-threaded select loop: watcher events mark roots dirty, queries refresh then answer."""
+
+    def __init__(self, root, poll: bool, interval: float, rescan: float, workers: int | None):
+        # Imported here: both scripts import this module for query().
+        import hidock_pending
+        import triage_queue
+
+        self.root = os.path.abspath(str(root))
+        self.interval = interval
+        self.rescan = rescan
+        self.index = VaultIndex(self.root, workers=workers)
+        self.index.refresh(DEFAULT_ROOTS)
+        self.watcher = None
+        if not poll:
+            try:
+                self.watcher = InotifyWatcher(self.root)
+            except (OSError, AttributeError) as e:
+                print(f"inotify unavailable ({e}); polling every {interval:g}s", file=sys.stderr)
+        if self.watcher is None:
+            self.watcher = PollingWatcher(self.root)
+        self.dirty: set[str] = set()
+        self.cache: dict[str, object] = {}
+        self.started = time.time()
+        self.stats = {"queries": 0, "cache_hits": 0, "refreshes": 0}
+        self.running = True
+        index = self.index
+        self.handlers = {
+            "triage": lambda project, since=None, until=None: {
+                "queue": triage_queue.build_queue(project, since, until, index),
+                "recent_meetings": triage_queue.iter_recent_meetings(project, since, until, index=index),
+                "pending_decisions": triage_queue.pending_decisions_snippet(project),
+            },
+            "all_queues": lambda since=None, until=None: triage_queue.build_all_queues(since, until, index),
+            "hidock_pending": lambda: hidock_pending.list_pending(index),
+            "who_references": lambda transcript: hidock_pending.who_references(transcript, index),
+        }
+
+    def _apply_dirty(self) -> None:
+        if not self.dirty:
+            return
+        roots = tuple(r for r in DEFAULT_ROOTS if r in self.dirty)
+        if roots:
+            self.index.refresh(roots, force=True)
+        self.dirty.clear()
+        self.cache.clear()
+        self.stats["refreshes"] += 1
+
+    def status(self) -> dict:
+        return {
+            "pid": os.getpid(),
+            "root": self.root,
+            "mode": self.watcher.mode,
+            "uptime_s": round(time.time() - self.started, 1),
+            "cached_answers": len(self.cache),
+            "indexed": self.index.counts(),
+            **self.stats,
+        }
+
+    def answer(self, request: dict):
+        op = request.pop("op", None)
+        if op == "ping":
+            return self.status()
+        if op == "shutdown":
+            self.running = False
+            return {"pid": os.getpid()}
+        if op not in self.handlers:
+            raise ValueError(f"unknown op: {op!r}")
+        self.dirty |= self.watcher.changes() if self.watcher.fileno() is not None else set()
+        self._apply_dirty()
+        self.stats["queries"] += 1
+        key = json.dumps([op, request], sort_keys=True)
+        if key in self.cache:
+            self.stats["cache_hits"] += 1
+        else:
+            self.cache[key] = self.handlers[op](**request)
+        return self.cache[key]
+
+    def _serve_client(self, server: socket.socket) -> None:
+        conn, _ = server.accept()
+        with conn:
+            conn.settimeout(5)
+            try:
+                data = b""
+                while not data.endswith(b"\n"):
+                    chunk = conn.recv(65536)
+                    if not chunk:
+                        break
+                    data += chunk
+                request = json.loads(data)
+                reply = {"ok": True, "result": self.answer(request)}
+            except Exception as e:  # noqa: BLE001 — report to the client, keep serving
+                reply = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            try:
+                conn.sendall(json.dumps(reply).encode("utf-8"))
+            except OSError:
+                pass
+
+    def serve(self, path: str) -> None:
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(path)
+        server.listen(16)
+        server.setblocking(False)
+        selector = selectors.DefaultSelector()
+        selector.register(server, selectors.EVENT_READ, "client")
+        if self.watcher.fileno() is not None:
+            selector.register(self.watcher.fileno(), selectors.EVENT_READ, "watch")
+        print(f"lexicon_watch: {self.watcher.mode} on {self.root}, socket {path} (pid {os.getpid()})", file=sys.stderr)
+        next_poll = time.time() + self.interval
+        next_rescan = time.time() + self.rescan
+        try:
+            while self.running:
+                polling = self.watcher.fileno() is None
+                deadline = min(next_poll, next_rescan) if polling else next_rescan
+                for key, _events in selector.select(max(0.0, deadline - time.time())):
+                    if key.data == "watch":
+                        self.dirty |= self.watcher.changes()
+                    else:
+                        try:
+                            self._serve_client(server)
+                        except BlockingIOError:
+                            pass
+                now = time.time()
+                if polling and now >= next_poll:
+                    self.dirty |= self.watcher.changes()
+                    next_poll = now + self.interval
+                if now >= next_rescan:
+                    # Safety net for missed events (roots created after startup, overflowed queues).
+                    self.dirty.update(WATCH_ROOTS)
+                    next_rescan = now + self.rescan
+        finally:
+            selector.close()
+            server.close()
+            self.watcher.close()
+            self.index.close()
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Keep Lexicon triage / HiDock answers hot")
+    sub = parser.add_subparsers(dest="command", required=True)
+    serve_p = sub.add_parser("serve", help="Run the watcher in the foreground")
+    serve_p.add_argument("--poll", action="store_true", help="Poll instead of using inotify")
+    serve_p.add_argument(
+        "--interval", type=float, default=DEFAULT_INTERVAL, help="Polling interval in seconds (poll mode)"
+    )
+    serve_p.add_argument(
+        "--rescan", type=float, default=DEFAULT_RESCAN, help="Full re-check interval in seconds (safety net)"
+    )
+    add_workers_argument(serve_p)
+    sub.add_parser("status", help="Show the running daemon's state")
+    sub.add_parser("stop", help="Ask the running daemon to exit")
+    args = parser.parse_args()
+
+    path = socket_path()
+    if args.command in ("status", "stop"):
+        result = query("ping" if args.command == "status" else "shutdown")
+        if result is None:
+            print("lexicon_watch is not running.", file=sys.stderr)
+            sys.exit(1)
+        if args.command == "stop":
+            print(f"Stopping lexicon_watch (pid {result['pid']}).")
+        else:
+            print(json.dumps(result, indent=2))
+        return
+
+    if not hasattr(socket, "AF_UNIX"):
+        print("lexicon_watch needs Unix domain sockets (not available on this platform).", file=sys.stderr)
+        sys.exit(1)
+    running = query("ping")
+    if running is not None:
+        print(f"lexicon_watch already running (pid {running['pid']}).", file=sys.stderr)
+        sys.exit(1)
+    if os.path.exists(path):
+        os.remove(path)  # stale socket from a daemon that did not exit cleanly
+
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    daemon = WatchDaemon(REPO_ROOT, args.poll, args.interval, args.rescan, args.workers)
+    try:
+        daemon.serve(path)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -4,27 +4,69 @@ Ingest manual meeting transcript into Lexicon.
 
 Output: Transcripts/Manual/YYYY-MM-DD_<slug>_manual.md (project is in frontmatter only; folder is not project-based).
 
-No external HiNotes (or other) dependency: stub mode is source-agnostic. Full mode optionally parses
-HiNotes-style input (Unknown Speaker → HH:MM:SS → paragraph); if you use another format, use --stub and paste into the file.
+No external HiNotes (or other) dependency: stub mode is source-agnostic. Full mode parses the input
+line by line and streams formatted blocks into the output file (written to a temp file, then renamed).
+Formats, detected from the first lines unless --format is given:
+  hinotes   "Unknown Speaker" (or a name) → HH:MM:SS → paragraph, repeated
+  named     "Name: text" per utterance
+  bracket   "[HH:MM:SS] Name: text" or "[HH:MM:SS] text"
+  srt, vtt  subtitle cues (speaker from <v Name> or a "Name:" prefix); same-speaker cues are merged
 
 Modes:
   1. Stub: Create file with metadata only; you fill transcript later.
      python scripts/manual_ingest.py --stub --date YYYY-MM-DD --title "Title" --with-whom "Name" --project personal
 
-  2. Full: Parse HiNotes-format transcript from file or stdin and write formatted file.
+  2. Full: Parse a transcript from file or stdin and write formatted file.
      python scripts/manual_ingest.py --date YYYY-MM-DD --with-whom "Name" --project personal [--transcript-file PATH]
-     HiNotes format: "Unknown Speaker" → HH:MM:SS → paragraph, repeated.
+       [--format auto|hinotes|named|bracket|srt|vtt]
+
+  3. Batch: Ingest every transcript in a directory in one process (parsed in parallel).
+     python scripts/manual_ingest.py --batch DIR [--manifest PATH] [--with-whom "Name"] [--project personal]
+       [--workers N] [--force] [--dry-run]
+     The manifest (DIR/manifest.csv or manifest.json unless --manifest is given) has one row per
+     file with columns file,date,title,with_whom,project,format; when present, only its files are
+     ingested. Without one, every .txt/.md/.srt/.vtt in DIR is ingested, the date and title come
+     from names like "2026-01-15 Catch up.txt", and --with-whom/--project fill in the rest.
+     Files whose target already exists are skipped (unless --force), as are transcripts whose body
+     matches one already in Transcripts/Manual/. Prints per-file block counts and throughput.
 """
 import argparse
+import concurrent.futures
+import csv
+import hashlib
+import itertools
+import json
 import os
 import re
 import sys
+import tempfile
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+from lexicon_core import profiling
+from lexicon_core.archive import read_text
+from lexicon_core.files import set_final_mode
+from lexicon_core.frontmatter import format_frontmatter
+from vault_index import resolve_workers
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 REPO_ROOT = os.path.join(SCRIPT_DIR, "..")
 MANUAL_BASE = os.path.join(REPO_ROOT, "Transcripts", "Manual")
 
 TIMESTAMP_RE = re.compile(r"^\d{1,2}:\d{2}:\d{2}$")
+NAMED_RE = re.compile(r"^([A-Z][\w.'’ -]{0,39}?)\s*:\s+(\S.*)$")
+BRACKET_RE = re.compile(r"^\[(\d{1,2}:\d{2}(?::\d{2})?)\]\s*(?:([^:\[\]]{1,40}?):\s+)?(.*)$")
+CUE_TIME_RE = re.compile(r"^(?:(\d{1,2}):)?(\d{2}):(\d{2})[.,]\d{3}\s+-->\s+")
+VTT_VOICE_RE = re.compile(r"<v(?:\.[^\s>]*)?\s+([^>]+)>")
+MARKUP_RE = re.compile(r"<[^>]+>")
+UNKNOWN_SPEAKER = "Unknown Speaker"
+SPEAKER_MAX = 60
+DETECT_LINES = 40
+RAW_TRANSCRIPT_HEADING = "\n# Raw Transcript\n\n"
+BATCH_EXTENSIONS = (".txt", ".md", ".srt", ".vtt")
+MANIFEST_NAMES = ("manifest.csv", "manifest.json")
+MANIFEST_FIELDS = ("file", "date", "title", "with_whom", "project", "format")
+DATE_PREFIX_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})[\s_-]*")
 
 
 def clean_filename(text):
@@ -32,74 +74,512 @@ def clean_filename(text):
     return re.sub(r"[-\s]+", "_", text).strip().strip("_") or "meeting"
 
 
-def parse_hinotes_transcript(raw_text):
-    lines = raw_text.splitlines()
-    blocks = []
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-        if line == "Unknown Speaker":
-            i += 1
-            ts = ""
-            if i < len(lines) and TIMESTAMP_RE.match(lines[i].strip()):
-                ts = lines[i].strip()
-                i += 1
-            para_lines = []
-            while i < len(lines):
-                if lines[i].strip() == "Unknown Speaker":
-                    break
-                para_lines.append(lines[i])
-                i += 1
-            text = "\n".join(para_lines).strip()
-            if text:
-                blocks.append((ts, text))
+def _pairs(lines):
+    """(line, next_line) for each line; next_line is None at the end."""
+    it = iter(lines)
+    prev = next(it, None)
+    for cur in it:
+        yield prev, cur
+        prev = cur
+    if prev is not None:
+        yield prev, None
+
+
+def _block(speaker, ts, para_lines):
+    text = "\n".join(para_lines).strip()
+    return (speaker, ts, text) if text else None
+
+
+def _named_header(stripped, after_break, nxt_ts):
+    """A named HiNotes speaker line: short, above an HH:MM:SS line, at the top or after a blank line."""
+    return bool(
+        nxt_ts
+        and after_break
+        and stripped
+        and len(stripped) <= SPEAKER_MAX
+        and not stripped.endswith(":")
+        and not TIMESTAMP_RE.match(stripped)
+    )
+
+
+def iter_hinotes(lines):
+    """HiNotes: speaker line ("Unknown Speaker" or a name) → optional HH:MM:SS line → paragraph.
+
+    A name counts as a header only at the start of the export or after a blank line, so a
+    paragraph line that happens to sit above a time ("We meet at" / "12:30:00") stays text.
+    """
+    speaker, ts, para = None, "", []
+    skip = False
+    after_break = True
+    for line, nxt in _pairs(lines):
+        if skip:
+            skip = False
+            continue
+        stripped = line.strip()
+        nxt_ts = nxt is not None and TIMESTAMP_RE.match(nxt.strip())
+        is_header = stripped == UNKNOWN_SPEAKER or _named_header(stripped, after_break, nxt_ts)
+        after_break = not stripped
+        if is_header:
+            block = _block(speaker, ts, para) if speaker else None
+            if block:
+                yield block
+            speaker, ts, para = stripped, nxt.strip() if nxt_ts else "", []
+            skip = bool(nxt_ts)
             continue
-        i += 1
-    return blocks
+        if speaker:
+            para.append(line)
+    block = _block(speaker, ts, para) if speaker else None
+    if block:
+        yield block
 
 
-def format_transcript_body(blocks):
-    out = []
-    for ts, text in blocks:
-        if ts:
-            out.append(f"**Unknown Speaker ({ts}):** {text}")
-        else:
-            out.append(f"**Unknown Speaker:** {text}")
-    return "\n".join(out)
+def iter_named(lines):
+    """"Name: text" per utterance; unprefixed lines continue the previous speaker."""
+    speaker, para = None, []
+    for line in lines:
+        m = NAMED_RE.match(line.strip())
+        if m:
+            block = _block(speaker, "", para) if speaker else None
+            if block:
+                yield block
+            speaker, para = m.group(1).strip(), [m.group(2)]
+        elif speaker:
+            para.append(line)
+    block = _block(speaker, "", para) if speaker else None
+    if block:
+        yield block
+
+
+def iter_bracketed(lines):
+    """"[HH:MM:SS] Name: text" or "[HH:MM:SS] text"; unprefixed lines continue the previous one."""
+    speaker, ts, para = None, "", []
+    for line in lines:
+        m = BRACKET_RE.match(line.strip())
+        if m:
+            block = _block(speaker, ts, para) if speaker else None
+            if block:
+                yield block
+            ts, speaker, para = m.group(1), (m.group(2) or UNKNOWN_SPEAKER).strip(), [m.group(3)]
+        elif speaker:
+            para.append(line)
+    block = _block(speaker, ts, para) if speaker else None
+    if block:
+        yield block
+
+
+def _cue_speaker(text):
+    m = VTT_VOICE_RE.search(text)
+    speaker = m.group(1).strip() if m else ""
+    text = " ".join(MARKUP_RE.sub("", text).split())
+    if not speaker:
+        named = NAMED_RE.match(text)
+        if named:
+            speaker, text = named.group(1).strip(), named.group(2)
+    return speaker or UNKNOWN_SPEAKER, text
+
+
+def iter_subtitles(lines):
+    """SRT / WebVTT cues; consecutive cues from the same speaker become one block."""
+    speaker, ts, para = None, "", []
+    cue_ts, cue_text = None, []
+
+    def finish_cue():
+        nonlocal speaker, ts, para
+        if cue_ts is None or not cue_text:
+            return None
+        cue_speaker, text = _cue_speaker(" ".join(cue_text))
+        if cue_speaker == speaker:
+            para.append(text)
+            return None
+        done = _block(speaker, ts, [" ".join(para)]) if speaker else None
+        speaker, ts, para = cue_speaker, cue_ts, [text]
+        return done
+
+    for line in lines:
+        stripped = line.strip()
+        m = CUE_TIME_RE.match(stripped)
+        if m:
+            hours, minutes, seconds = m.groups()
+            cue_ts, cue_text = f"{int(hours or 0):02d}:{minutes}:{seconds}", []
+            continue
+        if not stripped:
+            block = finish_cue()
+            if block:
+                yield block
+            cue_ts, cue_text = None, []
+            continue
+        if cue_ts is not None:
+            cue_text.append(stripped)
+    block = finish_cue()
+    if block:
+        yield block
+    block = _block(speaker, ts, [" ".join(para)]) if speaker else None
+    if block:
+        yield block
+
+
+PARSERS = {
+    "hinotes": iter_hinotes,
+    "named": iter_named,
+    "bracket": iter_bracketed,
+    "srt": iter_subtitles,
+    "vtt": iter_subtitles,
+}
+
+
+def detect_format(head_lines):
+    """Guess the transcript format from its first lines (HiNotes when nothing else fits)."""
+    lines = [ln.strip() for ln in head_lines if ln.strip()]
+    if not lines:
+        return "hinotes"
+    if lines[0].startswith("WEBVTT"):
+        return "vtt"
+    if any(CUE_TIME_RE.match(ln) for ln in lines):
+        return "srt"
+    if any(ln == "Unknown Speaker" or TIMESTAMP_RE.match(ln) for ln in lines):
+        return "hinotes"
+    if sum(1 for ln in lines if BRACKET_RE.match(ln)) * 2 >= len(lines):
+        return "bracket"
+    if sum(1 for ln in lines if NAMED_RE.match(ln)) * 2 >= len(lines):
+        return "named"
+    return "hinotes"
+
+
+def parse_transcript(lines, fmt="auto"):
+    """Return (format, generator of (speaker, ts, text) blocks) for an iterable of lines."""
+    lines = (ln.rstrip("\r\n") for ln in lines)
+    if fmt == "auto":
+        head = list(itertools.islice(lines, DETECT_LINES))
+        fmt = detect_format(head)
+        lines = itertools.chain(head, lines)
+    return fmt, PARSERS[fmt](lines)
+
+
+def format_block(speaker, ts, text):
+    if ts:
+        return f"**{speaker} ({ts}):** {text}"
+    return f"**{speaker}:** {text}"
+
+
+def write_blocks(f, blocks):
+    """Write formatted blocks (newline-separated, trailing newline) to f, or only count them if f is None.
+
+    Returns (block count, sha1 hex digest of the body text).
+    """
+    digest = hashlib.sha1()
+    count = 0
+    for block in blocks:
+        chunk = ("\n" if count else "") + format_block(*block)
+        if f is not None:
+            f.write(chunk)
+        digest.update(chunk.encode("utf-8"))
+        count += 1
+    if f is not None:
+        f.write("\n")
+    digest.update(b"\n")
+    return count, digest.hexdigest()
+
+
+def stream_to_temp(out_path, header, blocks):
+    """Write header + blocks to a temp file next to out_path. Returns (temp path, block count, body digest)."""
+    out_dir = os.path.dirname(out_path)
+    os.makedirs(out_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=out_dir, prefix="." + os.path.basename(out_path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(header)
+            count, digest = write_blocks(f, blocks)
+        set_final_mode(tmp_path, out_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return tmp_path, count, digest
+
+
+def write_transcript(out_path, header, blocks):
+    """Stream header + formatted blocks to a temp file, then rename into place. Returns the block count."""
+    tmp_path, count, _digest = stream_to_temp(out_path, header, blocks)
+    os.replace(tmp_path, out_path)
+    return count
+
+
+def transcript_frontmatter(date_str, title, with_whom, project):
+    return format_frontmatter(
+        {
+            "title": title,
+            "date": date_str,
+            "with_whom": with_whom,
+            "project": project,
+            "source": "manual",
+            "tags": ["transcript", "manual", "meeting"],
+        },
+        quoted=("title",),
+        inline=("tags",),
+    )
+
+
+def output_path(date_str, slug_source):
+    return os.path.join(MANUAL_BASE, f"{date_str}_{clean_filename(slug_source)}_manual.md")
 
 
 def create_stub(date_str, title, with_whom, project, out_path):
-    safe_title = title.replace('"', '\\"')
-    content = f"""---
-title: "{safe_title}"
-date: {date_str}
-with_whom: {with_whom}
-project: {project}
-source: manual
-tags: [transcript, manual, meeting]
----
-
-# Raw Transcript
-
-(Paste or type your transcript here.)
-"""
+    content = transcript_frontmatter(date_str, title, with_whom, project)
+    content += "\n# Raw Transcript\n\n(Paste or type your transcript here.)\n"
     with open(out_path, "w", encoding="utf-8") as f:
         f.write(content)
     return out_path
 
 
+def existing_digests(base=MANUAL_BASE):
+    """Body digest → path for transcripts already in Transcripts/Manual/ (stubs and empty bodies skipped)."""
+    known = {}
+    try:
+        entries = sorted(e.path for e in os.scandir(base) if e.is_file() and e.name.endswith(".md"))
+    except FileNotFoundError:
+        return known
+    for path in entries:
+        try:
+            text = read_text(path)
+        except OSError:
+            continue
+        _head, sep, body = text.partition(RAW_TRANSCRIPT_HEADING)
+        if sep and body.strip() and body.startswith("**"):
+            known.setdefault(hashlib.sha1(body.encode("utf-8")).hexdigest(), path)
+    return known
+
+
+def load_manifest(path):
+    """Manifest rows (CSV with a header row, or a JSON list of objects) as dicts of MANIFEST_FIELDS."""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if path.lower().endswith(".json"):
+            rows = json.load(f)
+            if not isinstance(rows, list):
+                raise ValueError("JSON manifest must be a list of objects")
+        else:
+            rows = list(csv.DictReader(f))
+    manifest = []
+    for row in rows:
+        if not isinstance(row, dict):
+            raise ValueError(f"manifest row is not an object: {row!r}")
+        row = {k.strip().lower().replace("-", "_"): (v or "").strip() for k, v in row.items() if k}
+        if not row.get("file"):
+            raise ValueError(f"manifest row without a file: {row}")
+        manifest.append({field: row.get(field, "") for field in MANIFEST_FIELDS})
+    return manifest
+
+
+def batch_jobs(batch_dir, manifest, with_whom, project, fmt):
+    """Yield (job, error) per source file; job is None when the row cannot be resolved."""
+    if manifest is None:
+        names = sorted(
+            e.name for e in os.scandir(batch_dir) if e.is_file() and e.name.lower().endswith(BATCH_EXTENSIONS)
+        )
+        manifest = [{**dict.fromkeys(MANIFEST_FIELDS, ""), "file": name} for name in names]
+    for row in manifest:
+        src = os.path.join(batch_dir, row["file"])
+        stem = os.path.splitext(os.path.basename(row["file"]))[0]
+        m = DATE_PREFIX_RE.match(stem)
+        date_str = row["date"] or (m.group(1) if m else "")
+        row_whom = row["with_whom"] or with_whom
+        row_project = row["project"] or project
+        title = row["title"] or (stem[m.end():] if m else stem).replace("_", " ").strip()
+        missing = [
+            name for name, val in (("date", date_str), ("with_whom", row_whom), ("project", row_project)) if not val
+        ]
+        if missing:
+            yield {"src": src}, f"missing {', '.join(missing)}"
+            continue
+        if not title:
+            title = f"{date_str} {row_whom}"
+        job = {
+            "src": src,
+            "out": output_path(date_str, title),
+            "header": transcript_frontmatter(date_str, title, row_whom, row_project) + RAW_TRANSCRIPT_HEADING,
+            "format": row["format"] or fmt,
+        }
+        if job["format"] not in ("auto", *PARSERS):
+            yield job, f"unknown format {job['format']!r}"
+            continue
+        yield job, None
+
+
+def ingest_one(job, dry_run=False):
+    """Parse one source file; unless dry_run, leave the output in a temp file for the caller to commit."""
+    result = {"src": job["src"], "out": job["out"], "tmp": None, "error": None}
+    try:
+        result["bytes"] = os.path.getsize(job["src"])
+        with open(job["src"], "r", encoding="utf-8", errors="replace") as f:
+            result["format"], blocks = parse_transcript(f, job["format"])
+            if dry_run:
+                result["blocks"], result["digest"] = write_blocks(None, blocks)
+            else:
+                result["tmp"], result["blocks"], result["digest"] = stream_to_temp(job["out"], job["header"], blocks)
+    except (OSError, UnicodeError) as e:
+        result["error"] = str(e)
+    return result
+
+
+def _ingest_chunk(jobs, dry_run):
+    return [ingest_one(job, dry_run) for job in jobs]
+
+
+def _ingest_chunks(parts, workers, dry_run):
+    """Yield _ingest_chunk(part) for each part, in order: on worker processes when workers > 1.
+
+    If processes are unavailable (e.g. sandboxed /dev/shm) or the pool breaks part-way, the
+    parts not yet yielded are re-run on threads.
+    """
+    if workers <= 1 or len(parts) <= 1:
+        for part in parts:
+            yield _ingest_chunk(part, dry_run)
+        return
+    done = 0
+    try:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            for part_results in pool.map(_ingest_chunk, parts, [dry_run] * len(parts)):
+                done += 1
+                yield part_results
+        return
+    except (OSError, NotImplementedError, BrokenProcessPool):
+        pass
+    rest = parts[done:]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_ingest_chunk, rest, [dry_run] * len(rest))
+
+
+def run_batch(jobs, workers, dry_run=False, force=False):
+    """Ingest jobs (in parallel when workers > 1) and return one report row per job, in input order.
+
+    Workers only write temp files; this process decides, in order, whether each one is renamed
+    into place, so duplicates inside the batch are caught as well as ones already on disk.
+    """
+    with profiling.phase("existing digests"):
+        known = existing_digests()
+    report = []
+    todo = []
+    for job, error in jobs:
+        if error:
+            report.append({"src": job["src"], "status": "error", "detail": error})
+        elif os.path.exists(job["out"]) and not force:
+            report.append({"src": job["src"], "status": "exists", "detail": job["out"]})
+        else:
+            report.append(None)
+            todo.append((len(report) - 1, job))
+
+    workers = resolve_workers(workers)
+    chunk = max(1, min(16, len(todo) // (workers * 4) or 1))
+    chunks = [todo[i : i + chunk] for i in range(0, len(todo), chunk)]
+    results = _ingest_chunks([[job for _i, job in part] for part in chunks], workers, dry_run)
+
+    claimed = set()
+    try:
+        for part, part_results in zip(chunks, results):
+            for (slot, job), res in zip(part, part_results):
+                row = {"src": res["src"], "format": res.get("format"), "blocks": res.get("blocks", 0)}
+                row["bytes"] = res.get("bytes", 0)
+                duplicate = known.get(res.get("digest"))
+                if res["error"]:
+                    row.update(status="error", detail=res["error"])
+                elif not row["blocks"]:
+                    row.update(status="empty", detail="no transcript blocks parsed")
+                elif duplicate and os.path.abspath(duplicate) != os.path.abspath(res["out"]):
+                    row.update(status="duplicate", detail=duplicate)
+                elif res["out"] in claimed:
+                    row.update(status="exists", detail=res["out"])
+                else:
+                    row.update(status="would write" if dry_run else "saved", detail=res["out"])
+                    if res["tmp"]:
+                        os.replace(res["tmp"], res["out"])
+                        res["tmp"] = None
+                    known.setdefault(res["digest"], res["out"])
+                    claimed.add(res["out"])
+                if res["tmp"]:
+                    os.remove(res["tmp"])
+                report[slot] = row
+                profiling.count("files parsed")
+                profiling.count("bytes read", row["bytes"])
+                profiling.count("blocks", row["blocks"])
+    finally:
+        results.close()
+    return report
+
+
+def print_batch_report(report, seconds):
+    for row in report:
+        blocks = f"{row['blocks']:>5} blocks ({row['format']})" if row.get("format") else ""
+        print(f"{row['status'].upper():<12} {os.path.basename(row['src']):<40} {blocks:<24} {row['detail']}")
+    parsed = [row for row in report if row.get("format")]
+    total_bytes = sum(row["bytes"] for row in parsed)
+    total_blocks = sum(row["blocks"] for row in parsed)
+    counts = {}
+    for row in report:
+        counts[row["status"]] = counts.get(row["status"], 0) + 1
+    rate = seconds or 1e-9
+    print(
+        f"\n{len(report)} files ({', '.join(f'{n} {status}' for status, n in counts.items())}); "
+        f"parsed {len(parsed)} files, {total_blocks} blocks, {total_bytes / 1e6:.2f} MB in {seconds:.2f}s "
+        f"({len(parsed) / rate:.1f} files/s, {total_bytes / 1e6 / rate:.2f} MB/s)"
+    )
+
+
+def batch_main(args):
+    batch_dir = args.batch
+    if not os.path.isdir(batch_dir):
+        print(f"ERROR: --batch {batch_dir} is not a directory", file=sys.stderr)
+        sys.exit(1)
+    manifest_path = args.manifest
+    if manifest_path is None:
+        manifest_path = next(
+            (p for p in (os.path.join(batch_dir, n) for n in MANIFEST_NAMES) if os.path.isfile(p)), None
+        )
+    manifest = None
+    if manifest_path:
+        try:
+            manifest = load_manifest(manifest_path)
+        except (OSError, ValueError, csv.Error) as e:
+            print(f"ERROR: cannot read manifest {manifest_path}: {e}", file=sys.stderr)
+            sys.exit(1)
+    with_whom = (args.with_whom or "").strip()
+    project = (args.project or "").strip()
+    start = time.perf_counter()
+    jobs = batch_jobs(batch_dir, manifest, with_whom, project, args.format)
+    with profiling.phase("batch"):
+        report = run_batch(jobs, args.workers, dry_run=args.dry_run, force=args.force)
+    print_batch_report(report, time.perf_counter() - start)
+    if any(row["status"] == "error" for row in report):
+        sys.exit(1)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Ingest manual transcript into Transcripts/Manual/. Project is stored in frontmatter only."
     )
     parser.add_argument("--date", default=None, help="Meeting date YYYY-MM-DD (optional with --stub: default today)")
     parser.add_argument("--title", default=None, help="Meeting title (required for --stub)")
-    parser.add_argument("--with-whom", required=True, dest="with_whom", help="With whom (e.g. Satish)")
-    parser.add_argument("--project", required=True, help="Project: personal, company, career, general, etc.")
+    parser.add_argument("--with-whom", dest="with_whom", help="With whom (e.g. Satish); batch default")
+    parser.add_argument("--project", help="Project: personal, company, career, general, etc.; batch default")
     parser.add_argument("--stub", action="store_true", help="Create stub only; you fill transcript later.")
     parser.add_argument("--transcript-file", dest="transcript_file", default=None, help="Transcript file; default: stdin")
+    parser.add_argument(
+        "--format", default="auto", choices=["auto", *PARSERS], help="Transcript format (default: detect)"
+    )
     parser.add_argument("--dry-run", action="store_true", help="Print target path only; do not write")
+    parser.add_argument("--batch", metavar="DIR", default=None, help="Ingest every transcript in DIR")
+    parser.add_argument("--manifest", default=None, help="Batch manifest (CSV or JSON); default DIR/manifest.*")
+    parser.add_argument("--workers", type=int, default=0, metavar="N", help="Batch: N processes (0 = one per CPU)")
+    parser.add_argument("--force", action="store_true", help="Batch: overwrite existing target files")
+    profiling.add_profile_argument(parser)
     args = parser.parse_args()
+    profiling.start("manual_ingest", args.profile)
+
+    if args.batch:
+        if args.stub or args.transcript_file:
+            parser.error("--batch cannot be combined with --stub or --transcript-file")
+        batch_main(args)
+        return
+    if not args.with_whom or not args.project:
+        parser.error("--with-whom and --project are required")
 
     from datetime import date as date_module
     date_str = (args.date or "").strip()
@@ -114,9 +594,7 @@ def main():
     if not title:
         title = f"Catch up {with_whom}" if args.stub else f"{date_str} {with_whom}"
 
-    slug = clean_filename(title) if args.title else clean_filename(with_whom)
-    out_filename = f"{date_str}_{slug}_manual.md"
-    out_path = os.path.join(MANUAL_BASE, out_filename)
+    out_path = output_path(date_str, title if args.title else with_whom)
 
     if args.stub:
         if args.dry_run:
@@ -128,40 +606,28 @@ def main():
         print("Fill the transcript under # Raw Transcript, then ask the agent to summarize.")
         return
 
-    if args.transcript_file:
-        with open(args.transcript_file, "r", encoding="utf-8") as f:
-            raw_text = f.read()
-    else:
-        raw_text = sys.stdin.read()
-
-    blocks = parse_hinotes_transcript(raw_text)
-    if not blocks:
-        print("WARNING: No transcript blocks parsed. Check format (Unknown Speaker / HH:MM:SS / paragraph).", file=sys.stderr)
+    source = open(args.transcript_file, "r", encoding="utf-8") if args.transcript_file else sys.stdin
+    with source, profiling.phase("parse+write"):
+        fmt, blocks = parse_transcript(source, args.format)
+        if args.dry_run:
+            count = sum(1 for _ in blocks)
+        else:
+            header = transcript_frontmatter(date_str, title, with_whom, project) + "\n# Raw Transcript\n\n"
+            count = write_transcript(out_path, header, blocks)
+    profiling.count("blocks", count)
+    if not count:
+        print(
+            f"WARNING: No transcript blocks parsed as {fmt}. Check the format or pass --format.",
+            file=sys.stderr,
+        )
 
     if args.dry_run:
         print(f"Would write: {out_path}")
-        print(f"Parsed blocks: {len(blocks)}")
+        print(f"Parsed blocks: {count} ({fmt})")
         return
 
-    os.makedirs(MANUAL_BASE, exist_ok=True)
-    body = format_transcript_body(blocks)
-    content = f"""---
-title: "{title}"
-date: {date_str}
-with_whom: {with_whom}
-project: {project}
-source: manual
-tags: [transcript, manual, meeting]
----
-
-# Raw Transcript
-
-{body}
-"""
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write(content)
     print(f"SAVED: {out_path}")
-    print(f"Parsed blocks: {len(blocks)}")
+    print(f"Parsed blocks: {count} ({fmt})")
     print("Ask the agent to summarize this transcript, then review before distilling.")
 
 
@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+"""
+Who-met-whom index: person records joined from meetings, transcripts and People pages.
+
+Stored in .tmp/people_index.sqlite3. Every mention of a person is one row keyed by a normalized
+name: meeting-note and transcript `participants` (names or emails), speaker names in a raw
+transcript (Fireflies `Name:`, HiDock after write-back, manual `**Name (ts):**`; generic
+`Speaker N` labels are skipped), manual `with_whom`, and People/<Project>/<Name>.md pages.
+An email counts under the name its local part spells (alex.kim@… → "alex kim"); a People page's
+`aliases:` and `email:` / `emails:` fold other spellings into the page's person. Files are re-read
+only when their mtime/size changes, so `person` is an indexed lookup rather than a vault-wide rg.
+
+Usage:
+  python scripts/people_index.py person "Alex Kim" [--project acme] [--since YYYY-MM-DD] [--limit 20] [--json]
+  python scripts/people_index.py list [--project acme] [--since YYYY-MM-DD] [--limit 50] [--json]
+  python scripts/people_index.py refresh | stats | rebuild
+
+Safe to delete .tmp/people_index.sqlite3 at any time; it is rebuilt on the next run.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+from collections import Counter
+from pathlib import Path
+
+from lexicon_core.archive import read_text
+from lexicon_core.frontmatter import FRONTMATTER_RE, parse_frontmatter, read_frontmatter_block
+from vault_index import REPO_ROOT, file_capture_date, frontmatter_project, normalize_date, walk_markdown
+
+INDEX_FILENAME = os.path.join(".tmp", "people_index.sqlite3")
+SCHEMA_VERSION = 1
+LAYERS = ("People", "Meetings", "Transcripts")
+DEFAULT_LIMIT = 20
+DEFAULT_LIST_LIMIT = 50
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    layer TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_layer ON files(layer);
+CREATE TABLE IF NOT EXISTS mentions (
+    path TEXT NOT NULL,
+    key TEXT NOT NULL,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    role TEXT NOT NULL,
+    layer TEXT NOT NULL,
+    date TEXT NOT NULL,
+    project TEXT NOT NULL,
+    title TEXT NOT NULL,
+    PRIMARY KEY (path, key, email, role)
+);
+CREATE INDEX IF NOT EXISTS mentions_key ON mentions(key);
+CREATE INDEX IF NOT EXISTS mentions_email ON mentions(email);
+CREATE TABLE IF NOT EXISTS aliases (
+    alias TEXT NOT NULL,
+    person TEXT NOT NULL,
+    path TEXT NOT NULL,
+    PRIMARY KEY (alias, person, path)
+);
+CREATE INDEX IF NOT EXISTS aliases_person ON aliases(person);
+CREATE INDEX IF NOT EXISTS aliases_path ON aliases(path);
+"""
+
+EMAIL_RE = re.compile(r"[\w.+'-]+@[\w-]+(?:\.[\w-]+)+")
+WIKILINK_RE = re.compile(r"^\[\[([^\]|#]+)(?:[|#][^\]]*)?\]\]$")
+# `Name: text`, `**Name:** text`, `**Name (00:01:02):** text` at the start of a transcript line.
+SPEAKER_RE = re.compile(r"^(?:\*\*)?([^\W\d_][\w.'’ -]{0,60}?)(?: \([\d:.]+\))?:(?:\*\*)? ", re.MULTILINE)
+# Placeholder labels, not people: "Unknown Speaker", "Speaker 12", "spk_0", "Guest A".
+GENERIC_SPEAKER_RE = re.compile(
+    r"^(?:unknown(?:[ _]speaker)?|speaker|spk|participant|guest)(?:[ _]?(?:\d+|[a-z]))?$", re.IGNORECASE
+)
+MAX_NAME_WORDS = 5
+RAW_TRANSCRIPT_RE = re.compile(r"^#[ \t]+Raw Transcript[ \t]*$", re.MULTILINE | re.IGNORECASE)
+
+
+def person_key(name: str) -> str:
+    """Lookup key for a name or email: lower-case, single-spaced; emails stay whole."""
+    return " ".join(name.replace("_", " ").split()).casefold()
+
+
+def email_name(email: str) -> str:
+    """Name spelled by an email's local part: alex.kim+x@acme.com → 'alex kim'."""
+    local = email.split("@", 1)[0].split("+", 1)[0]
+    return " ".join(p for p in re.split(r"[._-]+", local) if p and not p.isdigit())
+
+
+def _as_list(val) -> list[str]:
+    if isinstance(val, list):
+        return [str(v) for v in val]
+    if isinstance(val, str) and val.strip():
+        return val.split(",") if "," in val and "@" not in val and "[[" not in val else [val]
+    return []
+
+
+def split_person(raw: str) -> tuple[str, str]:
+    """A participants / with_whom item → (name, email); either may be ''."""
+    raw = raw.strip().strip('"').strip("'").strip()
+    m = WIKILINK_RE.match(raw)
+    if m:
+        raw = m.group(1).rsplit("/", 1)[-1]
+    m = EMAIL_RE.search(raw)
+    if not m:
+        return raw, ""
+    email = m.group(0).lower()
+    name = (raw[: m.start()] + raw[m.end() :]).strip(" <>()\"',")
+    return name, email
+
+
+def transcript_speakers(text: str) -> Counter:
+    """Named speakers of a transcript body (lines under # Raw Transcript, else after the frontmatter)."""
+    m = RAW_TRANSCRIPT_RE.search(text) or FRONTMATTER_RE.match(text)
+    body = text[m.end() :] if m else text
+    names: Counter = Counter()
+    for match in SPEAKER_RE.finditer(body):
+        name = match.group(1).strip()
+        if len(name.split()) > MAX_NAME_WORDS or GENERIC_SPEAKER_RE.match(name):
+            continue
+        names[name] += 1
+    return names
+
+
+def _layer_project(layer: str, rel: str, fm: dict) -> str:
+    """Frontmatter project, else the Meetings/<project>/ or People/<project>/ folder."""
+    project = frontmatter_project(fm)
+    if project or layer == "Transcripts":
+        return project
+    parts = rel.split("/")
+    return parts[1].lower() if len(parts) > 2 else ""
+
+
+def extract(layer: str, rel: str, text: str) -> tuple[list[tuple], list[str]]:
+    """(mention rows without path, aliases) for one file's text; aliases only for People pages."""
+    fm = parse_frontmatter(text)
+    date = file_capture_date(rel, fm)
+    project = _layer_project(layer, rel, fm)
+    title = fm.get("title") if isinstance(fm.get("title"), str) and fm.get("title") else Path(rel).stem
+    rows: dict[tuple, tuple] = {}
+
+    def add(raw: str, role: str) -> None:
+        name, email = split_person(raw)
+        key = person_key(name or email_name(email))
+        if not key:
+            return
+        rows.setdefault((key, email, role), (key, name, email, role, layer, date, project, title))
+
+    aliases: list[str] = []
+    if layer == "People":
+        name = Path(rel).stem
+        add(name, "page")
+        aliases = [name]
+        for field in ("aliases", "alias", "email", "emails"):
+            for raw in _as_list(fm.get(field)):
+                alias_name, email = split_person(raw)
+                aliases.extend(a for a in (alias_name, email) if a)
+        return list(rows.values()), sorted({person_key(a) for a in aliases if person_key(a)})
+
+    for raw in _as_list(fm.get("participants")):
+        add(raw, "participant")
+    for raw in _as_list(fm.get("with_whom")):
+        add(raw, "with_whom")
+    if layer == "Transcripts":
+        for name in transcript_speakers(text):
+            add(name, "speaker")
+    return list(rows.values()), aliases
+
+
+def _read(layer: str, path: str) -> str:
+    """Transcripts are read whole (speaker lines), archived ones decompressed; others need only frontmatter."""
+    if layer == "Transcripts":
+        return read_text(path)
+    return read_frontmatter_block(path)
+
+
+class PeopleIndex:
+    """Person mentions across People/, Meetings/ and Transcripts/, refreshed by mtime + size."""
+
+    def __init__(self, root=None, db_path: str | None = None):
+        self.root = os.path.abspath(str(root or REPO_ROOT))
+        self.db_path = db_path or os.path.join(self.root, INDEX_FILENAME)
+        self.conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        try:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+        except (OSError, sqlite3.Error) as e:
+            print(f"people index unavailable ({e}); using in-memory index", file=sys.stderr)
+            conn = sqlite3.connect(":memory:")
+            version = 0
+        if version != SCHEMA_VERSION:
+            conn.executescript("DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS mentions; DROP TABLE IF EXISTS aliases;")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.executescript(SCHEMA)
+        return conn
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "PeopleIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def refresh(self, layers=LAYERS) -> dict:
+        """Re-read new/changed files and drop deleted ones. Returns counts."""
+        stats = {"scanned": 0, "updated": 0, "removed": 0}
+        for layer in layers:
+            known = {
+                path: (mtime_ns, size)
+                for path, mtime_ns, size in self.conn.execute(
+                    "SELECT path, mtime_ns, size FROM files WHERE layer = ?", (layer,)
+                )
+            }
+            seen = set()
+            with self.conn:
+                for rel, path, mtime_ns, size in walk_markdown(self.root, layer):
+                    seen.add(rel)
+                    if known.get(rel) == (mtime_ns, size):
+                        continue
+                    try:
+                        text = _read(layer, path)
+                    except OSError:
+                        continue
+                    self._store(layer, rel, mtime_ns, size, text)
+                    stats["updated"] += 1
+                for rel in known:
+                    if rel not in seen:
+                        self._forget(rel)
+                        stats["removed"] += 1
+            stats["scanned"] += len(seen)
+        return stats
+
+    def _forget(self, rel: str) -> None:
+        for table in ("files", "mentions", "aliases"):
+            self.conn.execute(f"DELETE FROM {table} WHERE path = ?", (rel,))
+
+    def _store(self, layer: str, rel: str, mtime_ns: int, size: int, text: str) -> None:
+        self._forget(rel)
+        rows, aliases = extract(layer, rel, text)
+        self.conn.execute(
+            "INSERT INTO files (path, layer, mtime_ns, size) VALUES (?, ?, ?, ?)", (rel, layer, mtime_ns, size)
+        )
+        self.conn.executemany(
+            "INSERT INTO mentions (path, key, name, email, role, layer, date, project, title) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(rel, *row) for row in rows],
+        )
+        if aliases:
+            person = person_key(Path(rel).stem)
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO aliases (alias, person, path) VALUES (?, ?, ?)",
+                [(alias, person, rel) for alias in aliases],
+            )
+
+    def resolve(self, query: str) -> list[str]:
+        """Keys that name the same person as query (People-page aliases), or [] when unknown.
+
+        An unknown single word falls back to a first-name match when it is unambiguous; when it
+        is not, the candidates are returned as a ValueError.
+        """
+        q = person_key(query)
+        keys = {
+            alias
+            for (alias,) in self.conn.execute(
+                "SELECT alias FROM aliases WHERE person IN (SELECT person FROM aliases WHERE alias = ?)", (q,)
+            )
+        }
+        if keys or self.conn.execute("SELECT 1 FROM mentions WHERE key = ? OR email = ? LIMIT 1", (q, q)).fetchone():
+            return sorted(keys | {q})
+        if " " in q or "@" in q:
+            return []
+        # First name only: keys 'q …' (a range scan on the key index).
+        candidates = sorted(
+            {
+                self._person_of(key)
+                for (key,) in self.conn.execute(
+                    "SELECT DISTINCT key FROM mentions WHERE key >= ? AND key < ?", (q + " ", q + "!")
+                )
+            }
+        )
+        if len(candidates) > 1:
+            raise ValueError(f"{query!r} matches several people: {', '.join(candidates)}")
+        return self.resolve(candidates[0]) if candidates else []
+
+    def _person_of(self, key: str) -> str:
+        row = self.conn.execute("SELECT person FROM aliases WHERE alias = ? LIMIT 1", (key,)).fetchone()
+        return row[0] if row else key
+
+    def person(self, query: str, project=None, since=None, limit: int = DEFAULT_LIMIT) -> dict | None:
+        """Person record: display name, pages, emails, spellings, first/last contact and timeline."""
+        keys = self.resolve(query)
+        if not keys:
+            return None
+        marks = ", ".join("?" for _ in keys)
+        rows = self.conn.execute(
+            "SELECT path, key, name, email, role, layer, date, project, title FROM mentions "
+            f"WHERE key IN ({marks}) OR email IN ({marks}) ORDER BY date DESC, path",
+            [*keys, *keys],
+        ).fetchall()
+        pages = sorted({r[0] for r in rows if r[4] == "page"})
+        names = Counter(r[2] for r in rows if r[4] != "page" and r[2])
+        display = Path(pages[0]).stem if pages else (names.most_common(1)[0][0] if names else rows[0][1])
+        timeline: dict[str, dict] = {}
+        for path, _key, _name, _email, role, layer, date, proj, title in rows:
+            if role == "page":
+                continue
+            item = timeline.setdefault(
+                path, {"date": date, "path": path, "layer": layer, "project": proj, "title": title, "roles": []}
+            )
+            if role not in item["roles"]:
+                item["roles"].append(role)
+        contacts = [t for t in timeline.values() if t["date"]]
+        selected = [
+            t
+            for t in timeline.values()
+            if (not project or t["project"] == project.lower()) and (not since or (t["date"] and t["date"] >= since))
+        ]
+        return {
+            "name": display,
+            "pages": pages,
+            "emails": sorted({r[3] for r in rows if r[3]}),
+            "names": [n for n, _c in names.most_common() if person_key(n) != person_key(display)],
+            "projects": sorted({t["project"] for t in timeline.values() if t["project"]}),
+            "first_contact": min((t["date"] for t in contacts), default=""),
+            "last_contact": max((t["date"] for t in contacts), default=""),
+            "mentions": len(timeline),
+            "timeline": selected[:limit] if limit else selected,
+        }
+
+    def people(self, project=None, since=None, limit: int = DEFAULT_LIST_LIMIT) -> list[dict]:
+        """Everyone mentioned outside their own page, most recent contact first."""
+        where, params = ["m.role != 'page'"], []
+        if project:
+            where.append("m.project = ?")
+            params.append(project.lower())
+        sql = (
+            "SELECT COALESCE(ae.person, ak.person, m.key) AS who, MAX(NULLIF(m.name, '')), MAX(m.date), "
+            "MIN(NULLIF(m.date, '')), "
+            "COUNT(DISTINCT m.path), GROUP_CONCAT(DISTINCT m.project) FROM mentions m "
+            "LEFT JOIN aliases ae ON ae.alias = m.email "
+            "LEFT JOIN aliases ak ON ak.alias = m.key "
+            f"WHERE {' AND '.join(where)} GROUP BY who"
+        )
+        if since:
+            sql += " HAVING MAX(m.date) >= ?"
+            params.append(since)
+        sql += " ORDER BY MAX(m.date) DESC, who"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        pages = {
+            person: path
+            for person, path in self.conn.execute("SELECT person, MIN(path) FROM aliases GROUP BY person")
+        }
+        out = []
+        for person, name, last, first, mentions, projects in self.conn.execute(sql, params):
+            out.append(
+                {
+                    "person": Path(pages[person]).stem if person in pages else (name or person),
+                    "page": pages.get(person, ""),
+                    "last_contact": last or "",
+                    "first_contact": first or "",
+                    "mentions": mentions,
+                    "projects": sorted(p for p in (projects or "").split(",") if p),
+                }
+            )
+        return out
+
+    def counts(self) -> dict[str, int]:
+        return {
+            "files": self.conn.execute("SELECT COUNT(*) FROM files").fetchone()[0],
+            "people": self.conn.execute("SELECT COUNT(DISTINCT key) FROM mentions").fetchone()[0],
+            "mentions": self.conn.execute("SELECT COUNT(*) FROM mentions").fetchone()[0],
+            "pages": self.conn.execute("SELECT COUNT(*) FROM mentions WHERE role = 'page'").fetchone()[0],
+        }
+
+
+def print_person(record: dict) -> None:
+    page = f"  ({', '.join(record['pages'])})" if record["pages"] else "  (no People page)"
+    print(record["name"] + page)
+    for label, key in (("emails", "emails"), ("also seen as", "names"), ("projects", "projects")):
+        if record[key]:
+            print(f"  {label}: {', '.join(record[key])}")
+    if record["last_contact"]:
+        print(
+            f"  first contact {record['first_contact']}, last contact {record['last_contact']} "
+            f"(files: {record['mentions']})"
+        )
+    if record["timeline"]:
+        print()
+    for item in record["timeline"]:
+        print(f"  {item['date'] or '----------'}  {item['path']}  ({', '.join(item['roles'])})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Person records from participants, speakers and People pages")
+    sub = parser.add_subparsers(dest="command", required=True)
+    scope = argparse.ArgumentParser(add_help=False)
+    scope.add_argument("--project", help="Only meetings/transcripts of this project")
+    scope.add_argument("--since", help="Only contacts on/after YYYY-MM-DD")
+    scope.add_argument("--json", action="store_true", help="JSON output")
+    person_p = sub.add_parser("person", parents=[scope], help="One person's page, emails and meeting timeline")
+    person_p.add_argument("name", help="Name, first name, alias or email")
+    person_p.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help=f"Timeline rows (default {DEFAULT_LIMIT}, 0 = all)")
+    list_p = sub.add_parser("list", parents=[scope], help="Everyone, by most recent contact")
+    list_p.add_argument("--limit", type=int, default=DEFAULT_LIST_LIMIT, help=f"Max people (default {DEFAULT_LIST_LIMIT}, 0 = all)")
+    sub.add_parser("refresh", help="Re-read new/changed files")
+    sub.add_parser("stats", help="Print indexed counts")
+    sub.add_parser("rebuild", help="Drop the index and re-read everything")
+    args = parser.parse_args()
+
+    if args.command == "rebuild":
+        db_path = os.path.join(REPO_ROOT, INDEX_FILENAME)
+        if os.path.exists(db_path):
+            os.remove(db_path)
+
+    since = None
+    if getattr(args, "since", None):
+        since = normalize_date(args.since)
+        if not since:
+            print(f"Invalid --since date: {args.since}", file=sys.stderr)
+            sys.exit(1)
+
+    with PeopleIndex() as index:
+        stats = index.refresh()
+        if args.command in ("refresh", "stats", "rebuild"):
+            if args.command != "stats":
+                print(f"Scanned {stats['scanned']} files: {stats['updated']} re-read, {stats['removed']} removed.")
+            for key, count in index.counts().items():
+                print(f"  {key}: {count}")
+            return
+        try:
+            if args.command == "person":
+                result = index.person(args.name, project=args.project, since=since, limit=args.limit)
+            else:
+                result = index.people(project=args.project, since=since, limit=args.limit)
+        except ValueError as e:
+            print(str(e), file=sys.stderr)
+            sys.exit(1)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+    if not result:
+        print(f"No one matching {args.name!r}." if args.command == "person" else "No people indexed.")
+        return
+    if args.command == "person":
+        print_person(result)
+        return
+    for item in result:
+        page = "" if item["page"] else "  (no page)"
+        print(
+            f"{item['last_contact'] or '----------'}  {item['person']}  "
+            f"[{', '.join(item['projects'])}] files: {item['mentions']}{page}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Heading-addressed section index of Memory/ and People/ files.
+
+Stored in .tmp/section_index.sqlite3. Every file is split into its Markdown sections (heading,
+level, byte range; a section runs until the next heading of the same or higher level) and its
+dated bullets ("- YYYY-MM-DD — …") are indexed by date. Lookups then seek straight to the byte
+range instead of reading multi-thousand-line area files. Files are re-split only when their
+mtime/size changes.
+
+Usage:
+  python scripts/section_index.py get --project acme --area Product --heading "Current model"
+  python scripts/section_index.py entries --project acme --since 2026-05 [--area Product] [--heading Evidence]
+  python scripts/section_index.py toc Memory/acme/Product.md
+  python scripts/section_index.py refresh | stats
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+from datetime import datetime
+
+from vault_index import REPO_ROOT, walk_markdown
+
+INDEX_FILENAME = os.path.join(".tmp", "section_index.sqlite3")
+SCHEMA_VERSION = 1
+LAYERS = ("Memory", "People")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    layer TEXT NOT NULL,
+    project TEXT NOT NULL,
+    area TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_area ON files(project, area);
+CREATE TABLE IF NOT EXISTS sections (
+    path TEXT NOT NULL,
+    ordinal INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    heading TEXT NOT NULL,
+    start INTEGER NOT NULL,
+    body_start INTEGER NOT NULL,
+    end INTEGER NOT NULL,
+    PRIMARY KEY (path, ordinal)
+);
+CREATE INDEX IF NOT EXISTS sections_heading ON sections(heading);
+CREATE TABLE IF NOT EXISTS entries (
+    path TEXT NOT NULL,
+    ordinal INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    start INTEGER NOT NULL,
+    end INTEGER NOT NULL,
+    PRIMARY KEY (path, start)
+);
+CREATE INDEX IF NOT EXISTS entries_date ON entries(date);
+"""
+
+HEADING_RE = re.compile(rb"^(#{1,6})[ \t]+(.+?)[ \t#]*\r?$")
+FENCE_RE = re.compile(rb"^\s*(```|~~~)")
+DATED_BULLET_RE = re.compile(rb"^[-*][ \t]+\**(\d{4}-\d{2}-\d{2})")
+PARTIAL_DATE_RE = re.compile(r"^\d{4}(-\d{2}){0,2}$")
+
+
+def split_sections(data: bytes) -> tuple[list[tuple], list[tuple]]:
+    """Return (sections, entries) for a file's bytes.
+
+    sections: (ordinal, level, heading, start, body_start, end); ordinal 0 is the preamble
+    before the first heading (level 0, heading ''). entries: (ordinal, date, start, end) for
+    top-level dated bullets, including their indented continuation lines.
+    """
+    sections = [[0, 0, "", 0, 0, len(data)]]
+    entries: list[list] = []
+    open_stack: list[list] = []
+    in_fence = False
+    offset = 0
+    lines = data.splitlines(keepends=True)
+    # Frontmatter is not a section boundary source.
+    if lines and lines[0].rstrip() == b"---":
+        for i in range(1, len(lines)):
+            if lines[i].rstrip() == b"---":
+                offset = sum(len(ln) for ln in lines[: i + 1])
+                lines = lines[i + 1 :]
+                break
+    for line in lines:
+        start, offset = offset, offset + len(line)
+        if FENCE_RE.match(line):
+            in_fence = not in_fence
+        if entries and entries[-1][3] is None:
+            if line[:1] in (b" ", b"\t") and line.strip():
+                pass  # continuation of the open bullet
+            else:
+                entries[-1][3] = start
+        if in_fence:
+            continue
+        m = HEADING_RE.match(line)
+        if m:
+            level = len(m.group(1))
+            while open_stack and open_stack[-1][1] >= level:
+                open_stack.pop()[5] = start
+            if len(sections) == 1:
+                sections[0][5] = start
+            section = [len(sections), level, m.group(2).decode("utf-8", "replace").strip(), start, offset, len(data)]
+            sections.append(section)
+            open_stack.append(section)
+            continue
+        d = DATED_BULLET_RE.match(line)
+        if d:
+            entries.append([sections[-1][0], d.group(1).decode("ascii"), start, None])
+    for entry in entries:
+        if entry[3] is None:
+            entry[3] = len(data)
+    return [tuple(s) for s in sections], [tuple(e) for e in entries]
+
+
+def _path_meta(rel: str) -> tuple[str, str]:
+    """(project, area) for Memory/<Project>/<Area>.md or People/<Project>/<Name>.md."""
+    parts = rel[:-3].split("/") if rel.endswith(".md") else rel.split("/")
+    if len(parts) < 3:
+        return "", "/".join(parts[1:])
+    return parts[1].lower(), "/".join(parts[2:])
+
+
+def read_range(path: str, start: int, end: int) -> str:
+    with open(path, "rb") as f:
+        f.seek(start)
+        return f.read(end - start).decode("utf-8", errors="replace")
+
+
+def bound_date(val: str | None, upper: bool) -> str | None:
+    """YYYY, YYYY-MM or YYYY-MM-DD → inclusive comparison bound for ISO dates."""
+    if not val:
+        return None
+    if not PARTIAL_DATE_RE.match(val):
+        raise ValueError(f"expected YYYY[-MM[-DD]], got {val!r}")
+    try:
+        datetime.strptime(val, ("%Y", "%Y-%m", "%Y-%m-%d")[val.count("-")])
+    except ValueError:
+        raise ValueError(f"no such date: {val!r}") from None
+    pad = ("-12", "-31") if upper else ("-01", "-01")
+    while val.count("-") < 2:
+        val += pad[val.count("-")]
+    return val
+
+
+class SectionIndex:
+    """Byte-offset index of headings and dated bullets in Memory/ and People/ files."""
+
+    def __init__(self, root=None, db_path: str | None = None):
+        self.root = os.path.abspath(str(root or REPO_ROOT))
+        self.db_path = db_path or os.path.join(self.root, INDEX_FILENAME)
+        self.conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        try:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+        except (OSError, sqlite3.Error) as e:
+            print(f"section index unavailable ({e}); using in-memory index", file=sys.stderr)
+            conn = sqlite3.connect(":memory:")
+            version = 0
+        if version != SCHEMA_VERSION:
+            conn.executescript("DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS sections; DROP TABLE IF EXISTS entries;")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.executescript(SCHEMA)
+        return conn
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "SectionIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def refresh(self, layers=LAYERS) -> dict:
+        """Re-split new/changed files and drop deleted ones. Returns counts."""
+        stats = {"scanned": 0, "updated": 0, "removed": 0}
+        for layer in layers:
+            known = {
+                path: (mtime_ns, size)
+                for path, mtime_ns, size in self.conn.execute(
+                    "SELECT path, mtime_ns, size FROM files WHERE layer = ?", (layer,)
+                )
+            }
+            seen = set()
+            with self.conn:
+                for rel, path, mtime_ns, size in walk_markdown(self.root, layer):
+                    seen.add(rel)
+                    if known.get(rel) == (mtime_ns, size):
+                        continue
+                    try:
+                        with open(path, "rb") as f:
+                            data = f.read()
+                    except OSError:
+                        continue
+                    self._store(layer, rel, mtime_ns, size, data)
+                    stats["updated"] += 1
+                for rel in known:
+                    if rel not in seen:
+                        self._forget(rel)
+                        stats["removed"] += 1
+            stats["scanned"] += len(seen)
+        return stats
+
+    def _forget(self, rel: str) -> None:
+        for table in ("files", "sections", "entries"):
+            self.conn.execute(f"DELETE FROM {table} WHERE path = ?", (rel,))
+
+    def _store(self, layer: str, rel: str, mtime_ns: int, size: int, data: bytes) -> None:
+        self._forget(rel)
+        project, area = _path_meta(rel)
+        sections, entries = split_sections(data)
+        self.conn.execute(
+            "INSERT INTO files (path, layer, project, area, mtime_ns, size) VALUES (?, ?, ?, ?, ?, ?)",
+            (rel, layer, project, area, mtime_ns, size),
+        )
+        self.conn.executemany(
+            "INSERT INTO sections (path, ordinal, level, heading, start, body_start, end) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(rel, *s) for s in sections],
+        )
+        self.conn.executemany(
+            "INSERT INTO entries (path, ordinal, date, start, end) VALUES (?, ?, ?, ?, ?)",
+            [(rel, *e) for e in entries],
+        )
+
+    def _file_filter(self, project, area, layer, paths) -> tuple[str, list]:
+        where, params = [], []
+        if project:
+            where.append("f.project = ?")
+            params.append(project.lower())
+        if area:
+            where.append("lower(f.area) = ?")
+            params.append(area.lower())
+        if layer:
+            where.append("f.layer = ?")
+            params.append(layer)
+        if paths:
+            where.append(f"f.path IN ({', '.join('?' for _ in paths)})")
+            params.extend(paths)
+        return " AND ".join(where) or "1", params
+
+    def toc(self, rel: str) -> list[dict]:
+        return [
+            {"ordinal": o, "level": lv, "heading": h, "start": s, "end": e}
+            for o, lv, h, s, e in self.conn.execute(
+                "SELECT ordinal, level, heading, start, end FROM sections WHERE path = ? AND ordinal > 0 "
+                "ORDER BY ordinal",
+                (rel,),
+            )
+        ]
+
+    def sections(
+        self, heading: str, project=None, area=None, layer=None, paths=None, with_heading: bool = True
+    ) -> list[dict]:
+        """Sections titled `heading` (case-insensitive), text read by seek."""
+        where, params = self._file_filter(project, area, layer, paths)
+        rows = self.conn.execute(
+            "SELECT s.path, s.heading, s.start, s.body_start, s.end FROM sections s "
+            f"JOIN files f ON f.path = s.path WHERE lower(s.heading) = ? AND {where} "
+            "ORDER BY s.path, s.start",
+            [heading.strip().lower(), *params],
+        ).fetchall()
+        out = []
+        for rel, title, start, body_start, end in rows:
+            text = read_range(os.path.join(self.root, rel), start if with_heading else body_start, end)
+            out.append({"path": rel, "heading": title, "start": start, "end": end, "text": text})
+        return out
+
+    def entries(
+        self, since=None, until=None, heading=None, project=None, area=None, layer=None, paths=None
+    ) -> list[dict]:
+        """Dated bullets in range (optionally only under `heading`), newest first."""
+        where, params = self._file_filter(project, area, layer, paths)
+        sql = (
+            "SELECT e.path, e.date, e.start, e.end, s.heading FROM entries e "
+            "JOIN sections s ON s.path = e.path AND s.ordinal = e.ordinal "
+            f"JOIN files f ON f.path = e.path WHERE {where}"
+        )
+        lo, hi = bound_date(since, upper=False), bound_date(until, upper=True)
+        if lo:
+            sql += " AND e.date >= ?"
+            params.append(lo)
+        if hi:
+            sql += " AND e.date <= ?"
+            params.append(hi)
+        if heading:
+            sql += " AND lower(s.heading) = ?"
+            params.append(heading.strip().lower())
+        rows = self.conn.execute(sql + " ORDER BY e.path, e.start", params).fetchall()
+        out = []
+        handle, handle_path = None, None
+        try:
+            for rel, date, start, end, section in rows:
+                if rel != handle_path:
+                    if handle:
+                        handle.close()
+                    handle, handle_path = open(os.path.join(self.root, rel), "rb"), rel
+                handle.seek(start)
+                text = handle.read(end - start).decode("utf-8", errors="replace").rstrip()
+                out.append({"path": rel, "date": date, "section": section, "text": text})
+        finally:
+            if handle:
+                handle.close()
+        out.sort(key=lambda e: (e["date"], e["path"]), reverse=True)
+        return out
+
+    def counts(self) -> dict[str, int]:
+        return {
+            "files": self.conn.execute("SELECT COUNT(*) FROM files").fetchone()[0],
+            "sections": self.conn.execute("SELECT COUNT(*) FROM sections WHERE ordinal > 0").fetchone()[0],
+            "entries": self.conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0],
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Heading / dated-entry index of Memory and People files")
+    sub = parser.add_subparsers(dest="command", required=True)
+    scope = argparse.ArgumentParser(add_help=False)
+    scope.add_argument("--project", help="Project folder (Memory/<project>/, People/<project>/)")
+    scope.add_argument("--area", help="File within the project, e.g. Product, Partners/Acme, or a person")
+    scope.add_argument("--layer", choices=LAYERS, help="Only Memory or only People")
+    scope.add_argument("--json", action="store_true", help="JSON output")
+    get_p = sub.add_parser("get", parents=[scope], help="Print sections with the given heading")
+    get_p.add_argument("--heading", required=True, help='Heading text, e.g. "Current model"')
+    entries_p = sub.add_parser("entries", parents=[scope], help="Dated bullets in a date range")
+    entries_p.add_argument("--since", help="YYYY[-MM[-DD]], inclusive")
+    entries_p.add_argument("--until", help="YYYY[-MM[-DD]], inclusive")
+    entries_p.add_argument("--heading", help='Only bullets under this heading, e.g. "Evidence"')
+    toc_p = sub.add_parser("toc", help="List a file's sections with byte offsets")
+    toc_p.add_argument("path", help="Repo-relative path, e.g. Memory/acme/Product.md")
+    sub.add_parser("refresh", help="Re-split new/changed files")
+    sub.add_parser("stats", help="Print indexed counts")
+    args = parser.parse_args()
+
+    for flag in ("since", "until"):
+        val = getattr(args, flag, None)
+        try:
+            bound_date(val, upper=False)
+        except ValueError:
+            print(f"Invalid --{flag} date: {val} (expected YYYY[-MM[-DD]])", file=sys.stderr)
+            sys.exit(1)
+
+    with SectionIndex() as index:
+        index.refresh()
+        if args.command in ("refresh", "stats"):
+            for key, count in index.counts().items():
+                print(f"  {key}: {count}")
+            return
+        if args.command == "toc":
+            rel = args.path
+            if not os.path.exists(os.path.join(REPO_ROOT, rel)):
+                rel = os.path.relpath(os.path.abspath(rel), REPO_ROOT)
+            rel = rel.replace(os.sep, "/")
+            for s in index.toc(rel):
+                print(f"{'  ' * (s['level'] - 1)}{'#' * s['level']} {s['heading']}  [{s['start']}:{s['end']}]")
+            return
+        scope_args = {"project": args.project, "area": args.area, "layer": args.layer}
+        try:
+            if args.command == "get":
+                results = index.sections(args.heading, **scope_args)
+            else:
+                results = index.entries(args.since, args.until, args.heading, **scope_args)
+        except ValueError as e:
+            print(str(e), file=sys.stderr)
+            sys.exit(1)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    if not results:
+        print("No matches.")
+        return
+    if args.command == "get":
+        for item in results:
+            print(f"<!-- {item['path']} [{item['start']}:{item['end']}] -->")
+            print(item["text"].rstrip())
+            print()
+    else:
+        for item in results:
+            print(f"{item['path']} ({item['section']}): {item['text']}")
+
+
+if __name__ == "__main__":
+    main()
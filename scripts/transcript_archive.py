@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Compress old raw transcripts in place (cold storage) and read them back.
+
+Transcripts are the last layer search.mdc reaches for, but most of the vault's bytes. `archive`
+gzips (or xz-compresses) transcripts older than N days: Foo.md becomes a stub holding the original
+frontmatter plus `archived: Foo.md.gz`, and the full file sits next to it as Foo.md.gz. Indexes,
+hidock_pending and the Fireflies existing-file check read the stub's frontmatter; lexicon_search
+and manual_ingest read the compressed body transparently (lexicon_core.archive.read_text).
+
+Age comes from the frontmatter date (or a YYYY-MM-DD filename prefix), else the file mtime.
+
+Usage:
+  python scripts/transcript_archive.py archive [--older-than 180] [--format gz|xz] [--dry-run] [ROOT ...]
+  python scripts/transcript_archive.py restore PATH [PATH ...] | --all [ROOT ...]
+  python scripts/transcript_archive.py cat PATH
+  python scripts/transcript_archive.py stats [ROOT ...]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta
+
+from lexicon_core.archive import ARCHIVE_KEY, FORMATS, archive_file, archive_name, read_text, restore_file
+from lexicon_core.frontmatter import read_frontmatter, read_frontmatter_block
+from vault_index import REPO_ROOT, file_capture_date, walk_markdown
+
+TRANSCRIPT_ROOTS = ("Transcripts/Fireflies", "Transcripts/HiDock", "Transcripts/Manual")
+DEFAULT_OLDER_THAN_DAYS = 180
+# Below this a stub plus a compressed copy saves next to nothing.
+MIN_ARCHIVE_BYTES = 4096
+
+
+def stub_archive_name(path: str) -> str | None:
+    """archive_name() from the file's frontmatter alone."""
+    return archive_name(read_frontmatter_block(path))
+
+
+def iter_transcripts(roots):
+    for root_rel in roots:
+        yield from walk_markdown(REPO_ROOT, root_rel)
+
+
+def archive(roots, older_than: int, fmt: str, dry_run: bool) -> None:
+    cutoff = (datetime.now() - timedelta(days=older_than)).strftime("%Y-%m-%d")
+    files = before = after = 0
+    for rel, path, mtime_ns, size in iter_transcripts(roots):
+        if size < MIN_ARCHIVE_BYTES:
+            continue
+        try:
+            fm = read_frontmatter(path)
+        except OSError:
+            continue
+        if ARCHIVE_KEY in fm:
+            continue
+        date = file_capture_date(rel, fm) or datetime.fromtimestamp(mtime_ns / 1e9).strftime("%Y-%m-%d")
+        if date >= cutoff:
+            continue
+        if dry_run:
+            print(f"would archive  {rel}  ({size / 1024:.0f} KB)")
+            files += 1
+            before += size
+            continue
+        try:
+            result = archive_file(path, fmt)
+        except OSError as e:
+            print(f"ERROR: {rel}: {e}", file=sys.stderr)
+            continue
+        if result:
+            files += 1
+            before += result[0]
+            after += result[1]
+    if dry_run:
+        print(f"{files} transcripts older than {cutoff} ({before / 1e6:.1f} MB) would be archived as .{fmt}.")
+        return
+    saved = f", {before / 1e6:.1f} MB → {after / 1e6:.1f} MB" if files else ""
+    print(f"Archived {files} transcripts older than {cutoff}{saved}.")
+
+
+def restore(paths, restore_all: bool, roots) -> None:
+    if restore_all:
+        paths = [path for _rel, path, _m, _s in iter_transcripts(roots) if stub_archive_name(path)]
+    restored = 0
+    for path in paths:
+        try:
+            if restore_file(path):
+                restored += 1
+            elif not restore_all:
+                print(f"Not archived: {path}", file=sys.stderr)
+        except OSError as e:
+            print(f"ERROR: {path}: {e}", file=sys.stderr)
+    print(f"Restored {restored} transcripts.")
+
+
+def stats(roots) -> None:
+    print(f"{'Root':<24} {'live':>7} {'MB':>8} {'archived':>9} {'MB':>8}")
+    for root_rel in roots:
+        live = live_bytes = archived = archived_bytes = 0
+        for _rel, path, _m, size in walk_markdown(REPO_ROOT, root_rel):
+            name = stub_archive_name(path)
+            if name is None:
+                live += 1
+                live_bytes += size
+                continue
+            archived += 1
+            try:
+                archived_bytes += size + os.path.getsize(os.path.join(os.path.dirname(path), name))
+            except OSError:
+                archived_bytes += size
+        print(f"{root_rel:<24} {live:>7} {live_bytes / 1e6:>8.1f} {archived:>9} {archived_bytes / 1e6:>8.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compress old transcripts in place and read them back")
+    sub = parser.add_subparsers(dest="command", required=True)
+    archive_p = sub.add_parser("archive", help="Compress transcripts older than N days")
+    archive_p.add_argument("roots", nargs="*", help=f"Roots (default: {', '.join(TRANSCRIPT_ROOTS)})")
+    archive_p.add_argument(
+        "--older-than", type=int, default=DEFAULT_OLDER_THAN_DAYS, metavar="DAYS", help="Age cutoff (default 180)"
+    )
+    archive_p.add_argument("--format", choices=sorted(FORMATS), default="gz", help="gz (fast) or xz (smaller)")
+    archive_p.add_argument("--dry-run", action="store_true", help="List what would be archived")
+    restore_p = sub.add_parser("restore", help="Decompress archived transcripts back in place")
+    restore_p.add_argument("paths", nargs="*", help="Stub paths (or roots with --all)")
+    restore_p.add_argument("--all", action="store_true", help="Restore every archived transcript under the roots")
+    cat_p = sub.add_parser("cat", help="Print a transcript, decompressing it if archived")
+    cat_p.add_argument("path")
+    stats_p = sub.add_parser("stats", help="Live vs archived transcripts per root")
+    stats_p.add_argument("roots", nargs="*", help=f"Roots (default: {', '.join(TRANSCRIPT_ROOTS)})")
+    args = parser.parse_args()
+
+    if args.command == "cat":
+        try:
+            sys.stdout.write(read_text(args.path))
+        except OSError as e:
+            print(f"Cannot read {args.path}: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+    if args.command == "restore":
+        if not args.all and not args.paths:
+            print("Usage: transcript_archive.py restore PATH [PATH ...] | --all [ROOT ...]", file=sys.stderr)
+            sys.exit(1)
+        roots = tuple(args.paths) if args.all and args.paths else TRANSCRIPT_ROOTS
+        restore(args.paths, args.all, roots)
+        return
+    roots = tuple(args.roots) or TRANSCRIPT_ROOTS
+    if args.command == "archive":
+        archive(roots, args.older_than, args.format, args.dry_run)
+    else:
+        stats(roots)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,8 +9,19 @@ Usage:
   python3 scripts/triage_queue.py --project personal
   python3 scripts/triage_queue.py --project acme --since 2026-04-01 --until 2026-05-24
   python3 scripts/triage_queue.py --project acme --json
+  python3 scripts/triage_queue.py --all-projects [--since YYYY-MM-DD] [--json]
+  python3 scripts/triage_queue.py --project acme --workers 0    (parallel cold scan)
+  python3 scripts/triage_queue.py --project acme --pending-only
+  python3 scripts/triage_queue.py --all-projects --pending-only  (pending decisions, every project)
+  python3 scripts/triage_queue.py --project acme --recaps 3      (last 3 triage recaps, across months)
 
 Exit 0. Writes human-readable report to stdout.
+Frontmatter is read through the shared vault index (.tmp/vault_index.sqlite3); only files
+changed since the last run are re-parsed. --all-projects prints every project's queue from
+one scan of Ideas/ and Clippings/. --since / --until are applied in the index query, so only files
+captured inside the period are decoded. When lexicon_watch.py is running the queue, recent meetings
+and pending decisions come from it instead (--no-daemon to scan anyway). Open decisions
+extracted from Memory files are cached per file by mtime in .tmp/pending_decisions.json.
 """
 from __future__ import annotations
 
@@ -19,86 +30,22 @@ import json
 import os
 import re
 import sys
+import tempfile
 from datetime import datetime
 from pathlib import Path
 
+import lexicon_watch
+from lexicon_core import profiling
+from vault_index import VaultIndex, add_workers_argument, normalize_date
+
 SCRIPT_DIR = Path(__file__).resolve().parent
 REPO_ROOT = SCRIPT_DIR.parent
 
-FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---", re.DOTALL)
-FILENAME_DATE_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})")
-RECAP_SECTION_RE = re.compile(
-    r"^## (\d{4}-\d{2}-\d{2}) triage\s*$", re.MULTILINE
-)
-
-SCAN_ROOTS = [
-    ("Ideas", lambda project, rel: rel.parts[1:2] == (project,) if len(rel.parts) > 2 else False),
-]
-
-
-def parse_frontmatter(content: str) -> dict:
-    m = FRONTMATTER_RE.match(content)
-    if not m:
-        return {}
-    result: dict = {}
-    current_key = None
-    list_items: list[str] = []
-
-    for line in m.group(1).split("\n"):
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        if stripped.startswith("- "):
-            if current_key:
-                list_items.append(stripped[2:].strip().strip('"').strip("'"))
-            continue
-        if list_items and current_key:
-            result[current_key] = list_items
-            list_items = []
-        if ":" in stripped:
-            key, _, val = stripped.partition(":")
-            key = key.strip()
-            val = val.strip().strip('"').strip("'")
-            current_key = key
-            if val and val not in ("|", ">", "'"):
-                if val.startswith("[") and val.endswith("]"):
-                    inner = val[1:-1].strip()
-                    result[key] = (
-                        [v.strip().strip('"').strip("'") for v in inner.split(",") if v.strip()]
-                        if inner
-                        else []
-                    )
-                else:
-                    result[key] = val
-            elif val in ("", "|"):
-                list_items = []
-
-    if list_items and current_key:
-        result[current_key] = list_items
-    return result
-
-
-def normalize_date(val) -> str:
-    if not val:
-        return ""
-    val = str(val).strip()
-    for fmt in ("%Y-%m-%d", "%Y/%m/%d", "%Y-%m-%d %H:%M:%S"):
-        try:
-            return datetime.strptime(val, fmt).strftime("%Y-%m-%d")
-        except ValueError:
-            continue
-    return ""
-
+RECAP_SECTION_BYTES_RE = re.compile(rb"^## \d{4}-\d{2}-\d{2} triage[ \t]*\r?$", re.MULTILINE)
+RECAP_BLOCK = 64 * 1024
+RECAP_DATE_RE = re.compile(r"^## (\d{4}-\d{2}-\d{2})")
 
-def file_capture_date(fpath: Path, fm: dict) -> str:
-    for key in ("date", "created", "published"):
-        d = normalize_date(fm.get(key))
-        if d:
-            return d
-    m = FILENAME_DATE_RE.match(fpath.name)
-    if m:
-        return m.group(1)
-    return ""
+CAPTURE_ROOTS = ("Ideas", "Clippings")
 
 
 def is_triaged(fm: dict) -> bool:
@@ -112,112 +59,99 @@ def is_triaged(fm: dict) -> bool:
     return bool(str(val).strip())
 
 
-def project_matches(fm: dict, folder_project: str | None, target: str) -> bool:
-    proj = fm.get("project")
-    if isinstance(proj, list):
-        proj = proj[0] if proj else ""
-    proj = str(proj).strip().lower() if proj else ""
-    target_l = target.lower()
-    if proj:
-        return proj == target_l
-    return folder_project == target_l if folder_project else False
+def _open_index(index: VaultIndex | None) -> VaultIndex:
+    return index if index is not None else VaultIndex(REPO_ROOT)
 
 
-def iter_capture_files(project: str):
-    """Yield (relpath, fm, capture_date, kind) for candidate capture files."""
-    for root_name, path_filter in SCAN_ROOTS:
-        base = REPO_ROOT / root_name
-        if not base.is_dir():
-            continue
-        for fpath in base.rglob("*.md"):
-            if fpath.name.startswith("."):
-                continue
-            if fpath.name.lower() == "readme.md":
-                continue
-            rel = fpath.relative_to(REPO_ROOT)
-            parts = rel.parts
-            folder_project = parts[1] if len(parts) > 2 else None
-
-            if root_name == "Ideas" and folder_project != project:
-                if folder_project == project:
-                    pass
-                else:
-                    try:
-                        content = fpath.read_text(encoding="utf-8", errors="replace")[:8192]
-                    except OSError:
-                        continue
-                    fm = parse_frontmatter(content)
-                    if not project_matches(fm, folder_project, project):
-                        continue
-                    capture_date = file_capture_date(fpath, fm)
-                    yield str(rel), fm, capture_date, root_name
-                    continue
-
-            if not path_filter(project, rel):
-                continue
+def iter_capture_files(project: str, index: VaultIndex | None = None, since=None, until=None):
+    """Yield (relpath, fm, capture_date, kind) for candidate capture files captured in the window."""
+    index = _open_index(index)
+    index.refresh(CAPTURE_ROOTS)
+    target = project.lower()
+    # Frontmatter project wins; without one, an Ideas/<project>/ folder decides.
+    rows = index.files(
+        "root IN (?, ?) AND (project = ? OR (project = '' AND root = 'Ideas' AND folder = ?))",
+        (*CAPTURE_ROOTS, target, target),
+        since=since,
+        until=until,
+    )
+    for row in rows:
+        if _is_capture_file(row):
+            yield row["path"], row["frontmatter"], row["capture_date"], row["root"]
 
-            try:
-                content = fpath.read_text(encoding="utf-8", errors="replace")[:8192]
-            except OSError:
-                continue
-            fm = parse_frontmatter(content)
-            if not project_matches(fm, folder_project, project):
-                continue
-            capture_date = file_capture_date(fpath, fm)
-            yield str(rel), fm, capture_date, root_name
 
-    clippings = REPO_ROOT / "Clippings"
-    if clippings.is_dir():
-        for fpath in clippings.rglob("*.md"):
-            if fpath.name.lower() == "readme.md":
-                continue
-            try:
-                content = fpath.read_text(encoding="utf-8", errors="replace")[:8192]
-            except OSError:
-                continue
-            fm = parse_frontmatter(content)
-            if not project_matches(fm, None, project):
-                continue
-            rel = fpath.relative_to(REPO_ROOT)
-            yield str(rel), fm, file_capture_date(fpath, fm), "Clippings"
+def _is_capture_file(row: dict) -> bool:
+    name = row["path"].rsplit("/", 1)[-1]
+    if name.lower() == "readme.md":
+        return False
+    return not (row["root"] == "Ideas" and name.startswith("."))
+
+
+def _tail_recap_sections(path: Path, count: int) -> tuple[list[str], bytes]:
+    """Last `count` triage sections of a recap log (oldest first), reading backwards in blocks.
+
+    Also returns the bytes read, which is the whole file when fewer sections exist.
+    """
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        buf = b""
+        while True:
+            step = min(RECAP_BLOCK, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+            # A match at buf[0] is only a line start when buf begins the file.
+            starts = [m.start() for m in RECAP_SECTION_BYTES_RE.finditer(buf) if m.start() or not pos]
+            if len(starts) >= count or not pos:
+                break
+    profiling.count("bytes read", len(buf))
+    starts = starts[-count:]
+    sections = [
+        buf[a:b].decode("utf-8", errors="replace").strip() for a, b in zip(starts, starts[1:] + [len(buf)])
+    ]
+    return sections, buf
 
 
-def in_date_range(capture_date: str, since: str | None, until: str | None) -> bool:
-    if not since and not until:
-        return True
-    if not capture_date:
-        return not since
-    if since and capture_date < since:
-        return False
-    if until and capture_date > until:
-        return False
-    return True
+def recap_date(path: str, section: str) -> str:
+    """Date of a triage section, else the recap file's name (a tail without a section header)."""
+    m = RECAP_DATE_RE.match(section)
+    return m.group(1) if m else Path(path).stem
 
 
-def load_last_recap(project: str) -> tuple[str, str]:
-    """Return (recap_file_relpath, last_section_text) or ('', '')."""
+def load_recaps(project: str, count: int = 1) -> list[tuple[str, str]]:
+    """Last `count` triage sections as (recap_file_relpath, section_text), oldest first.
+
+    Walks month files newest first and stops once enough sections are found. When no file has
+    a section header, returns the tail of the newest log instead, as before.
+    """
     recap_dir = REPO_ROOT / "Metadata" / "recap" / project
     if not recap_dir.is_dir():
-        return "", ""
+        return []
 
     recap_files = sorted(recap_dir.glob("*.md"), reverse=True)
     recap_files = [f for f in recap_files if f.name.lower() != "readme.md"]
-    if not recap_files:
-        return "", ""
-
-    latest = recap_files[0]
-    try:
-        text = latest.read_text(encoding="utf-8", errors="replace")
-    except OSError:
-        return "", ""
+    found: list[tuple[str, str]] = []
+    latest_tail = None
+    for recap_file in recap_files:
+        try:
+            sections, buf = _tail_recap_sections(recap_file, count - len(found))
+        except OSError:
+            continue
+        rel = str(recap_file.relative_to(REPO_ROOT))
+        if latest_tail is None:
+            latest_tail = (rel, buf.decode("utf-8", errors="replace").strip()[-2000:])
+        found[:0] = [(rel, section) for section in sections]
+        if len(found) >= count:
+            break
+    if not found and latest_tail:
+        return [latest_tail]
+    return found
 
-    matches = list(RECAP_SECTION_RE.finditer(text))
-    if not matches:
-        return str(latest.relative_to(REPO_ROOT)), text.strip()[-2000:]
 
-    last = matches[-1]
-    section = text[last.start() :].strip()
-    return str(latest.relative_to(REPO_ROOT)), section
+def load_last_recap(project: str) -> tuple[str, str]:
+    """Return (recap_file_relpath, last_section_text) or ('', '')."""
+    recaps = load_recaps(project, 1)
+    return recaps[-1] if recaps else ("", "")
 
 
 OPEN_DECISION_LINE_RE = re.compile(
@@ -258,6 +192,21 @@ def _open_decisions_from_file(
     return found
 
 
+def _pending_from_legacy_log(path: Path) -> list[str]:
+    """Old layout: Memory/<project>/_legacy/decisions.md."""
+    if not path.is_file():
+        return []
+    try:
+        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+    except OSError:
+        return []
+    return [
+        f"[legacy decisions] {ln.strip().lstrip('-').strip()}"
+        for ln in lines
+        if "pending decision" in ln.lower()
+    ]
+
+
 def _pending_from_decisions_log(path: Path) -> list[str]:
     """Classic layout: Memory/<project>/Decisions/decisions.md."""
     if not path.is_file():
@@ -277,17 +226,75 @@ def _pending_from_decisions_log(path: Path) -> list[str]:
     return found
 
 
-def pending_decisions_snippet(project: str, limit: int = 20) -> list[str]:
+DECISION_CACHE_FILENAME = os.path.join(".tmp", "pending_decisions.json")
+DECISION_CACHE_VERSION = 1
+
+
+class DecisionCache:
+    """Per-file open-decision extractions, reused while the file's mtime and size are unchanged."""
+
+    def __init__(self, root=None):
+        self.root = Path(root or REPO_ROOT)
+        self.path = self.root / DECISION_CACHE_FILENAME
+        self.entries: dict[str, dict] = {}
+        self.dirty = False
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == DECISION_CACHE_VERSION:
+                self.entries = data.get("files", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def extract(self, path: Path, key: str, extractor) -> list[str]:
+        """extractor(path) for path, or its cached result. key names the extraction rule."""
+        try:
+            st = path.stat()
+        except OSError:
+            return []
+        cache_key = f"{key}|{path.relative_to(self.root).as_posix()}"
+        stamp = [st.st_mtime_ns, st.st_size]
+        entry = self.entries.get(cache_key)
+        if entry and entry["stamp"] == stamp:
+            return list(entry["items"])
+        items = extractor(path)
+        self.entries[cache_key] = {"stamp": stamp, "items": items}
+        self.dirty = True
+        return list(items)
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        try:
+            os.makedirs(self.path.parent, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": DECISION_CACHE_VERSION, "files": self.entries}, f)
+            os.replace(tmp, self.path)
+            self.dirty = False
+        except OSError as e:
+            print(f"pending decisions cache not saved ({e})", file=sys.stderr)
+
+
+def pending_decisions_snippet(project: str, limit: int = 20, cache: DecisionCache | None = None) -> list[str]:
+    own_cache = cache is None
+    if own_cache:
+        cache = DecisionCache(REPO_ROOT)
     memory = REPO_ROOT / "Memory" / project
     pending: list[str] = []
 
-    validation = memory / "Validation.md"
     pending.extend(
-        _open_decisions_from_file(validation, "Validation", "## open hypotheses")
+        cache.extract(
+            memory / "Validation.md",
+            "open:Validation",
+            lambda p: _open_decisions_from_file(p, "Validation", "## open hypotheses"),
+        )
     )
 
-    for area in ("Org.md", "Product.md"):
-        pending.extend(_open_decisions_from_file(memory / area, area.replace(".md", "")))
+    for area in ("Org", "Product"):
+        pending.extend(
+            cache.extract(memory / f"{area}.md", f"open:{area}", lambda p, a=area: _open_decisions_from_file(p, a))
+        )
 
     partners_dir = memory / "Partners"
     if partners_dir.is_dir():
@@ -295,79 +302,217 @@ def pending_decisions_snippet(project: str, limit: int = 20) -> list[str]:
             if partner_file.name.lower() in ("index.md", "readme.md"):
                 continue
             label = f"Partners/{partner_file.stem}"
-            pending.extend(_open_decisions_from_file(partner_file, label))
-
-    legacy = memory / "_legacy" / "decisions.md"
-    if legacy.is_file():
-        try:
-            lines = legacy.read_text(encoding="utf-8", errors="replace").splitlines()
-        except OSError:
-            lines = []
-        for ln in lines:
-            if "pending decision" in ln.lower():
-                pending.append(f"[legacy decisions] {ln.strip().lstrip('-').strip()}")
+            pending.extend(
+                cache.extract(partner_file, f"open:{label}", lambda p, lb=label: _open_decisions_from_file(p, lb))
+            )
 
-    pending.extend(_pending_from_decisions_log(memory / "Decisions" / "decisions.md"))
+    pending.extend(cache.extract(memory / "_legacy" / "decisions.md", "legacy", _pending_from_legacy_log))
+    pending.extend(cache.extract(memory / "Decisions" / "decisions.md", "log", _pending_from_decisions_log))
 
+    if own_cache:
+        cache.save()
     return pending[-limit:]
 
 
+def memory_projects() -> list[str]:
+    """Project folders under Memory/."""
+    memory = REPO_ROOT / "Memory"
+    if not memory.is_dir():
+        return []
+    return sorted(p.name for p in memory.iterdir() if p.is_dir() and not p.name.startswith((".", "_")))
+
+
+def pending_decisions_all(limit: int = 20) -> dict[str, list[str]]:
+    """pending_decisions_snippet for every Memory/ project, sharing one cache."""
+    cache = DecisionCache(REPO_ROOT)
+    result = {project: pending_decisions_snippet(project, limit, cache) for project in memory_projects()}
+    cache.save()
+    return result
+
+
+def print_pending_only(project: str | None, as_json: bool) -> None:
+    with profiling.phase("pending decisions"):
+        if project:
+            report = {project: pending_decisions_snippet(project)}
+        else:
+            report = pending_decisions_all()
+    if as_json:
+        if project:
+            print(json.dumps({"project": project, "pending_decisions": report[project]}, indent=2))
+        else:
+            print(json.dumps({"projects": report}, indent=2))
+        return
+    lines = [f"# Pending decisions — {project or 'all projects'}", ""]
+    for name, pending in report.items():
+        if not project:
+            lines.extend([f"## {name} ({len(pending)})", ""])
+        if pending:
+            lines.extend(f"- {p}" for p in pending)
+        else:
+            lines.append("(none)")
+        lines.append("")
+    print("\n".join(lines).rstrip())
+
+
 def iter_recent_meetings(
-    project: str, since: str | None, until: str | None, limit: int = 25
+    project: str,
+    since: str | None,
+    until: str | None,
+    limit: int = 25,
+    index: VaultIndex | None = None,
 ) -> list[dict]:
     """Recent meeting notes for triage recap context (not in queue)."""
-    meetings_dir = REPO_ROOT / "Meetings" / project
-    if not meetings_dir.is_dir():
-        return []
+    index = _open_index(index)
+    index.refresh(("Meetings",))
     items: list[dict] = []
-    for fpath in meetings_dir.glob("*.md"):
-        try:
-            content = fpath.read_text(encoding="utf-8", errors="replace")[:8192]
-        except OSError:
-            continue
-        fm = parse_frontmatter(content)
-        capture_date = file_capture_date(fpath, fm)
-        if not in_date_range(capture_date, since, until):
-            continue
-        rel = str(fpath.relative_to(REPO_ROOT))
+    for row in index.files("dir = ?", (f"Meetings/{project}",), since=since, until=until):
+        capture_date = row["capture_date"]
         items.append(
             {
-                "path": rel,
+                "path": row["path"],
                 "date": capture_date or "(undated)",
-                "title": fm.get("title", fpath.stem),
+                "title": row["frontmatter"].get("title", Path(row["path"]).stem),
             }
         )
     items.sort(key=lambda x: (x["date"] == "(undated)", x["date"]), reverse=True)
     return items[:limit]
 
 
-def build_queue(project: str, since: str | None, until: str | None) -> list[dict]:
+def build_queue(
+    project: str, since: str | None, until: str | None, index: VaultIndex | None = None
+) -> list[dict]:
     queue = []
-    for relpath, fm, capture_date, kind in iter_capture_files(project):
-        if is_triaged(fm):
-            continue
-        if not in_date_range(capture_date, since, until):
-            continue
-        queue.append(
-            {
-                "path": relpath,
-                "kind": kind,
-                "date": capture_date or "(undated)",
-                "status": fm.get("status", ""),
-                "title": fm.get("title", Path(relpath).stem),
-            }
-        )
-    queue.sort(key=lambda x: (x["date"] == "(undated)", x["date"], x["path"]), reverse=True)
+    for relpath, fm, capture_date, kind in iter_capture_files(project, index, since, until):
+        item = _queue_item(relpath, fm, capture_date, kind)
+        if item:
+            queue.append(item)
+    _sort_queue(queue)
     return queue
 
 
+def _queue_item(relpath, fm, capture_date, kind) -> dict | None:
+    if is_triaged(fm):
+        return None
+    return {
+        "path": relpath,
+        "kind": kind,
+        "date": capture_date or "(undated)",
+        "status": fm.get("status", ""),
+        "title": fm.get("title", Path(relpath).stem),
+    }
+
+
+def _queue_owner(row: dict) -> str:
+    """Project whose queue a capture row belongs to, or '' when it belongs to none."""
+    owner = row["project"] or (row["folder"] if row["root"] == "Ideas" else "")
+    # --project lower-cases its target, so a mixed-case Ideas folder never matches one.
+    if not owner or owner != owner.lower() or not _is_capture_file(row):
+        return ""
+    return owner
+
+
+def _sort_queue(queue: list[dict]) -> None:
+    queue.sort(key=lambda x: (x["date"] == "(undated)", x["date"], x["path"]), reverse=True)
+
+
+def build_all_queues(
+    since: str | None, until: str | None, index: VaultIndex | None = None
+) -> dict[str, list[dict]]:
+    """Queue per project from the indexed Ideas/ and Clippings/ rows.
+
+    Every project with capture files gets a queue, empty when nothing falls in the period; only
+    rows inside the period have their frontmatter decoded.
+    """
+    index = _open_index(index)
+    index.refresh(CAPTURE_ROOTS)
+    queues: dict[str, list[dict]] = {}
+    windowed = bool(since or until)
+    for row in index.files("root IN (?, ?)", CAPTURE_ROOTS, with_frontmatter=not windowed):
+        owner = _queue_owner(row)
+        if owner:
+            queue = queues.setdefault(owner, [])
+            item = None if windowed else _queue_item(row["path"], row["frontmatter"], row["capture_date"], row["root"])
+            if item:
+                queue.append(item)
+    if windowed:
+        for row in index.files("root IN (?, ?)", CAPTURE_ROOTS, since=since, until=until):
+            owner = _queue_owner(row)
+            item = _queue_item(row["path"], row["frontmatter"], row["capture_date"], row["root"]) if owner else None
+            if item:
+                queues[owner].append(item)
+    for queue in queues.values():
+        _sort_queue(queue)
+    return dict(sorted(queues.items()))
+
+
+def _queue_lines(queue: list[dict]) -> list[str]:
+    lines: list[str] = []
+    by_kind: dict[str, list] = {}
+    for item in queue:
+        by_kind.setdefault(item["kind"], []).append(item)
+    for kind in sorted(by_kind.keys()):
+        lines.append(f"### {kind}")
+        for item in by_kind[kind]:
+            lines.append(f"- {item['date']} | [{item['title']}]({item['path']})")
+        lines.append("")
+    return lines
+
+
+def print_all_projects(
+    since: str | None, until: str | None, as_json: bool, workers: int | None = None, use_daemon: bool = True
+) -> None:
+    with profiling.phase("daemon query"):
+        queues = lexicon_watch.query("all_queues", since=since, until=until) if use_daemon else None
+    if queues is None:
+        with profiling.phase("queues"), VaultIndex(REPO_ROOT, workers=workers) as index:
+            queues = build_all_queues(since, until, index)
+    if as_json:
+        print(
+            json.dumps(
+                {
+                    "since": since,
+                    "until": until,
+                    "projects": {
+                        project: {"queue_count": len(queue), "queue": queue}
+                        for project, queue in queues.items()
+                    },
+                },
+                indent=2,
+            )
+        )
+        return
+    lines = [
+        "# Triage queues — all projects",
+        "",
+        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+        f"Period filter: {since or '…'} → {until or '…'}" if since or until else "Period filter: none",
+        "",
+    ]
+    for project, queue in queues.items():
+        lines.extend([f"## {project} — untriaged: **{len(queue)}**", ""])
+        lines.extend(_queue_lines(queue) if queue else ["(empty)", ""])
+    print("\n".join(lines))
+
+
 def main():
     parser = argparse.ArgumentParser(description="Lexicon triage queue for a project")
-    parser.add_argument("--project", required=True, help="Project slug (e.g. personal, acme)")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--project", help="Project slug (e.g. personal, acme)")
+    target.add_argument("--all-projects", action="store_true", help="Every project's queue from one scan")
     parser.add_argument("--since", help="Include capture on/after YYYY-MM-DD")
     parser.add_argument("--until", help="Include capture on/before YYYY-MM-DD")
     parser.add_argument("--json", action="store_true", help="JSON output")
+    add_workers_argument(parser)
+    parser.add_argument("--no-daemon", action="store_true", help="Scan even if lexicon_watch.py is running")
+    parser.add_argument(
+        "--recaps", type=int, default=1, metavar="N", help="Show the last N triage recaps (default 1)"
+    )
+    parser.add_argument(
+        "--pending-only", action="store_true", help="Only pending decisions (per project, or all with --all-projects)"
+    )
+    profiling.add_profile_argument(parser)
     args = parser.parse_args()
+    profiling.start("triage_queue", args.profile)
 
     os.chdir(REPO_ROOT)
 
@@ -379,10 +524,31 @@ def main():
     since = normalize_date(args.since) if args.since else None
     until = normalize_date(args.until) if args.until else None
 
-    queue = build_queue(args.project, since, until)
-    recent_meetings = iter_recent_meetings(args.project, since, until)
-    recap_path, last_section = load_last_recap(args.project)
-    pending = pending_decisions_snippet(args.project)
+    if args.pending_only:
+        print_pending_only(None if args.all_projects else args.project, args.json)
+        return
+
+    if args.all_projects:
+        print_all_projects(since, until, args.json, args.workers, not args.no_daemon)
+        return
+
+    hot = None
+    if not args.no_daemon:
+        with profiling.phase("daemon query"):
+            hot = lexicon_watch.query("triage", project=args.project, since=since, until=until)
+    if hot is not None:
+        queue, recent_meetings, pending = hot["queue"], hot["recent_meetings"], hot["pending_decisions"]
+    else:
+        with VaultIndex(REPO_ROOT, workers=args.workers) as index:
+            with profiling.phase("queue"):
+                queue = build_queue(args.project, since, until, index)
+            with profiling.phase("recent meetings"):
+                recent_meetings = iter_recent_meetings(args.project, since, until, index=index)
+        with profiling.phase("pending decisions"):
+            pending = pending_decisions_snippet(args.project)
+    with profiling.phase("recaps"):
+        recaps = load_recaps(args.project, max(1, args.recaps))
+    recap_path, last_section = recaps[-1] if recaps else ("", "")
 
     if args.json:
         print(
@@ -396,6 +562,11 @@ def main():
                     "recent_meetings": recent_meetings,
                     "last_recap_file": recap_path,
                     "last_recap_section": last_section,
+                    **(
+                        {"recaps": [{"file": f, "section": sec} for f, sec in recaps]}
+                        if args.recaps > 1
+                        else {}
+                    ),
                     "pending_decisions": pending,
                 },
                 indent=2,
@@ -419,15 +590,11 @@ def main():
     )
 
     if recap_path and last_section:
-        lines.extend(
-            [
-                "## Previous triage (remind user)",
-                f"From: `{recap_path}`",
-                "",
-                last_section,
-                "",
-            ]
-        )
+        lines.append("## Previous triage (remind user)")
+        for path, section in recaps:
+            if len(recaps) > 1:
+                lines.append(f"### {recap_date(path, section)}")
+            lines.extend([f"From: `{path}`", "", section, ""])
     else:
         lines.extend(["## Previous triage", "(none yet — first triage for this project)", ""])
 
@@ -447,14 +614,7 @@ def main():
     if not queue:
         lines.append("(empty — nothing to triage for this filter)")
     else:
-        by_kind: dict[str, list] = {}
-        for item in queue:
-            by_kind.setdefault(item["kind"], []).append(item)
-        for kind in sorted(by_kind.keys()):
-            lines.append(f"### {kind}")
-            for item in by_kind[kind]:
-                lines.append(f"- {item['date']} | [{item['title']}]({item['path']})")
-            lines.append("")
+        lines.extend(_queue_lines(queue))
 
     print("\n".join(lines))
 
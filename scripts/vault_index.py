@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""
+Persistent frontmatter index of the vault, shared by triage_queue and hidock_pending.
+
+Stored in .tmp/vault_index.sqlite3. Each Markdown file under an indexed root is keyed by
+path + mtime + size; refresh re-parses only new or changed files and drops deleted ones,
+so repeated triage / pending checks cost one stat per file instead of one read + parse.
+
+Meeting notes also feed a reverse map (HiDock signature / stem / short id → referring
+meeting notes), rewritten per note only when that note changes.
+
+Cold scans can fan parsing out to a process pool with --workers N (0 = one per CPU); results
+are merged in walk order, so the index contents do not depend on the worker count.
+
+Usage:
+  python scripts/vault_index.py refresh [ROOT ...] [--workers N]
+  python scripts/vault_index.py stats
+  python scripts/vault_index.py rebuild
+
+Safe to delete .tmp/vault_index.sqlite3 at any time; it is rebuilt on the next run.
+"""
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import json
+import os
+import re
+import sqlite3
+import sys
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from pathlib import Path
+
+from lexicon_core import profiling
+from lexicon_core.frontmatter import parse_frontmatter, read_frontmatter_block  # noqa: F401 (re-exported)
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, ".."))
+
+INDEX_FILENAME = os.path.join(".tmp", "vault_index.sqlite3")
+SCHEMA_VERSION = 2
+
+DEFAULT_ROOTS = ("Ideas", "Clippings", "Meetings", "Transcripts/HiDock")
+# Roots whose full body is read on change (HiDock links live outside the frontmatter).
+FULL_TEXT_ROOTS = ("Meetings",)
+
+FILENAME_DATE_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})")
+HIDOCK_PATH_RE = re.compile(r"Transcripts/HiDock/([^\]\s\)\|\"']+)", re.IGNORECASE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    root TEXT NOT NULL,
+    dir TEXT NOT NULL,
+    folder TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    frontmatter TEXT NOT NULL,
+    capture_date TEXT NOT NULL,
+    project TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_root ON files(root);
+CREATE INDEX IF NOT EXISTS files_dir ON files(dir);
+CREATE INDEX IF NOT EXISTS files_capture_date ON files(capture_date);
+CREATE TABLE IF NOT EXISTS hidock_refs (
+    key TEXT NOT NULL,
+    path TEXT NOT NULL,
+    PRIMARY KEY (key, path)
+);
+CREATE INDEX IF NOT EXISTS hidock_refs_path ON hidock_refs(path);
+"""
+
+
+def normalize_date(val) -> str:
+    if not val:
+        return ""
+    val = str(val).strip()
+    for fmt in ("%Y-%m-%d", "%Y/%m/%d", "%Y-%m-%d %H:%M:%S"):
+        try:
+            return datetime.strptime(val, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return ""
+
+
+def file_capture_date(fpath, fm: dict) -> str:
+    for key in ("date", "created", "published"):
+        d = normalize_date(fm.get(key))
+        if d:
+            return d
+    m = FILENAME_DATE_RE.match(Path(fpath).name)
+    if m:
+        return m.group(1)
+    return ""
+
+
+def date_range_where(since: str | None, until: str | None, column: str = "capture_date") -> tuple[str, list]:
+    """SQL condition for an inclusive date window; undated rows pass only when there is no lower bound."""
+    where, params = [], []
+    if since:
+        where.append(f"{column} != '' AND {column} >= ?")
+        params.append(since)
+    if until:
+        where.append(f"({column} = '' OR {column} <= ?)")
+        params.append(until)
+    return " AND ".join(where), params
+
+
+def frontmatter_project(fm: dict) -> str:
+    """Lower-cased `project:` value (first item when it is a list), or ''."""
+    proj = fm.get("project")
+    if isinstance(proj, list):
+        proj = proj[0] if proj else ""
+    return str(proj).strip().lower() if proj else ""
+
+
+def hidock_refs(fm: dict, text: str) -> list[str]:
+    """Lower-cased keys a meeting note uses to reference HiDock transcripts."""
+    keys: set[str] = set()
+    sig = fm.get("hidock_signature")
+    for val in sig if isinstance(sig, list) else [sig]:
+        if val and str(val).strip():
+            keys.add(str(val).strip().lower())
+
+    for match in HIDOCK_PATH_RE.finditer(text):
+        ref = match.group(1).strip().rstrip("/")
+        keys.add(ref.lower())
+        if ref.endswith(".md"):
+            ref = ref[:-3]
+        keys.add(ref.lower())
+        if "_" in ref:
+            keys.add(ref.rsplit("_", 1)[-1].lower())
+    return sorted(keys)
+
+
+def _read_text(path: str, full: bool) -> str:
+    if not full:
+        text = read_frontmatter_block(path)
+    else:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            text = f.read()
+    profiling.count("chars read", len(text))
+    return text
+
+
+def _rel_parts(rel: str) -> tuple[str, str]:
+    """Return (dir, folder) for a repo-relative posix path."""
+    parts = rel.split("/")
+    folder = parts[1] if len(parts) > 2 else ""
+    return "/".join(parts[:-1]), folder
+
+
+def walk_markdown(root: str, root_rel: str):
+    """Yield (relpath, abspath, mtime_ns, size) for every *.md under root/root_rel (one scandir pass)."""
+    prefix = len(root) + 1
+    stack = [os.path.join(root, *root_rel.split("/"))]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    if not entry.name.endswith(".md") or not entry.is_file():
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+                rel = entry.path[prefix:].replace(os.sep, "/")
+                yield rel, entry.path, st.st_mtime_ns, st.st_size
+
+
+# Below this many changed files a pool costs more to start than it saves.
+PARALLEL_MIN_FILES = 256
+PARALLEL_CHUNK = 64
+
+
+def resolve_workers(workers: int | None) -> int:
+    """--workers value → pool size (0 = one per CPU, None/1 = serial)."""
+    if workers is None:
+        return 1
+    if workers <= 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+def _parse_file(root_rel: str, rel: str, path: str) -> tuple[tuple, list[str]] | None:
+    """Return (files row without stat columns, hidock refs) or None if unreadable."""
+    full = root_rel in FULL_TEXT_ROOTS
+    try:
+        text = _read_text(path, full=full)
+    except OSError:
+        return None
+    fm = parse_frontmatter(text)
+    refs = hidock_refs(fm, text) if full else []
+    dir_rel, folder = _rel_parts(rel)
+    row = (
+        rel,
+        root_rel,
+        dir_rel,
+        folder,
+        json.dumps(fm),
+        file_capture_date(rel, fm),
+        frontmatter_project(fm),
+    )
+    return row, refs
+
+
+def _parse_chunk(root_rel: str, items: list[tuple[str, str]]) -> list:
+    return [_parse_file(root_rel, rel, path) for rel, path in items]
+
+
+class VaultIndex:
+    """SQLite-backed cache of parsed frontmatter for Markdown files under the vault."""
+
+    def __init__(self, root=None, db_path: str | None = None, workers: int | None = None):
+        self.root = os.path.abspath(str(root or REPO_ROOT))
+        self.db_path = db_path or os.path.join(self.root, INDEX_FILENAME)
+        self.workers = resolve_workers(workers)
+        self.conn = self._connect()
+        self._refreshed: set[str] = set()
+
+    def _connect(self) -> sqlite3.Connection:
+        try:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+        except (OSError, sqlite3.Error) as e:
+            print(f"vault index unavailable ({e}); using in-memory index", file=sys.stderr)
+            conn = sqlite3.connect(":memory:")
+            version = 0
+        if version != SCHEMA_VERSION:
+            conn.executescript("DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS hidock_refs;")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.executescript(SCHEMA)
+        return conn
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "VaultIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _walk(self, root_rel: str):
+        return walk_markdown(self.root, root_rel)
+
+    def _parse_many(self, root_rel: str, items: list[tuple[str, str]]) -> list:
+        """_parse_file for each (rel, path), in input order; pooled when workers > 1."""
+        if self.workers <= 1 or len(items) < PARALLEL_MIN_FILES:
+            return _parse_chunk(root_rel, items)
+        chunks = [items[i : i + PARALLEL_CHUNK] for i in range(0, len(items), PARALLEL_CHUNK)]
+        results = []
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=self.workers) as pool:
+                for parsed in pool.map(_parse_chunk, [root_rel] * len(chunks), chunks):
+                    results.extend(parsed)
+            return results
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            # No process support (e.g. sandboxed /dev/shm) or a worker died: parsing has no side
+            # effects, so start over on threads, which still overlap the reads.
+            pass
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return [row for parsed in pool.map(_parse_chunk, [root_rel] * len(chunks), chunks) for row in parsed]
+
+    def refresh(self, roots=DEFAULT_ROOTS, force: bool = False) -> dict:
+        """Re-parse new/changed files under roots and drop deleted ones. Returns counts.
+
+        Each root is walked at most once per VaultIndex instance unless force=True.
+        """
+        stats = {"scanned": 0, "updated": 0, "removed": 0}
+        for root_rel in roots:
+            if root_rel in self._refreshed and not force:
+                continue
+            self._refreshed.add(root_rel)
+            known = {
+                path: (mtime_ns, size)
+                for path, mtime_ns, size in self.conn.execute(
+                    "SELECT path, mtime_ns, size FROM files WHERE root = ?", (root_rel,)
+                )
+            }
+            upserts = []
+            refs = []
+            seen = set()
+            changed = []
+            with profiling.phase("index walk"):
+                for rel, path, mtime_ns, size in self._walk(root_rel):
+                    seen.add(rel)
+                    if known.get(rel) != (mtime_ns, size):
+                        changed.append((rel, path, mtime_ns, size))
+            with profiling.phase("index parse"):
+                parsed_rows = self._parse_many(root_rel, [(rel, path) for rel, path, _m, _s in changed])
+            for (rel, _path, mtime_ns, size), parsed in zip(changed, parsed_rows):
+                if parsed is not None:
+                    row, row_refs = parsed
+                    upserts.append(row[:4] + (mtime_ns, size) + row[4:])
+                    refs.extend((key, rel) for key in row_refs)
+            removed = [(p,) for p in known if p not in seen]
+            with profiling.phase("index write"), self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO files (path, root, dir, folder, mtime_ns, size, "
+                    "frontmatter, capture_date, project) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    upserts,
+                )
+                stale = [(row[0],) for row in upserts] + removed
+                self.conn.executemany("DELETE FROM hidock_refs WHERE path = ?", stale)
+                self.conn.executemany("INSERT OR IGNORE INTO hidock_refs (key, path) VALUES (?, ?)", refs)
+                self.conn.executemany("DELETE FROM files WHERE path = ?", removed)
+            profiling.count("files scanned", len(seen))
+            profiling.count("files parsed", len(changed))
+            stats["scanned"] += len(seen)
+            stats["updated"] += len(upserts)
+            stats["removed"] += len(removed)
+        return stats
+
+    def files(
+        self,
+        where: str = "",
+        params: tuple = (),
+        since: str | None = None,
+        until: str | None = None,
+        with_frontmatter: bool = True,
+    ) -> list[dict]:
+        """Indexed rows as dicts (frontmatter decoded), ordered by path.
+
+        since/until filter on capture_date in SQL (date_range_where), so rows outside the window
+        are never decoded; with_frontmatter=False skips decoding altogether (frontmatter is {}).
+        """
+        fm_column = "frontmatter" if with_frontmatter else "'{}'"
+        sql = f"SELECT path, root, dir, folder, {fm_column}, capture_date, project FROM files"
+        date_where, date_params = date_range_where(since, until)
+        conditions = [f"({c})" for c in (where, date_where) if c]
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+            params = (*params, *date_params)
+        sql += " ORDER BY path"
+        rows = []
+        for path, root, dir_rel, folder, fm, capture_date, project in self.conn.execute(sql, params):
+            rows.append(
+                {
+                    "path": path,
+                    "root": root,
+                    "dir": dir_rel,
+                    "folder": folder,
+                    "frontmatter": json.loads(fm),
+                    "capture_date": capture_date,
+                    "project": project,
+                }
+            )
+        return rows
+
+    def hidock_ref_keys(self) -> set[str]:
+        """Every HiDock key referenced by an indexed meeting note."""
+        return {key for (key,) in self.conn.execute("SELECT DISTINCT key FROM hidock_refs")}
+
+    def hidock_referrers(self, keys) -> list[str]:
+        """Meeting notes referencing any of the given (lower-cased) HiDock keys."""
+        keys = sorted({k for k in keys if k})
+        if not keys:
+            return []
+        marks = ", ".join("?" for _ in keys)
+        return [
+            path
+            for (path,) in self.conn.execute(
+                f"SELECT DISTINCT path FROM hidock_refs WHERE key IN ({marks}) ORDER BY path", keys
+            )
+        ]
+
+    def counts(self) -> dict[str, int]:
+        return dict(self.conn.execute("SELECT root, COUNT(*) FROM files GROUP BY root ORDER BY root"))
+
+
+def add_workers_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Parse changed files in N processes (0 = one per CPU; default: serial)",
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Maintain the Lexicon vault frontmatter index")
+    sub = parser.add_subparsers(dest="command", required=True)
+    refresh_p = sub.add_parser("refresh", help="Re-parse new/changed files")
+    refresh_p.add_argument("roots", nargs="*", help=f"Roots to refresh (default: {', '.join(DEFAULT_ROOTS)})")
+    add_workers_argument(refresh_p)
+    sub.add_parser("stats", help="Print indexed file counts per root")
+    rebuild_p = sub.add_parser("rebuild", help="Drop the index and re-parse everything")
+    add_workers_argument(rebuild_p)
+    args = parser.parse_args()
+
+    if args.command == "rebuild":
+        db_path = os.path.join(REPO_ROOT, INDEX_FILENAME)
+        if os.path.exists(db_path):
+            os.remove(db_path)
+
+    with VaultIndex(workers=getattr(args, "workers", None)) as index:
+        if args.command in ("refresh", "rebuild"):
+            roots = tuple(getattr(args, "roots", None) or DEFAULT_ROOTS)
+            stats = index.refresh(roots)
+            print(
+                f"Scanned {stats['scanned']} files: {stats['updated']} re-parsed, "
+                f"{stats['removed']} removed."
+            )
+        for root, count in index.counts().items():
+            print(f"  {root}: {count}")
+
+
+if __name__ == "__main__":
+    main()
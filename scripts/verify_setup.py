@@ -3,17 +3,20 @@
 Check Lexicon installation and optional source connectors.
 
 Usage:
-  python scripts/verify_setup.py
+  python scripts/verify_setup.py [--profile]
 
 Exit 0 if required checks pass; 1 if any required check fails.
 HiDock and Fireflies are optional — reported as warnings when not configured.
 """
 from __future__ import annotations
 
+import argparse
 import os
 import re
 import sys
 
+from lexicon_core import profiling
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 REPO_ROOT = os.path.join(SCRIPT_DIR, "..")
 ENV_PATH = os.path.join(REPO_ROOT, ".env")
@@ -204,12 +207,21 @@ def check_hidock() -> None:
 
 
 def main() -> None:
-    _load_env()
+    parser = argparse.ArgumentParser(description="Check Lexicon installation and optional source connectors")
+    profiling.add_profile_argument(parser)
+    args = parser.parse_args()
+    profiling.start("verify_setup", args.profile)
+
+    with profiling.phase("load env"):
+        _load_env()
     print(f"Repo: {REPO_ROOT}\n")
 
-    core_ok = check_core()
-    check_fireflies()
-    check_hidock()
+    with profiling.phase("core"):
+        core_ok = check_core()
+    with profiling.phase("fireflies"):
+        check_fireflies()
+    with profiling.phase("hidock"):
+        check_hidock()
 
     print()
     if core_ok:
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The scripts import each other as top-level modules (scripts/ is their sys.path[0]).
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
@@ -0,0 +1,17 @@
+import os
+import stat
+
+from lexicon_core.archive import archive_file, restore_file
+
+
+def test_archive_keeps_the_transcript_mode(tmp_path):
+    path = tmp_path / "2026-05-01_call.md"
+    path.write_text("---\ntitle: Call\n---\n\n# Raw Transcript\n\nAlex: private\n", encoding="utf-8")
+    os.chmod(path, 0o640)
+
+    archive_file(str(path))
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+    assert stat.S_IMODE(os.stat(str(path) + ".gz").st_mode) == 0o640
+
+    restore_file(str(path))
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
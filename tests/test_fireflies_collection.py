@@ -0,0 +1,73 @@
+import pytest
+
+import fireflies_collection as ff
+
+LISTING = [
+    {"id": f"t{i}", "title": f"Meeting {i}", "date": 1777626000000 + i * 3_600_000, "duration": 30}
+    for i in range(3)
+]
+
+
+def body(entry):
+    return dict(entry, transcript_url=f"https://ff/{entry['id']}", sentences=[{"speaker_name": "Alex", "text": "hi"}])
+
+
+@pytest.fixture
+def account(tmp_path, monkeypatch):
+    monkeypatch.setattr(ff, "REPO_ROOT", str(tmp_path))
+    bodies = {entry["id"]: body(entry) for entry in LISTING}
+    requests = []
+
+    def fake_post_query(query, config, variables=None):
+        requests.append(variables)
+        if "id" in variables:
+            return {"transcript": bodies[variables["id"]]}, None, 100
+        return {f"t{i}": bodies[variables[f"id{i}"]] for i in range(len(variables))}, None, 100
+
+    monkeypatch.setattr(ff, "post_query", fake_post_query)
+    config = {"name": "t", "email": "me@x.com", "output_dir": str(tmp_path / "out"), "project": ""}
+    return ff.attach_cache(config), requests
+
+
+@pytest.mark.parametrize("batch_size", [1, 10])
+def test_force_rerun_with_unchanged_listing_downloads_nothing(account, batch_size):
+    config, requests = account
+    config["batch_size"] = batch_size
+    first = ff.sync_transcripts(LISTING, config)
+    assert len(first["saved"]) == 3 and requests
+
+    requests.clear()
+    again = ff.sync_transcripts(LISTING, config, force=True)
+    assert len(again["saved"]) == 3
+    assert requests == []
+
+
+def test_refresh_redownloads_cached_bodies(account):
+    config, requests = account
+    config["batch_size"] = 1
+    ff.sync_transcripts(LISTING, config)
+    requests.clear()
+    config["refresh"] = True
+    ff.sync_transcripts(LISTING, config, force=True)
+    assert len(requests) == 3
+
+
+class FakeResponse:
+    status_code, reason, ok = 200, "OK", True
+    headers = {"content-type": "application/json"}
+    content = text = '{"data": {"transcript": '
+
+    def json(self):
+        raise ValueError("Expecting value: line 1 column 25 (char 24)")
+
+
+class FakeSession:
+    def post(self, *args, **kwargs):
+        return FakeResponse()
+
+
+def test_unreadable_json_is_an_api_error():
+    config = {"name": "t", "api_key": "k", "session": FakeSession()}
+    with pytest.raises(ff.APIError) as e:
+        ff.post_query(ff.TRANSCRIPT_QUERY, config, {"id": "t0"})
+    assert e.value.status == 200
@@ -0,0 +1,7 @@
+from lexicon_search import doc_project
+
+
+def test_doc_project_from_layer_folder_but_not_transcript_source():
+    assert doc_project("Meetings/Acme/2026-05-01_call.md", {}) == "acme"
+    assert doc_project("Transcripts/Fireflies/acme/2026-05-01_call.md", {}) == ""
+    assert doc_project("Transcripts/Manual/2026-05-01_call.md", {"project": "Acme"}) == "acme"
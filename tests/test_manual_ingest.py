@@ -0,0 +1,48 @@
+import os
+
+import manual_ingest
+from manual_ingest import parse_transcript
+
+
+def blocks(text, fmt="hinotes"):
+    return list(parse_transcript(text.splitlines(), fmt)[1])
+
+
+def test_hinotes_unknown_speaker_keeps_time_like_lines_in_paragraph():
+    text = "Unknown Speaker\n00:00:01\nWe meet at\n12:30:00\nok"
+    assert blocks(text) == [("Unknown Speaker", "00:00:01", "We meet at\n12:30:00\nok")]
+
+
+def test_hinotes_colon_line_above_time_is_not_a_speaker():
+    text = "Unknown Speaker\n00:00:01\nAgenda\n\nB:\n10:00:00\nstill the same paragraph"
+    assert blocks(text) == [("Unknown Speaker", "00:00:01", "Agenda\n\nB:\n10:00:00\nstill the same paragraph")]
+
+
+def test_hinotes_named_headers_at_start_and_after_blank_lines():
+    text = "Alex Kim\n00:00:01\nHello there\n\nSam Lee\n00:00:09\nHi Alex"
+    assert blocks(text) == [("Alex Kim", "00:00:01", "Hello there"), ("Sam Lee", "00:00:09", "Hi Alex")]
+
+
+def test_hinotes_detected_from_unknown_speaker():
+    fmt, _ = parse_transcript(["Unknown Speaker", "00:00:01", "hi"])
+    assert fmt == "hinotes"
+
+
+def test_batch_falls_back_to_threads_when_the_process_pool_breaks(tmp_path, monkeypatch):
+    parent, real = os.getpid(), manual_ingest.ingest_one
+
+    def dies_in_workers(job, dry_run=False):
+        if os.getpid() != parent:
+            os._exit(1)
+        return real(job, dry_run)
+
+    monkeypatch.setattr(manual_ingest, "ingest_one", dies_in_workers)
+    parts = []
+    for i in range(4):
+        src = tmp_path / f"call{i}.txt"
+        src.write_text(f"Alex: hello {i}\nSam: hi\n", encoding="utf-8")
+        parts.append([{"src": str(src), "out": str(tmp_path / f"out{i}.md"), "format": "auto"}])
+    results = list(manual_ingest._ingest_chunks(parts, 2, True))
+    assert [(r["src"], r["format"], r["blocks"], r["error"]) for [r] in results] == [
+        (part[0]["src"], "named", 2, None) for part in parts
+    ]
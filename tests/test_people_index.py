@@ -0,0 +1,33 @@
+from fireflies_collection import write_transcript as write_fireflies
+from manual_ingest import RAW_TRANSCRIPT_HEADING, parse_transcript, transcript_frontmatter
+from manual_ingest import write_transcript as write_manual
+from people_index import transcript_speakers
+
+
+def manual_file(tmp_path, text, fmt):
+    _fmt, blocks = parse_transcript(text.splitlines(), fmt)
+    path = tmp_path / "2026-05-01_call.md"
+    header = transcript_frontmatter("2026-05-01", "Call: weekly", "Alex Kim", "acme") + RAW_TRANSCRIPT_HEADING
+    write_manual(str(path), header, blocks)
+    return path.read_text(encoding="utf-8")
+
+
+def test_fireflies_speakers_skip_placeholders(tmp_path):
+    sentences = [
+        {"speaker_name": name, "text": f"line {i}"}
+        for i, name in enumerate(["Alex Kim", "Speaker 1", "Sam Lee", "Alex Kim", "Unknown Speaker", "Speaker 12"])
+    ]
+    m = {"id": "abc", "title": "Weekly", "date": 1777626000000, "transcript_url": "https://ff/1", "sentences": sentences}
+    path = tmp_path / "2026-05-01_Weekly_abc.md"
+    write_fireflies(str(path), m, {"project": "acme"})
+    assert transcript_speakers(path.read_text(encoding="utf-8")) == {"Alex Kim": 2, "Sam Lee": 1}
+
+
+def test_hinotes_speakers_skip_unknown_speaker(tmp_path):
+    text = "Unknown Speaker\n00:00:01\nHello\n\nAlex Kim\n00:00:05\nHi\n\nUnknown Speaker\n00:00:09\nBye"
+    assert transcript_speakers(manual_file(tmp_path, text, "hinotes")) == {"Alex Kim": 1}
+
+
+def test_manual_speakers_ignore_frontmatter_and_generic_labels(tmp_path):
+    text = "Alex Kim: Hello\nSpeaker 2: hi\nSam Lee: Morning\nGuest A: hey\nAlex Kim: Bye"
+    assert transcript_speakers(manual_file(tmp_path, text, "named")) == {"Alex Kim": 2, "Sam Lee": 1}
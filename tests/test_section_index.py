@@ -0,0 +1,14 @@
+import pytest
+
+from section_index import bound_date
+
+
+def test_bound_date_pads_partial_dates():
+    assert bound_date("2026-02", upper=False) == "2026-02-01"
+    assert bound_date("2026", upper=True) == "2026-12-31"
+
+
+@pytest.mark.parametrize("val", ["2026-13", "2026-00", "2026-02-30", "26"])
+def test_bound_date_rejects_impossible_dates(val):
+    with pytest.raises(ValueError):
+        bound_date(val, upper=False)